@@ -0,0 +1,65 @@
+"""Quantum analysis results cached for the Pro'VerBs Streamlit apps.
+
+Results are keyed by the normalized query at two levels: an LRU cache in
+each browser session, and an st.cache_data cache shared by every session
+of the process with bounded size and a TTL.
+"""
+
+from collections import OrderedDict
+
+import streamlit as st
+
+# Analysis results kept per browser session (LRU) and shared across sessions
+SESSION_ANALYSIS_CACHE_SIZE = 8
+SHARED_ANALYSIS_CACHE_SIZE = 128
+SHARED_ANALYSIS_CACHE_TTL = 3600
+
+
+def normalize_query(query):
+    """Collapse whitespace and case so trivially different queries share a cache entry."""
+    return " ".join(query.split()).casefold()
+
+
+@st.cache_data(
+    show_spinner=False,
+    max_entries=SHARED_ANALYSIS_CACHE_SIZE,
+    ttl=SHARED_ANALYSIS_CACHE_TTL,
+)
+def _shared_quantum_analysis(normalized_query, _result):
+    """Cross-session cache, keyed by the normalized query only (underscore args are not hashed).
+
+    Called with a finished result it stores that result unless one is
+    cached already; called with None it only looks up, and raises KeyError
+    on a miss, which st.cache_data does not cache.
+    """
+    if _result is None:
+        raise KeyError(normalized_query)
+    return _result
+
+
+def share_quantum_analysis(legal_query, result):
+    """Offer a finished analysis to every session; call from the script thread."""
+    _shared_quantum_analysis(normalize_query(legal_query), result)
+
+
+def shared_quantum_analysis(legal_query):
+    """The analysis another session already shared for a query, or None."""
+    try:
+        return _shared_quantum_analysis(normalize_query(legal_query), None)
+    except KeyError:
+        return None
+
+
+def remember_quantum_analysis(legal_query, result):
+    """Store a finished analysis in this session's LRU cache."""
+    key = normalize_query(legal_query)
+    cache = st.session_state.setdefault("analysis_cache", OrderedDict())
+    cache[key] = result
+    cache.move_to_end(key)
+    while len(cache) > SESSION_ANALYSIS_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def cached_quantum_analysis(legal_query):
+    """The session's cached analysis for a query, or None; never computes."""
+    return st.session_state.get("analysis_cache", {}).get(normalize_query(legal_query))
@@ -0,0 +1,259 @@
+"""Offline load test for the Proverbs Generator API (update-app.py).
+
+Runs the app in-process with a stub ModelWrapper whose cost is a synthetic
+per-token delay, drives /generate with closed-loop (fixed concurrency) or
+open-loop (Poisson arrivals) load, and prints a JSON report with latency
+percentiles, throughput, timeout rate and 429 rate for each load level.
+Like the production wrapper the stub only has ``generate``; --batched adds
+``generate_batch`` and ``generate_stream``, and the report's model_path
+says which of the two was measured.
+
+    python benchmark-app.py --mode closed --concurrency 1,8,32
+    python benchmark-app.py --mode open --rate 20,100 --duration 15
+    python benchmark-app.py --batched --concurrency 8
+
+Needs fastapi and httpx; no network access or model weights.
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import math
+import os
+import random
+import sys
+import time
+import types
+from typing import Dict, List, Optional
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "update-app.py")
+
+
+class GenerateOnlyStubModelWrapper:
+    """Stand-in for ModelWrapper that sleeps instead of running a model.
+
+    Like the production wrapper it only has ``generate``; a prompt costs
+    ``token_delay * max_new_tokens``.
+    """
+
+    token_delay = 0.002
+
+    def __init__(self, model_name: str = "stub"):
+        self.model_name = model_name
+        self._ready = True
+
+    def generate(self, prompt: str, max_new_tokens: Optional[int] = 50) -> str:
+        tokens = max_new_tokens or 50
+        time.sleep(self.token_delay * tokens)
+        return prompt + " token" * tokens
+
+    def load_real_model(self, new_model_name: Optional[str] = None):
+        self._ready = True
+
+    def unload_model(self):
+        self._ready = False
+
+    def status(self) -> Dict:
+        return {"model": self.model_name, "ready": self._ready, "stub": True}
+
+
+class StubModelWrapper(GenerateOnlyStubModelWrapper):
+    """Stub that also decodes batches and streams.
+
+    A batch of n prompts costs ``token_delay * max_new_tokens`` scaled by
+    ``1 + batch_overhead * (n - 1)``, roughly how batched decoding behaves.
+    """
+
+    batch_overhead = 0.1
+
+    def generate_batch(self, prompts: List[str], max_new_tokens: Optional[int] = 50) -> List[str]:
+        tokens = max_new_tokens or 50
+        time.sleep(self.token_delay * tokens * (1 + self.batch_overhead * (len(prompts) - 1)))
+        return [prompt + " token" * tokens for prompt in prompts]
+
+    def generate_stream(self, prompt: str, max_new_tokens: Optional[int] = 50):
+        for _ in range(max_new_tokens or 50):
+            time.sleep(self.token_delay)
+            yield " token"
+
+
+def load_app(module_name: str = "proverbs_api_benchmark", wrapper: type = GenerateOnlyStubModelWrapper):
+    """Import update-app.py with a stub wrapper in place of model.ModelWrapper."""
+    sys.modules["model"] = types.SimpleNamespace(ModelWrapper=wrapper)
+    spec = importlib.util.spec_from_file_location(module_name, APP_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def percentile(sorted_values: List[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.statuses: Dict[str, int] = {}
+
+    def record(self, status: str, latency: float):
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if status == "200":
+            self.latencies.append(latency)
+
+    def report(self, elapsed: float, **level) -> Dict:
+        total = sum(self.statuses.values())
+        latencies = sorted(self.latencies)
+
+        def ms(value):
+            return None if value is None else round(value * 1000, 3)
+
+        return {
+            **level,
+            "requests": total,
+            "completed": len(latencies),
+            "elapsed_seconds": round(elapsed, 3),
+            "throughput_rps": round(len(latencies) / elapsed, 3) if elapsed > 0 else 0.0,
+            "latency_ms": {
+                "p50": ms(percentile(latencies, 0.50)),
+                "p95": ms(percentile(latencies, 0.95)),
+                "p99": ms(percentile(latencies, 0.99)),
+                "mean": ms(sum(latencies) / len(latencies)) if latencies else None,
+                "max": ms(latencies[-1] if latencies else None),
+            },
+            "timeout_rate": round(self.statuses.get("504", 0) / total, 4) if total else 0.0,
+            "rejected_rate": round(self.statuses.get("429", 0) / total, 4) if total else 0.0,
+            "error_rate": round(
+                sum(count for status, count in self.statuses.items() if status not in ("200", "429", "504")) / total, 4
+            ) if total else 0.0,
+            "status_counts": dict(sorted(self.statuses.items())),
+        }
+
+
+async def _send(client, recorder: Recorder, payload: Dict, headers: Dict):
+    started = time.perf_counter()
+    try:
+        response = await client.post("/generate", json=payload, headers=headers)
+        status = str(response.status_code)
+    except Exception as e:
+        status = type(e).__name__
+    recorder.record(status, time.perf_counter() - started)
+
+
+async def closed_loop(client, concurrency: int, duration: float, payload: Dict, clients: int) -> Dict:
+    """``concurrency`` callers each send their next request as soon as the last returns."""
+    recorder = Recorder()
+    stop_at = time.perf_counter() + duration
+
+    async def caller(index: int):
+        headers = {"x-client-id": f"bench-{index % clients}"}
+        while time.perf_counter() < stop_at:
+            await _send(client, recorder, payload, headers)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(caller(i) for i in range(concurrency)))
+    return recorder.report(time.perf_counter() - started, mode="closed", concurrency=concurrency)
+
+
+async def open_loop(client, rate: float, duration: float, payload: Dict, clients: int, seed: int) -> Dict:
+    """Requests arrive as a Poisson process at ``rate`` per second regardless of completions."""
+    recorder = Recorder()
+    rng = random.Random(seed)
+    tasks = []
+    started = time.perf_counter()
+    next_at = started
+    sent = 0
+    while next_at < started + duration:
+        delay = next_at - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        headers = {"x-client-id": f"bench-{sent % clients}"}
+        tasks.append(asyncio.ensure_future(_send(client, recorder, payload, headers)))
+        sent += 1
+        next_at += rng.expovariate(rate)
+    await asyncio.gather(*tasks)
+    return recorder.report(time.perf_counter() - started, mode="open", rate=rate)
+
+
+async def run(args) -> Dict:
+    import httpx
+
+    api = load_app(wrapper=StubModelWrapper if args.batched else GenerateOnlyStubModelWrapper)
+    GenerateOnlyStubModelWrapper.token_delay = args.token_delay_ms / 1000.0
+    StubModelWrapper.batch_overhead = args.batch_overhead
+    payload = {"prompt": args.prompt, "max_new_tokens": args.max_new_tokens}
+    results = []
+    async with api.app.router.lifespan_context(api.app):
+        transport = httpx.ASGITransport(app=api.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+            if args.warmup > 0:
+                await closed_loop(client, 1, args.warmup, payload, 1)
+            if args.mode == "closed":
+                for concurrency in args.concurrency:
+                    results.append(await closed_loop(client, concurrency, args.duration, payload, args.clients))
+            else:
+                for rate in args.rate:
+                    results.append(await open_loop(client, rate, args.duration, payload, args.clients, args.seed))
+    return {
+        "config": {
+            "mode": args.mode,
+            "duration_seconds": args.duration,
+            "token_delay_ms": args.token_delay_ms,
+            "batch_overhead": args.batch_overhead,
+            # which model path the numbers measure: the production-like
+            # generate-only wrapper, or the batching/streaming stub
+            "model_path": "batched" if args.batched else "generate_only",
+            "max_new_tokens": args.max_new_tokens,
+            "clients": args.clients,
+            "env": {name: os.environ[name] for name in sorted(os.environ) if name.startswith(("GEN_", "MODEL_"))},
+        },
+        "results": results,
+    }
+
+
+def _numbers(kind):
+    return lambda text: [kind(part) for part in text.split(",") if part]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=("closed", "open"), default="closed")
+    parser.add_argument("--concurrency", type=_numbers(int), default=[1, 4, 16, 64],
+                        help="comma-separated closed-loop concurrency levels")
+    parser.add_argument("--rate", type=_numbers(float), default=[10.0, 50.0, 200.0],
+                        help="comma-separated open-loop arrival rates (requests/second)")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per load level")
+    parser.add_argument("--warmup", type=float, default=1.0, help="seconds of single-caller warm-up")
+    parser.add_argument("--token-delay-ms", type=float, default=2.0, help="synthetic cost per generated token")
+    parser.add_argument("--batch-overhead", type=float, default=0.1,
+                        help="extra cost per additional prompt in a batch, as a fraction")
+    parser.add_argument("--batched", action="store_true",
+                        help="stub generate_batch and generate_stream too, which the production ModelWrapper lacks")
+    # generate-only is the default; the flag is kept for existing scripts
+    parser.add_argument("--generate-only", dest="batched", action="store_false", help=argparse.SUPPRESS)
+    parser.add_argument("--max-new-tokens", type=int, default=50)
+    parser.add_argument("--prompt", default="A wise proverb about patience")
+    parser.add_argument("--clients", type=int, default=8, help="distinct x-client-id values to rotate through")
+    parser.add_argument("--timeout", type=float, help="sets MODEL_GEN_TIMEOUT for the app, in seconds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--log-level", default="warning", help="LOG_LEVEL for the app")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    os.environ["LOG_LEVEL"] = args.log_level
+    if args.timeout is not None:
+        os.environ["MODEL_GEN_TIMEOUT"] = repr(args.timeout)
+    report = json.dumps(asyncio.run(run(args)), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+"""Rotating logo shared by the Pro'VerBs Streamlit apps.
+
+Logos are minified or downscaled once per file version. The first logo is
+inlined as a data URI so the page shows it without another request; the
+others are served from a small in-process asset server under
+content-hashed URLs and fetched one at a time, just before they are shown.
+"""
+
+import base64
+import hashlib
+import mimetypes
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; raster logos are then sent as-is
+    Image = None
+
+LOGO_FOLDERS = ["assets", "static"]
+# Raster logos are stored at this multiple of the rendered width for HiDPI screens
+LOGO_PIXEL_RATIO = 2
+# "inline" embeds the first logo as a data URI and lazy-loads the rest from the
+# asset server; "static" serves every logo from it once LOGO_ASSET_BASE_URL is set
+LOGO_ASSET_MODE = os.getenv("LOGO_ASSET_MODE", "inline").strip().lower()
+# The asset server listens on loopback unless LOGO_ASSET_HOST says otherwise.
+# Port 0 lets the OS pick a free port, so several apps (and Streamlit's own
+# 8501, 8502, ...) never collide; pin it when a proxy forwards to the server
+LOGO_ASSET_HOST = os.getenv("LOGO_ASSET_HOST", "127.0.0.1")
+LOGO_ASSET_PORT = int(os.getenv("LOGO_ASSET_PORT", "0"))
+# Public origin of the asset server, e.g. a reverse-proxied https URL; defaults
+# to the server's own address, which only browsers on this machine can reach
+LOGO_ASSET_BASE_URL = os.getenv("LOGO_ASSET_BASE_URL", "").rstrip("/")
+LOGO_ASSET_MAX_AGE = 31536000
+
+
+def _directory_state() -> tuple:
+    """Modification times of the folders logos are discovered in.
+    Adding or removing a file changes its folder's mtime.
+    """
+    state = []
+    for folder in [".", *LOGO_FOLDERS]:
+        try:
+            state.append(os.stat(folder).st_mtime_ns)
+        except OSError:
+            state.append(None)
+    return tuple(state)
+
+
+def discover_logo_paths() -> List[str]:
+    """Find available logo image paths.
+    The folder scan runs once per process and again only when a folder changes.
+    """
+    return list(_discover_logo_paths_cached(_directory_state()))
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _discover_logo_paths_cached(directory_state: tuple) -> tuple:
+    """Find available logo image paths from common locations.
+    Includes project root SVGs and any images in assets/ and static/.
+    """
+    candidates = [
+        "proverb_logo.svg",
+        "iamlaw_logo.svg",
+        "proverb_eagle_logo.svg",
+        os.path.join("static", "proverb_eagle_logo.svg"),
+    ]
+    for folder in LOGO_FOLDERS:
+        if os.path.isdir(folder):
+            for name in os.listdir(folder):
+                if name.lower().endswith((".png", ".jpg", ".jpeg", ".svg")):
+                    candidates.append(os.path.join(folder, name))
+    # De-duplicate and keep only existing files
+    seen, result = set(), []
+    for p in candidates:
+        if p not in seen and os.path.exists(p):
+            seen.add(p)
+            result.append(p)
+    return tuple(result)
+
+
+def _guess_mime(path: str) -> str:
+    mime, _ = mimetypes.guess_type(path)
+    if not mime:
+        ext = os.path.splitext(path)[1].lower()
+        if ext == ".svg":
+            mime = "image/svg+xml"
+        elif ext in (".jpg", ".jpeg"):
+            mime = "image/jpeg"
+        elif ext == ".png":
+            mime = "image/png"
+        else:
+            mime = "application/octet-stream"
+    return mime
+
+
+def _minify_svg(svg: str) -> str:
+    """Drop comments, metadata and inter-tag whitespace from SVG markup."""
+    svg = re.sub(r"<!--.*?-->", "", svg, flags=re.S)
+    svg = re.sub(r"<metadata\b.*?</metadata>", "", svg, flags=re.S | re.I)
+    svg = re.sub(r">\s+<", "><", svg)
+    return re.sub(r"\s{2,}", " ", svg).strip()
+
+
+def _downscale_raster(data: bytes, mime: str, width_px: int) -> Tuple[bytes, str]:
+    """Shrink a raster image to LOGO_PIXEL_RATIO x width_px.
+    Returns the input unchanged when Pillow is unavailable or the image is already small.
+    """
+    if Image is None:
+        return data, mime
+    import io
+
+    target = width_px * LOGO_PIXEL_RATIO
+    with Image.open(io.BytesIO(data)) as img:
+        if max(img.size) <= target:
+            return data, mime
+        img.thumbnail((target, target))
+        out = io.BytesIO()
+        if mime == "image/jpeg":
+            img.convert("RGB").save(out, format="JPEG", quality=85, optimize=True)
+        else:
+            img.save(out, format="PNG", optimize=True)
+            mime = "image/png"
+    return out.getvalue(), mime
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _load_logo(path: str, mtime_ns: int, size: int, width_px: Optional[int]) -> Optional[Tuple[bytes, str]]:
+    """Read one version of a logo file, ready to be sent to the browser.
+    Cached per (path, mtime, size, width), so an edited file is reprocessed.
+    SVGs are minified, rasters downscaled.
+    """
+    try:
+        mime = _guess_mime(path)
+        with open(path, "rb") as f:
+            data = f.read()
+        if mime == "image/svg+xml":
+            return _minify_svg(data.decode("utf-8")).encode("utf-8"), mime
+        if width_px:
+            data, mime = _downscale_raster(data, mime, width_px)
+        return data, mime
+    except Exception:
+        return None
+
+
+def _read_logo(path: str, width_px: Optional[int]) -> Optional[Tuple[bytes, str]]:
+    try:
+        st_result = os.stat(path)
+    except OSError:
+        return None
+    return _load_logo(path, st_result.st_mtime_ns, st_result.st_size, width_px)
+
+
+def _to_data_uri(path: str, width_px: Optional[int] = None) -> Optional[str]:
+    """Convert an image file to a data URI string suitable for <img src>.
+    Returns None if the file cannot be read.
+    """
+    logo = _read_logo(path, width_px)
+    if logo is None:
+        return None
+    data, mime = logo
+    if mime == "image/svg+xml":
+        return f"data:{mime};charset=utf-8,{quote(data.decode('utf-8'), safe='=:/;,.-_()!*~@')}"
+    return f"data:{mime};base64,{base64.b64encode(data).decode()}"
+
+
+def _make_asset_handler(assets: Dict[str, Tuple[bytes, str, str]]):
+    class LogoAssetHandler(BaseHTTPRequestHandler):
+        """Serve /logos/<hash>.<ext> from memory.
+        Names change with content, so responses are cacheable forever;
+        the ETag lets clients that revalidate anyway get a 304.
+        """
+
+        def do_HEAD(self):
+            self._respond(send_body=False)
+
+        def do_GET(self):
+            self._respond(send_body=True)
+
+        def _respond(self, send_body: bool):
+            name = self.path.split("?", 1)[0].rsplit("/", 1)[-1]
+            asset = assets.get(name) if self.path.startswith("/logos/") else None
+            if asset is None:
+                self.send_error(404)
+                return
+            data, mime, etag = asset
+            if etag in (self.headers.get("If-None-Match") or ""):
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", f"public, max-age={LOGO_ASSET_MAX_AGE}, immutable")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", mime)
+            self.send_header("Content-Length", str(len(data)))
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", f"public, max-age={LOGO_ASSET_MAX_AGE}, immutable")
+            self.end_headers()
+            if send_body:
+                self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return LogoAssetHandler
+
+
+class _LogoAssets:
+    """Files on the asset server: the current content-hashed version of each logo.
+    Publishing a new version of a logo drops the file it replaces.
+    """
+
+    def __init__(self):
+        self.base_url = LOGO_ASSET_BASE_URL
+        self.files: Dict[str, Tuple[bytes, str, str]] = {}
+        self._names: Dict[Tuple[str, Optional[int]], str] = {}
+        self._lock = threading.Lock()
+
+    def publish(self, key: Tuple[str, Optional[int]], name: str, asset: Tuple[bytes, str, str]) -> None:
+        """Serve asset as name for key, dropping the file it replaces."""
+        with self._lock:
+            self.files[name] = asset
+            previous = self._names.get(key)
+            self._names[key] = name
+            if previous not in (None, name) and previous not in self._names.values():
+                self.files.pop(previous, None)
+
+
+def _logo_asset_store(host: str, port: int) -> Optional[_LogoAssets]:
+    """The process-wide logo assets, or None if the server cannot be started.
+    A failed bind is not cached, so the next render tries again.
+    """
+    try:
+        return _start_logo_asset_server(host, port)
+    except OSError:
+        return None
+
+
+@st.cache_resource(show_spinner=False)
+def _start_logo_asset_server(host: str, port: int) -> _LogoAssets:
+    """Start the logo asset server once per process and return its assets."""
+    assets = _LogoAssets()
+    server = ThreadingHTTPServer((host, port), _make_asset_handler(assets.files))
+    if not assets.base_url:
+        assets.base_url = f"http://{host}:{server.server_address[1]}"
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="logo-assets", daemon=True).start()
+    return assets
+
+
+def _to_static_url(path: str, width_px: Optional[int] = None) -> Optional[str]:
+    """Publish a logo on the asset server and return its content-hashed URL.
+    Returns None if the file cannot be read or the server is not running.
+    """
+    assets = _logo_asset_store(LOGO_ASSET_HOST, LOGO_ASSET_PORT)
+    logo = _read_logo(path, width_px)
+    if assets is None or logo is None:
+        return None
+    data, mime = logo
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    name = digest + (mimetypes.guess_extension(mime) or os.path.splitext(path)[1])
+    assets.publish((path, width_px), name, (data, mime, f'"{digest}"'))
+    return f"{assets.base_url}/logos/{name}"
+
+
+def _logo_sources(paths: List[str], width_px: int) -> List[str]:
+    """The first logo inline, the rest by URL; static mode with a public
+    LOGO_ASSET_BASE_URL serves the first one by URL too.
+    Every logo is inlined if the asset server is not running.
+    """
+    inline_first = LOGO_ASSET_MODE != "static" or not LOGO_ASSET_BASE_URL
+    urls = [_to_static_url(p, width_px) for p in paths[inline_first:]]
+    if any(url is None for url in urls):
+        return [u for u in (_to_data_uri(p, width_px) for p in paths) if u]
+    if inline_first:
+        first = _to_data_uri(paths[0], width_px)
+        if first is None:
+            return urls
+        urls.insert(0, first)
+    return urls
+
+
+def render_rotating_logo(interval_ms: int = 25000, width_px: int = 150) -> bool:
+    """Render a rotating logo block using a small JS snippet inside a component.
+    This avoids page reloads and works on Streamlit Cloud.
+    """
+    paths = discover_logo_paths()
+    sources = _logo_sources(paths, width_px) if paths else []
+    if not sources:
+        return False  # Signal to fallback to static
+
+    js_array = ",".join([f"'{u}'" for u in sources])
+    html = f"""
+    <div style="text-align:center; margin-bottom: 1rem;">
+      <img id="rotating-logo" src="{sources[0]}"
+           style="width: {width_px}px; height: {width_px}px;
+                  object-fit: contain; border-radius: 8px;
+                  box-shadow: 0 4px 8px rgba(0,0,0,0.15);"
+           alt="Pro'VerBs Logo" />
+    </div>
+    <script>
+      const logos = [{js_array}];
+      let idx = 0;
+      // Fetch only the logo shown next, one interval ahead of the swap;
+      // a logo that fails to load is skipped and the current one stays up
+      let upcoming = null;
+      function prefetch() {{
+        const next = (idx + 1) % logos.length;
+        upcoming = new Image();
+        upcoming.onload = () => {{ upcoming.ready = next; }};
+        upcoming.src = logos[next];
+      }}
+      prefetch();
+      setInterval(() => {{
+        if (upcoming.ready !== undefined) {{
+          idx = upcoming.ready;
+          const img = document.getElementById('rotating-logo');
+          if (img) img.src = logos[idx];
+        }} else {{
+          idx = (idx + 1) % logos.length;
+        }}
+        prefetch();
+      }}, {interval_ms});
+    </script>
+    """
+    components.html(html, height=width_px + 40)
+    return True
@@ -0,0 +1 @@
+"""Legal reference, reasoning and corpus storage modules for Pro'VerBs LAW'8."""
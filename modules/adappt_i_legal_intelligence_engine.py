@@ -0,0 +1,688 @@
+"""
+ADAPPT-I Legal Intelligence Engine
+Backend technology for continuous adaptation to ALL legal systems worldwide
+ADAPPT-I Cross-System Legal Reasoning Engine
+Advanced reasoning and analysis between various legal systems for optimal accuracy
+"""
+
+import asyncio
+import copy
+import os
+import re
+import threading
+from collections import Counter
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Set, Tuple, Callable, Iterable, Mapping, Sequence, AsyncIterator
+from dataclasses import dataclass
+from enum import Enum
+import logging
+
+import numpy as np
+
+_shared_reasoning: Optional["CrossSystemLegalReasoning"] = None
+_shared_reasoning_lock = threading.Lock()
+
+_PRINCIPLE_TERM_PATTERN = re.compile(r"\w+")
+_PRINCIPLE_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "be", "by", "for", "from", "in", "into",
+    "is", "it", "of", "on", "or", "over", "should", "that", "the", "through",
+    "to", "with"
+})
+
+
+def _principle_terms(text: str) -> List[str]:
+    """Split text into lowercase content terms used for principle matching"""
+    return [
+        term for term in _PRINCIPLE_TERM_PATTERN.findall(text.casefold())
+        if term not in _PRINCIPLE_STOPWORDS
+    ]
+
+
+def _principle_text(principle: "LegalPrinciple") -> str:
+    """Text of a principle that takes part in term matching"""
+    return " ".join([principle.name, principle.description, principle.historical_foundation])
+
+
+@dataclass(frozen=True)
+class LegalPrinciple:
+    """Core legal principle structure"""
+    name: str
+    system_origin: str
+    description: str
+    precedence_weight: float
+    jurisdictional_scope: str
+    historical_foundation: str
+
+
+@dataclass
+class CrossSystemAnalysis:
+    """Cross-system legal analysis result"""
+    query: str
+    systems_analyzed: List[str]
+    principle_conflicts: List[Dict]
+    principle_harmonies: List[Dict]
+    synthesized_conclusion: str
+    confidence_score: float
+    recommended_approach: str
+    supporting_precedents: List[str]
+
+
+class LegalSystemHierarchy(Enum):
+    """Legal system hierarchy for conflict resolution"""
+    DIVINE_LAW = 1          # Highest precedence
+    NATURAL_LAW = 2         # Constitutional principles
+    CONSTITUTIONAL_LAW = 3  # Supreme law of the land
+    COMMON_LAW = 4          # Established precedents
+    STATUTORY_LAW = 5       # Legislative enactments
+    REGULATORY_LAW = 6      # Administrative rules
+    COMMERCIAL_LAW = 7      # Business and trade law
+    LOCAL_LAW = 8           # Municipal ordinances
+
+
+class PrincipleMatrix:
+    """
+    Principle base packed into NumPy arrays so queries are scored with matrix
+    operations instead of Python loops over LegalPrinciple attributes
+
+    The term incidence is stored sparsely in CSR form: row i has the vocabulary
+    columns term_indices[term_offsets[i]:term_offsets[i + 1]], each holding the
+    row's L2-normalized value row_values[i]. Conflict and harmony pairs are taken
+    from a PrincipleRelationMatrix, so scores and reported relations agree.
+    """
+
+    def __init__(self, principles_by_system: Mapping[str, Sequence[LegalPrinciple]],
+                 system_weights: Mapping[str, float],
+                 relations: "PrincipleRelationMatrix"):
+        self.systems = list(principles_by_system)
+        self.principles = [
+            principle
+            for system in self.systems
+            for principle in principles_by_system[system]
+        ]
+        system_positions = {system: position for position, system in enumerate(self.systems)}
+
+        # Weight vector: principle precedence scaled by its system's weight
+        self.weights = np.array([
+            principle.precedence_weight * system_weights.get(principle.system_origin, 1.0)
+            for principle in self.principles
+        ], dtype=np.float64)
+
+        # System-index vector
+        self.system_index = np.array(
+            [system_positions[principle.system_origin] for principle in self.principles],
+            dtype=np.int64
+        )
+
+        # Term incidence (principles x vocabulary) in CSR form
+        self.vocabulary: Dict[str, int] = {}
+        offsets, indices = [0], []
+        for principle in self.principles:
+            indices.extend(self._term_columns(principle))
+            offsets.append(len(indices))
+        self.term_offsets = np.array(offsets, dtype=np.int64)
+        self.term_indices = np.array(indices, dtype=np.int64)
+        term_counts = np.diff(self.term_offsets)
+        self.row_values = np.divide(1.0, np.sqrt(term_counts, dtype=np.float32),
+                                    out=np.zeros(len(term_counts), dtype=np.float32), where=term_counts > 0)
+        self.term_rows = np.repeat(np.arange(len(self.principles), dtype=np.int64), term_counts)
+
+        # Row pairs of conflicting and harmonizing principles, with the harmonies' cosine affinity
+        self.rows = {principle: row for row, principle in enumerate(self.principles)}
+        self._set_pairs(relations.pairs_among(self.principles), np.empty((0, 2), dtype=np.int64),
+                        np.empty((0, 2), dtype=np.int64), np.empty(0, dtype=np.float64))
+
+    def with_principle(self, principle: LegalPrinciple, system_weights: Mapping[str, float],
+                       relations: "PrincipleRelationMatrix") -> "PrincipleMatrix":
+        """
+        Return a copy with the principle appended as the last row
+
+        Only the new principle is tokenized and related; the existing rows,
+        vocabulary and pairs are carried over, so readers of this matrix keep
+        a consistent snapshot. The principle must already be in relations.
+        """
+        matrix = copy.copy(self)
+        row = len(self.principles)
+        system = principle.system_origin
+        matrix.principles = self.principles + [principle]
+        matrix.rows = {**self.rows, principle: row}
+        matrix.systems = self.systems if system in self.systems else self.systems + [system]
+        matrix.weights = np.append(self.weights, principle.precedence_weight * system_weights.get(system, 1.0))
+        matrix.system_index = np.append(self.system_index, matrix.systems.index(system))
+
+        matrix.vocabulary = dict(self.vocabulary)
+        columns = np.array(matrix._term_columns(principle), dtype=np.int64)
+        matrix.term_indices = np.concatenate([self.term_indices, columns])
+        matrix.term_offsets = np.append(self.term_offsets, len(matrix.term_indices))
+        value = 1.0 / np.sqrt(len(columns)) if len(columns) else 0.0
+        matrix.row_values = np.append(self.row_values, np.float32(value))
+        matrix.term_rows = np.concatenate([self.term_rows, np.full(len(columns), row, dtype=np.int64)])
+
+        matrix._set_pairs(relations.pairs_of(principle), self.conflict_rows, self.harmony_rows, self.harmony_affinity)
+        return matrix
+
+    def _term_columns(self, principle: LegalPrinciple) -> List[int]:
+        """Sorted vocabulary columns of a principle's terms, extending the vocabulary"""
+        return sorted({
+            self.vocabulary.setdefault(term, len(self.vocabulary))
+            for term in _principle_terms(_principle_text(principle))
+        })
+
+    def _set_pairs(self, pairs: Iterable[Tuple[str, float, LegalPrinciple, LegalPrinciple]],
+                   conflict_rows: np.ndarray, harmony_rows: np.ndarray, harmony_affinity: np.ndarray) -> None:
+        """Store the given pairs' rows after the existing conflict and harmony rows"""
+        conflicts, harmonies, affinities = [], [], []
+        for kind, affinity, first, second in pairs:
+            if kind == "conflict":
+                conflicts.append((self.rows[first], self.rows[second]))
+            else:
+                harmonies.append((self.rows[first], self.rows[second]))
+                affinities.append(affinity)
+        self.conflict_rows = np.concatenate([conflict_rows, np.array(conflicts, dtype=np.int64).reshape(-1, 2)])
+        self.harmony_rows = np.concatenate([harmony_rows, np.array(harmonies, dtype=np.int64).reshape(-1, 2)])
+        self.harmony_affinity = np.concatenate([harmony_affinity, np.array(affinities, dtype=np.float64)])
+
+    def query_matrix(self, queries: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Encode queries as L2-normalized rows, returning (matrix, vocabulary columns)
+
+        Only the vocabulary columns used by the batch are materialized.
+        """
+        query_columns = [
+            {self.vocabulary[term] for term in _principle_terms(query) if term in self.vocabulary}
+            for query in queries
+        ]
+        used = sorted(set().union(*query_columns))
+        positions = {column: position for position, column in enumerate(used)}
+        matrix = np.zeros((len(queries), len(used)), dtype=np.float32)
+        for row, columns in enumerate(query_columns):
+            if columns:
+                matrix[row, [positions[column] for column in columns]] = 1.0 / np.sqrt(len(columns))
+        return matrix, np.array(used, dtype=np.int64)
+
+    def relevance(self, queries: Sequence[str]) -> np.ndarray:
+        """
+        Return a (queries x principles) matrix of weighted term-overlap relevance
+
+        Only the stored nonzeros in the batch's vocabulary columns are visited.
+        """
+        matrix, columns = self.query_matrix(queries)
+        column_positions = np.full(len(self.vocabulary), -1, dtype=np.int64)
+        column_positions[columns] = np.arange(len(columns))
+        positions = column_positions[self.term_indices]
+        hits = np.flatnonzero(positions >= 0)
+        hit_rows = self.term_rows[hits]
+        relevance = np.zeros((len(queries), len(self.principles)), dtype=np.float64)
+        np.add.at(relevance.T, hit_rows, (matrix[:, positions[hits]] * self.row_values[hit_rows]).T)
+        return relevance * self.weights
+
+    def system_relevance(self, query: str, system: str) -> List[Tuple[LegalPrinciple, float]]:
+        """Return (principle, relevance) for one system's matching principles, best first"""
+        if system not in self.systems:
+            return []
+        rows = np.flatnonzero(self.system_index == self.systems.index(system))
+        relevance = self.relevance([query])[0, rows]
+        order = np.argsort(-relevance, kind="stable")
+        return [(self.principles[rows[position]], float(relevance[position])) for position in order if relevance[position] > 0]
+
+    def score(self, queries: Sequence[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Score a batch of queries, returning (relevance, conflict, harmony)
+
+        Conflict sums r_i * r_j over the conflicting pairs and harmony sums
+        r_i * r_j * cos(i, j) over the harmonizing pairs, the same pairs
+        PrincipleRelationMatrix reports.
+        """
+        relevance = self.relevance(queries)
+        conflict = (relevance[:, self.conflict_rows[:, 0]] * relevance[:, self.conflict_rows[:, 1]]).sum(axis=1)
+        harmony = (relevance[:, self.harmony_rows[:, 0]] * relevance[:, self.harmony_rows[:, 1]]) @ self.harmony_affinity
+        return relevance, conflict, harmony
+
+
+def system_hierarchy_rank(system: str) -> int:
+    """Return the LegalSystemHierarchy rank of a system; unranked systems come last"""
+    member = LegalSystemHierarchy.__members__.get(system.upper())
+    return member.value if member is not None else len(LegalSystemHierarchy) + 1
+
+
+class PrincipleRelationMatrix:
+    """
+    Sparse conflict/harmony relations between principles of different systems
+
+    Conflicts come only from the curated opposing principle pairs, since
+    shared vocabulary says nothing about two principles pulling apart. Any
+    other pair whose cosine term affinity reaches HARMONY_THRESHOLD is a
+    harmony; the remaining pairs are unrelated. Adding a principle only
+    compares it against its opposing principles and the principles sharing
+    one of its terms, so the matrix never needs a full rebuild.
+    """
+
+    HARMONY_THRESHOLD = 0.5
+
+    def __init__(self, principles: Sequence[LegalPrinciple] = (),
+                 opposing_principles: Iterable[Tuple[str, str]] = ()):
+        self.principles: List[LegalPrinciple] = []
+        self.positions: Dict[LegalPrinciple, int] = {}
+        self._term_counts: List[int] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._indices_by_name: Dict[str, List[int]] = {}
+        self._opposing: Dict[str, Set[str]] = {}
+        self._relations: List[Dict[int, Tuple[str, float]]] = []
+        self._lock = threading.Lock()
+        for first, second in opposing_principles:
+            self._opposing.setdefault(first, set()).add(second)
+            self._opposing.setdefault(second, set()).add(first)
+        for principle in principles:
+            self.add(principle)
+
+    def add(self, principle: LegalPrinciple) -> int:
+        """Add a principle and relate it to its opposing and term-sharing principles"""
+        terms = set(_principle_terms(_principle_text(principle)))
+        with self._lock:
+            if principle in self.positions:
+                return self.positions[principle]
+            index = len(self.principles)
+            shared = Counter(other for term in terms for other in self._postings.get(term, ()))
+            opposing = {
+                other
+                for name in self._opposing.get(principle.name, ())
+                for other in self._indices_by_name.get(name, ())
+            }
+            row = {}
+            for other in sorted(opposing | shared.keys()):
+                if self.principles[other].system_origin == principle.system_origin:
+                    continue
+                norm = (len(terms) * self._term_counts[other]) ** 0.5
+                affinity = shared[other] / norm if norm else 0.0
+                if other in opposing:
+                    kind = "conflict"
+                elif affinity >= self.HARMONY_THRESHOLD:
+                    kind = "harmony"
+                else:
+                    continue
+                row[other] = (kind, affinity)
+                self._relations[other][index] = (kind, affinity)
+            for term in terms:
+                self._postings.setdefault(term, []).append(index)
+            self._indices_by_name.setdefault(principle.name, []).append(index)
+            self.principles.append(principle)
+            self.positions[principle] = index
+            self._term_counts.append(len(terms))
+            self._relations.append(row)
+            return index
+
+    def pairs_of(self, principle: LegalPrinciple) -> List[Tuple[str, float, LegalPrinciple, LegalPrinciple]]:
+        """Return (kind, affinity, principle, other) for every stored pair of one principle"""
+        with self._lock:
+            index = self.positions.get(principle)
+            if index is None:
+                return []
+            return [
+                (kind, affinity, principle, self.principles[other])
+                for other, (kind, affinity) in sorted(self._relations[index].items())
+            ]
+
+    def pairs_among(self, principles: Sequence[LegalPrinciple]) -> List[Tuple[str, float, LegalPrinciple, LegalPrinciple]]:
+        """Return (kind, affinity, first, second) for every stored pair among the given principles"""
+        with self._lock:
+            indices = {self.positions[principle] for principle in principles if principle in self.positions}
+            pairs = []
+            for index in sorted(indices):
+                for other, (kind, affinity) in self._relations[index].items():
+                    if other > index and other in indices:
+                        pairs.append((kind, affinity, self.principles[index], self.principles[other]))
+            return pairs
+
+    @staticmethod
+    def resolve(first: LegalPrinciple, second: LegalPrinciple) -> LegalPrinciple:
+        """Pick the prevailing principle by hierarchy rank, then precedence weight"""
+        return min(
+            (first, second),
+            key=lambda principle: (system_hierarchy_rank(principle.system_origin), -principle.precedence_weight)
+        )
+
+
+def get_cross_system_reasoning() -> "CrossSystemLegalReasoning":
+    """Return the process-wide reasoning engine with its read-only principle base
+
+    Principles are loaded from the compiled corpus named by LEGAL_CORPUS_PATH when set
+    """
+    global _shared_reasoning
+    if _shared_reasoning is None:
+        with _shared_reasoning_lock:
+            if _shared_reasoning is None:
+                _shared_reasoning = CrossSystemLegalReasoning(os.environ.get("LEGAL_CORPUS_PATH"))
+    return _shared_reasoning
+
+
+class CrossSystemLegalReasoning:
+    """
+    Advanced legal reasoning engine that analyzes across all legal systems
+    to provide the most accurate and comprehensive legal guidance
+    """
+
+    def __init__(self, corpus_path: Optional[str] = None):
+        self.reasoning_version = "3.0.0-cross-system"
+        if corpus_path:
+            from modules.legal_corpus_store import LegalCorpusStore
+            principles = LegalCorpusStore(corpus_path).load_legal_principles()
+        else:
+            principles = self._initialize_legal_principles()
+        self.legal_principles_db = MappingProxyType({
+            system: tuple(system_principles)
+            for system, system_principles in principles.items()
+        })
+        self.system_weights = MappingProxyType(self._initialize_system_weights())
+        self.conflict_resolution_rules = MappingProxyType(self._initialize_conflict_resolution())
+        self.synthesis_algorithms = MappingProxyType(self._initialize_synthesis_algorithms())
+        self.principle_relations = PrincipleRelationMatrix(
+            [principle for system_principles in self.legal_principles_db.values() for principle in system_principles],
+            self.conflict_resolution_rules["opposing_principles"]
+        )
+        self.principle_matrix = PrincipleMatrix(self.legal_principles_db, self.system_weights, self.principle_relations)
+        self._principles_lock = threading.Lock()
+        self.system_timeout_seconds = 5.0
+        self.logger = logging.getLogger("ADAPPT-I-CrossSystem")
+
+    def _initialize_legal_principles(self) -> Dict[str, List[LegalPrinciple]]:
+        """Initialize comprehensive legal principles database"""
+        return {
+            "divine_law": [
+                LegalPrinciple(
+                    name="Divine Authority",
+                    system_origin="divine_law",
+                    description="Ultimate authority derives from divine source",
+                    precedence_weight=1.0,
+                    jurisdictional_scope="universal",
+                    historical_foundation="Ancient religious texts and natural law tradition"
+                ),
+                LegalPrinciple(
+                    name="Natural Justice",
+                    system_origin="divine_law",
+                    description="Inherent sense of right and wrong",
+                    precedence_weight=0.95,
+                    jurisdictional_scope="universal",
+                    historical_foundation="Natural law philosophy and moral reasoning"
+                )
+            ],
+            "natural_law": [
+                LegalPrinciple(
+                    name="Inherent Rights",
+                    system_origin="natural_law",
+                    description="Rights that exist by nature of being human",
+                    precedence_weight=0.9,
+                    jurisdictional_scope="universal",
+                    historical_foundation="Enlightenment philosophy and constitutional foundations"
+                ),
+                LegalPrinciple(
+                    name="Self-Determination",
+                    system_origin="natural_law",
+                    description="Right to govern oneself and make autonomous decisions",
+                    precedence_weight=0.85,
+                    jurisdictional_scope="individual",
+                    historical_foundation="Classical liberal philosophy"
+                )
+            ],
+            "constitutional_law": [
+                LegalPrinciple(
+                    name="Separation of Powers",
+                    system_origin="constitutional_law",
+                    description="Division of government into distinct branches",
+                    precedence_weight=0.8,
+                    jurisdictional_scope="national",
+                    historical_foundation="Montesquieu and American constitutional design"
+                ),
+                LegalPrinciple(
+                    name="Due Process",
+                    system_origin="constitutional_law",
+                    description="Fair treatment through judicial system",
+                    precedence_weight=0.85,
+                    jurisdictional_scope="national",
+                    historical_foundation="Magna Carta and constitutional amendments"
+                )
+            ],
+            "commercial_law": [
+                LegalPrinciple(
+                    name="Freedom of Contract",
+                    system_origin="commercial_law",
+                    description="Right to enter into agreements voluntarily",
+                    precedence_weight=0.7,
+                    jurisdictional_scope="commercial",
+                    historical_foundation="Common law contract principles"
+                ),
+                LegalPrinciple(
+                    name="Good Faith Dealing",
+                    system_origin="commercial_law",
+                    description="Obligation to act honestly in commercial relations",
+                    precedence_weight=0.75,
+                    jurisdictional_scope="commercial",
+                    historical_foundation="Uniform Commercial Code and merchant law"
+                )
+            ],
+            "ai_law": [
+                LegalPrinciple(
+                    name="Algorithmic Transparency",
+                    system_origin="ai_law",
+                    description="AI systems should be explainable and auditable",
+                    precedence_weight=0.6,
+                    jurisdictional_scope="technology",
+                    historical_foundation="EU AI Act and emerging AI governance frameworks"
+                ),
+                LegalPrinciple(
+                    name="Human Oversight",
+                    system_origin="ai_law",
+                    description="Human control over critical AI decisions",
+                    precedence_weight=0.65,
+                    jurisdictional_scope="technology",
+                    historical_foundation="AI safety research and regulatory proposals"
+                )
+            ]
+        }
+
+    def score_principles(self, queries: Sequence[str]) -> List[Dict[str, Any]]:
+        """Score all principles against a batch of queries in one set of matrix operations"""
+        relevance, conflict, harmony = self.principle_matrix.score(queries)
+        principles = self.principle_matrix.principles
+        results = []
+        for row, query in enumerate(queries):
+            matched = np.flatnonzero(relevance[row])
+            matched = matched[np.argsort(-relevance[row, matched], kind="stable")]
+            results.append({
+                "query": query,
+                "principle_relevance": [
+                    {
+                        "principle": principles[index].name,
+                        "system": principles[index].system_origin,
+                        "score": float(relevance[row, index])
+                    }
+                    for index in matched
+                ],
+                "conflict_score": float(conflict[row]),
+                "harmony_score": float(harmony[row])
+            })
+        return results
+
+    def score_principle(self, query: str) -> Dict[str, Any]:
+        """Score all principles against a single query"""
+        return self.score_principles([query])[0]
+
+    def add_principle(self, principle: LegalPrinciple) -> None:
+        """Add a principle, updating the relation matrix and principle matrix incrementally
+
+        The new principle is appended as one matrix row and related only to its own
+        pairs. The principle base and matrix are replaced rather than mutated so
+        concurrent readers keep a consistent snapshot
+        """
+        with self._principles_lock:
+            principles = dict(self.legal_principles_db)
+            principles[principle.system_origin] = principles.get(principle.system_origin, ()) + (principle,)
+            self.principle_relations.add(principle)
+            self.principle_matrix = self.principle_matrix.with_principle(principle, self.system_weights,
+                                                                         self.principle_relations)
+            self.legal_principles_db = MappingProxyType(principles)
+
+    def principle_conflicts_and_harmonies(self, query: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Look up conflicts and harmonies among the principles a query matches
+
+        Conflicts are resolved in favour of the system ranked higher in LegalSystemHierarchy
+        """
+        matrix = self.principle_matrix
+        relevance = matrix.relevance([query])[0]
+        return self._relate_principles([matrix.principles[index] for index in np.flatnonzero(relevance)])
+
+    def _relate_principles(self, matched: Sequence[LegalPrinciple]) -> Dict[str, List[Dict[str, Any]]]:
+        """Split the stored relations among matched principles into conflicts and harmonies"""
+        conflicts, harmonies = [], []
+        for kind, affinity, first, second in self.principle_relations.pairs_among(matched):
+            entry = {
+                "principles": [first.name, second.name],
+                "systems": [first.system_origin, second.system_origin],
+                "affinity": affinity
+            }
+            if kind == "harmony":
+                harmonies.append(entry)
+            else:
+                prevailing = PrincipleRelationMatrix.resolve(first, second)
+                entry["prevailing_principle"] = prevailing.name
+                entry["prevailing_system"] = prevailing.system_origin
+                entry["resolution"] = "legal_system_hierarchy"
+                conflicts.append(entry)
+        return {"principle_conflicts": conflicts, "principle_harmonies": harmonies}
+
+    async def analyze(self, query: str, timeout: Optional[float] = None,
+                      on_partial: Optional[Callable[[Dict[str, Any]], Any]] = None) -> CrossSystemAnalysis:
+        """Analyze a query across all legal systems concurrently
+
+        Each partial per-system result is passed to on_partial as soon as it is ready
+        """
+        analysis = None
+        async for event in self.analyze_stream(query, timeout):
+            if event["type"] == "system":
+                if on_partial is not None:
+                    outcome = on_partial(event)
+                    if asyncio.iscoroutine(outcome):
+                        await outcome
+            else:
+                analysis = event["analysis"]
+        return analysis
+
+    async def analyze_stream(self, query: str, timeout: Optional[float] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Yield per-system results in completion order, then the synthesized analysis
+
+        Every system runs as its own task with its own timeout, so a slow system only
+        drops out of the synthesis instead of holding up the others
+        """
+        timeout = self.system_timeout_seconds if timeout is None else timeout
+        matrix = self.principle_matrix
+        tasks = [
+            asyncio.ensure_future(self._analyze_system(matrix, system, query, timeout))
+            for system in matrix.systems
+        ]
+        results = []
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                result = await next_result
+                results.append(result)
+                yield {
+                    "type": "system",
+                    "system": result["system"],
+                    "status": result["status"],
+                    "principles": [
+                        {"principle": principle.name, "score": score}
+                        for principle, score in result["principles"]
+                    ]
+                }
+        finally:
+            for task in tasks:
+                task.cancel()
+        yield {"type": "analysis", "analysis": self._synthesize_analysis(query, matrix.systems, results)}
+
+    async def _analyze_system(self, matrix: PrincipleMatrix, system: str, query: str,
+                              timeout: float) -> Dict[str, Any]:
+        """Evaluate one legal system off the event loop, bounded by timeout"""
+        loop = asyncio.get_running_loop()
+        try:
+            principles = await asyncio.wait_for(
+                loop.run_in_executor(None, matrix.system_relevance, query, system), timeout
+            )
+        except asyncio.TimeoutError:
+            self.logger.warning("Analysis of %s timed out after %.1fs", system, timeout)
+            return {"system": system, "status": "timeout", "principles": []}
+        except Exception:
+            self.logger.exception("Analysis of %s failed", system)
+            return {"system": system, "status": "error", "principles": []}
+        return {"system": system, "status": "complete", "principles": principles}
+
+    def _synthesize_analysis(self, query: str, systems: Sequence[str],
+                             results: Sequence[Dict[str, Any]]) -> CrossSystemAnalysis:
+        """Combine per-system results into a CrossSystemAnalysis"""
+        completed = [result for result in results if result["status"] == "complete"]
+        ranked = sorted(
+            (match for result in completed for match in result["principles"]),
+            key=lambda match: match[1], reverse=True
+        )
+        relations = self._relate_principles([principle for principle, _ in ranked])
+        conflicts, harmonies = relations["principle_conflicts"], relations["principle_harmonies"]
+
+        if ranked:
+            leading = ranked[0][0]
+            conclusion = (f"{leading.name} ({leading.system_origin}) is the most relevant principle "
+                          f"across {len(completed)} legal systems")
+        else:
+            conclusion = "No legal principle matched the query"
+        if conflicts:
+            approach = "Resolve conflicts by legal system hierarchy: " + ", ".join(
+                sorted({conflict["prevailing_principle"] for conflict in conflicts})
+            ) + " prevail"
+        elif harmonies:
+            approach = "Apply the harmonized principles together"
+        else:
+            approach = "Apply the most relevant principle"
+
+        coverage = len(completed) / len(systems) if systems else 0.0
+        related = len(conflicts) + len(harmonies)
+        agreement = len(harmonies) / related if related else 1.0
+        return CrossSystemAnalysis(
+            query=query,
+            systems_analyzed=[result["system"] for result in completed],
+            principle_conflicts=conflicts,
+            principle_harmonies=harmonies,
+            synthesized_conclusion=conclusion,
+            confidence_score=round(coverage * (0.5 + 0.5 * agreement), 3) if ranked else 0.0,
+            recommended_approach=approach,
+            supporting_precedents=list(dict.fromkeys(principle.historical_foundation for principle, _ in ranked[:5]))
+        )
+
+    def _initialize_system_weights(self) -> Dict[str, float]:
+        """Initialize weights for different legal systems"""
+        return {
+            "divine_law": 1.0,
+            "natural_law": 0.95,
+            "constitutional_law": 0.9,
+            "commercial_law": 0.7,
+            "ai_law": 0.6
+        }
+
+    def _initialize_conflict_resolution(self) -> Dict[str, Any]:
+        """Initialize rules for resolving conflicts between legal systems
+
+        Only the opposing principle pairs listed here are treated as conflicts
+        """
+        return {
+            "hierarchy": [member.name.lower() for member in LegalSystemHierarchy],
+            "tie_breaker": "precedence_weight",
+            "opposing_principles": (
+                ("Divine Authority", "Self-Determination"),
+                ("Divine Authority", "Separation of Powers"),
+                ("Inherent Rights", "Freedom of Contract"),
+                ("Freedom of Contract", "Algorithmic Transparency"),
+                ("Self-Determination", "Human Oversight")
+            )
+        }
+
+    def _initialize_synthesis_algorithms(self) -> Dict[str, str]:
+        """Initialize strategies for synthesizing cross-system conclusions"""
+        return {
+            "harmony": "Apply the harmonized principles together",
+            "conflict": "Resolve conflicts by legal system hierarchy",
+            "single": "Apply the most relevant principle"
+        }
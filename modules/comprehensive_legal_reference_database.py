@@ -0,0 +1,1255 @@
+"""
+Comprehensive Legal Reference Database
+Legal dictionaries across all editions plus American and international case law
+"""
+
+import json
+import copy
+import heapq
+import math
+import os
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import (Any, Container, Dict, Iterable, List, Optional,
+                    Sequence, Set, Tuple)
+from datetime import datetime
+
+_TERM_PATTERN = re.compile(r"\w+")
+
+_shared_database: Optional["ComprehensiveLegalReferenceDatabase"] = None
+_shared_database_lock = threading.Lock()
+
+
+def _normalize_terms(text: str) -> List[str]:
+    """Split free text into casefolded index terms."""
+    return _TERM_PATTERN.findall(text.casefold())
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType(
+            {key: _freeze(item)
+             for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def get_reference_database() -> "ComprehensiveLegalReferenceDatabase":
+    """Return the process-wide, read-only reference database.
+
+    The corpus and its indexes are built on first use and shared by every
+    caller afterwards, so Streamlit reruns and API workers stop paying for
+    construction on each request. When ``LEGAL_CORPUS_PATH`` points to a
+    compiled corpus file, the database is served from that file instead.
+    """
+    global _shared_database
+    if _shared_database is None:
+        with _shared_database_lock:
+            if _shared_database is None:
+                _shared_database = ComprehensiveLegalReferenceDatabase(
+                    os.environ.get("LEGAL_CORPUS_PATH"))
+    return _shared_database
+
+
+class CaseLawIndex:
+    """Inverted index over case-law entries, built once per database.
+
+    Posting lists map each term to the entries containing it along with
+    the term frequency, which together with the per-entry lengths gives
+    the statistics needed for BM25 ranking.
+    """
+
+    BM25_K1 = 1.2
+    BM25_B = 0.75
+
+    def __init__(self):
+        self.entries: List[Dict[str, Any]] = []
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.entry_lengths: List[int] = []
+        self._sorted_terms: List[str] = []
+        self._idf: Dict[str, float] = {}
+        self._average_length = 0.0
+
+    def add(self, result: Dict[str, Any], text: str,
+            **attributes: str) -> None:
+        """Index a case result under every term of its searchable text.
+
+        Attributes such as court level, jurisdiction and source field are
+        kept on the entry so searches can filter without rescanning text.
+        """
+        entry_id = len(self.entries)
+        terms = _normalize_terms(text)
+        self.entries.append({"result": result, **attributes})
+        self.entry_lengths.append(len(terms))
+        for term in terms:
+            term_postings = self.postings.setdefault(term, {})
+            term_postings[entry_id] = term_postings.get(entry_id, 0) + 1
+        self._sorted_terms = []
+        self._idf = {}
+
+    def search(self, query: str,
+               **filters: Optional[str]) -> List[Dict[str, Any]]:
+        """Return copies of the results matching every term of the query.
+
+        The last query term also matches as a prefix so partially typed
+        words behave like the old substring search. Filters set to None
+        are ignored; results keep their original insertion order.
+        """
+        filters = self._active_filters(filters)
+        return [
+            dict(self._entry(entry_id)["result"])
+            for entry_id in self._match(_normalize_terms(query))
+            if not filters or self._passes_filters(entry_id, filters)
+        ]
+
+    def search_many(
+            self, queries: Iterable[str],
+            **filters: Optional[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Run ``search`` for a batch of queries, keyed by query.
+
+        Queries that normalize to the same terms are matched once, and the
+        posting sets of terms used by several of those queries are looked
+        up once for the whole batch. Sets used by a single query are not
+        kept, so batches of unrelated queries cost no more than a loop.
+        """
+        filters = self._active_filters(filters)
+        keys = {
+            query: tuple(_normalize_terms(query))
+            for query in dict.fromkeys(queries)
+        }
+        term_uses = Counter((term, position == len(key) - 1)
+                            for key in set(keys.values())
+                            for position, term in enumerate(key))
+        shared_terms = {term for term, uses in term_uses.items() if uses > 1}
+        term_cache: Dict[Tuple[str, bool], Set[int]] = {}
+        matches_by_terms: Dict[Tuple[str, ...], List[int]] = {}
+        results = {}
+        for query, key in keys.items():
+            if key not in matches_by_terms:
+                matches_by_terms[key] = [
+                    entry_id for entry_id in self._match(
+                        key, term_cache, shared_terms)
+                    if not filters or self._passes_filters(entry_id, filters)
+                ]
+            results[query] = [
+                dict(self._entry(entry_id)["result"])
+                for entry_id in matches_by_terms[key]
+            ]
+        return results
+
+    def ranked_search(self, query: str, top_k: Optional[int] = None,
+                      **filters: Optional[str]) -> List[Dict[str, Any]]:
+        """Return results scored with BM25, best first.
+
+        Any query term may contribute to a match. Scores come from the
+        precomputed term statistics and only the best ``top_k`` entries
+        are kept on a heap, so the full candidate list is never built.
+        """
+        return self._ranked(query, top_k, self._active_filters(filters), {},
+                            {}, {})
+
+    def ranked_search_many(
+            self,
+            queries: Iterable[str],
+            top_k: Optional[int] = None,
+            **filters: Optional[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Run ``ranked_search`` for a batch of queries, keyed by query.
+
+        Scored posting lists, prefix expansions and filter checks are
+        shared by the whole batch, and queries that normalize to the same
+        terms are scored once.
+        """
+        filters = self._active_filters(filters)
+        term_cache: Dict[str, List[Tuple[int, float]]] = {}
+        prefix_cache: Dict[str, List[str]] = {}
+        filter_cache: Dict[int, bool] = {}
+        ranked_by_terms: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        results = {}
+        for query in dict.fromkeys(queries):
+            key = tuple(_normalize_terms(query))
+            if key not in ranked_by_terms:
+                ranked_by_terms[key] = self._ranked(query, top_k, filters,
+                                                    term_cache, prefix_cache,
+                                                    filter_cache)
+            results[query] = [dict(result) for result in ranked_by_terms[key]]
+        return results
+
+    @classmethod
+    def term_weight(cls, frequency: int, length: int,
+                    average_length: float) -> float:
+        """BM25 saturation of a term frequency, normalized by entry length."""
+        length_ratio = length / average_length
+        return (frequency * (cls.BM25_K1 + 1) /
+                (frequency + cls.BM25_K1 *
+                 (1 - cls.BM25_B + cls.BM25_B * length_ratio)))
+
+    @staticmethod
+    def inverse_document_frequency(total: int, frequency: int) -> float:
+        """BM25 inverse document frequency of a term."""
+        return math.log(1 + (total - frequency + 0.5) / (frequency + 0.5))
+
+    @staticmethod
+    def _active_filters(filters: Dict[str, Optional[str]]) -> Dict[str, str]:
+        """Drop filters set to None."""
+        return {key: value for key, value in filters.items()
+                if value is not None}
+
+    def _ranked(self, query: str, top_k: Optional[int],
+                filters: Dict[str, str],
+                term_cache: Dict[str, List[Tuple[int, float]]],
+                prefix_cache: Dict[str, List[str]],
+                filter_cache: Dict[int, bool]) -> List[Dict[str, Any]]:
+        """Score one query with BM25 using caches shared across a batch.
+
+        ``term_cache`` holds each term's ``(entry_id, idf * weight)`` list,
+        ``prefix_cache`` each last-term prefix's expansion and
+        ``filter_cache`` whether an entry passed the filters.
+        """
+        terms = _normalize_terms(query)
+        if not terms:
+            return []
+
+        expanded = prefix_cache.get(terms[-1])
+        if expanded is None:
+            expanded = self._terms_with_prefix(terms[-1])
+            prefix_cache[terms[-1]] = expanded
+
+        scores: Dict[int, float] = {}
+        for term in terms[:-1] + expanded:
+            contributions = term_cache.get(term)
+            if contributions is None:
+                idf = self._term_idf(term)
+                contributions = [] if idf is None else [
+                    (entry_id, idf * weight)
+                    for entry_id, weight in self._weighted_postings(term)
+                ]
+                term_cache[term] = contributions
+            for entry_id, contribution in contributions:
+                scores[entry_id] = scores.get(entry_id, 0.0) + contribution
+
+        def passes(entry_id: int) -> bool:
+            passed = filter_cache.get(entry_id)
+            if passed is None:
+                passed = self._passes_filters(entry_id, filters)
+                filter_cache[entry_id] = passed
+            return passed
+
+        candidates = ((score, entry_id) for entry_id, score in scores.items()
+                      if not filters or passes(entry_id))
+        if top_k is None:
+            best = sorted(candidates, key=lambda item: (-item[0], item[1]))
+        else:
+            best = heapq.nsmallest(top_k, candidates,
+                                   key=lambda item: (-item[0], item[1]))
+
+        results = []
+        for score, entry_id in best:
+            result = dict(self._entry(entry_id)["result"])
+            result["relevance_score"] = round(score, 4)
+            results.append(result)
+        return results
+
+    def _match(self,
+               terms: Sequence[str],
+               term_cache: Optional[Dict[Tuple[str, bool],
+                                         Set[int]]] = None,
+               shared_terms: Container[Tuple[str, bool]] = ()) -> List[int]:
+        """Intersect the posting lists for the normalized terms of a query.
+
+        ``term_cache`` lets a batch of queries share the posting sets of the
+        ``(term, is_prefix)`` pairs listed in ``shared_terms``.
+        """
+        if not terms:
+            return list(range(self._entry_count()))
+
+        candidates = None
+        for position, term in enumerate(terms):
+            is_prefix = position == len(terms) - 1
+            ids = (term_cache.get((term, is_prefix))
+                   if term_cache is not None else None)
+            if ids is None:
+                ids = self._ids_for_term(term, is_prefix)
+                if (term, is_prefix) in shared_terms:
+                    term_cache[(term, is_prefix)] = ids
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return []
+        return sorted(candidates)
+
+    def _ids_for_term(self, term: str, is_prefix: bool) -> Set[int]:
+        """Return the entries containing a term, or any term it prefixes."""
+        if not is_prefix:
+            return set(self._entry_ids(term))
+        ids = set()
+        for expanded in self._terms_with_prefix(term):
+            ids.update(self._entry_ids(expanded))
+        return ids
+
+    # Storage hooks. The in-memory index answers from its dicts; on-disk
+    # indexes override these to read the same data from the corpus file.
+
+    def _entry(self, entry_id: int) -> Mapping:
+        """Return the stored result and attributes of an entry."""
+        return self.entries[entry_id]
+
+    def _entry_count(self) -> int:
+        """Return the number of indexed entries."""
+        return len(self.entries)
+
+    def _passes_filters(self, entry_id: int, filters: Dict[str, str]) -> bool:
+        """Check an entry's attributes against active filters."""
+        entry = self.entries[entry_id]
+        return all(entry.get(key) == value for key, value in filters.items())
+
+    def _entry_ids(self, term: str) -> Iterable[int]:
+        """Return the ids of the entries containing a term."""
+        return self.postings.get(term, ())
+
+    def _weighted_postings(self, term: str) -> Iterable[Tuple[int, float]]:
+        """Yield ``(entry_id, BM25 term weight)`` pairs for a term."""
+        self._ensure_statistics()
+        for entry_id, frequency in self.postings.get(term, {}).items():
+            yield entry_id, self.term_weight(frequency,
+                                             self.entry_lengths[entry_id],
+                                             self._average_length)
+
+    def _term_idf(self, term: str) -> Optional[float]:
+        """Return the inverse document frequency of an indexed term."""
+        self._ensure_statistics()
+        return self._idf.get(term)
+
+    def _ensure_statistics(self) -> None:
+        """Compute inverse document frequencies after the index changes."""
+        if self._idf or not self.entries:
+            return
+        total = len(self.entries)
+        idf = {
+            term: self.inverse_document_frequency(total, len(term_postings))
+            for term, term_postings in self.postings.items()
+        }
+        # Publish the finished table in one step so concurrent readers of a
+        # shared index never see partially computed statistics
+        self._average_length = sum(self.entry_lengths) / total or 1.0
+        self._idf = idf
+
+    def _terms_with_prefix(self, prefix: str) -> List[str]:
+        """Return every indexed term that starts with the given prefix."""
+        if not self._sorted_terms:
+            self._sorted_terms = sorted(self.postings)
+        sorted_terms = self._sorted_terms
+        terms = []
+        position = bisect_left(sorted_terms, prefix)
+        while (position < len(sorted_terms)
+               and sorted_terms[position].startswith(prefix)):
+            terms.append(sorted_terms[position])
+            position += 1
+        return terms
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after a fixed age."""
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return a live cached value, refreshing its LRU position."""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None and item[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return item[1]
+            if item is not None:
+                del self._entries[key]
+                self.evictions += 1
+            self.misses += 1
+            return default
+
+    def put(self, key: Any, value: Any) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size, capacity and hit/miss counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+
+@dataclass(frozen=True)
+class LegalCorpus:
+    """A loaded corpus: read-only sections and the case indexes built from them.
+
+    The database holds the corpus through one reference, so a reload
+    replaces every section and index together and a reader that keeps the
+    object sees one consistent corpus.
+    """
+    legal_dictionaries_all_editions: Mapping
+    american_case_law: Mapping
+    international_case_law: Mapping
+    legal_research_tools: Mapping
+    american_case_index: CaseLawIndex
+    international_case_index: CaseLawIndex
+
+
+def _corpus_section(name: str) -> property:
+    """Read-only database attribute that reads one field of the corpus."""
+    return property(lambda self: getattr(self.corpus, name),
+                    doc=f"The {name} of the current corpus.")
+
+
+class ComprehensiveLegalReferenceDatabase:
+    """Complete legal reference system including all dictionary editions and case law."""
+
+    REPORT_TOP_K_CASES = 10
+    REPORT_CACHE_SIZE = 256
+    REPORT_CACHE_TTL_SECONDS = 3600.0
+
+    legal_dictionaries_all_editions = _corpus_section(
+        "legal_dictionaries_all_editions")
+    american_case_law = _corpus_section("american_case_law")
+    international_case_law = _corpus_section("international_case_law")
+    legal_research_tools = _corpus_section("legal_research_tools")
+    american_case_index = _corpus_section("american_case_index")
+    international_case_index = _corpus_section("international_case_index")
+
+    def __init__(self, corpus_path: Optional[str] = None):
+        self.corpus_version = 0
+        self.report_cache = TTLCache(self.REPORT_CACHE_SIZE,
+                                     self.REPORT_CACHE_TTL_SECONDS)
+        self.corpus = self._load_corpus(corpus_path)
+
+    def _load_corpus(self, corpus_path: Optional[str]) -> LegalCorpus:
+        """Build the built-in corpus, or load a compiled one from a file."""
+        if corpus_path:
+            return self._load_compiled_corpus(corpus_path)
+
+        american_case_law = _freeze(self._initialize_american_case_law())
+        international_case_law = _freeze(
+            self._initialize_international_case_law())
+        return LegalCorpus(
+            legal_dictionaries_all_editions=_freeze(
+                self._initialize_all_dictionary_editions()),
+            american_case_law=american_case_law,
+            international_case_law=international_case_law,
+            legal_research_tools=_freeze(self._initialize_research_tools()),
+            american_case_index=self._build_american_case_index(
+                american_case_law),
+            international_case_index=self._build_international_case_index(
+                international_case_law))
+
+    def _load_compiled_corpus(self, corpus_path: str) -> LegalCorpus:
+        """Load sections and case-law indexes from a compiled corpus file."""
+        from modules.legal_corpus_store import LegalCorpusStore
+
+        store = LegalCorpusStore(corpus_path)
+        return LegalCorpus(
+            legal_dictionaries_all_editions=store.load_section(
+                "legal_dictionaries_all_editions"),
+            american_case_law=store.load_section("american_case_law"),
+            international_case_law=store.load_section(
+                "international_case_law"),
+            legal_research_tools=store.load_section("legal_research_tools"),
+            american_case_index=store.case_index("american"),
+            international_case_index=store.case_index("international"))
+
+    def reload_corpus(self, corpus_path: Optional[str] = None) -> None:
+        """Reload the corpus and invalidate every cached research report.
+
+        The new corpus is built aside and swapped in through a single
+        reference, so searches never pair a new section with an old index.
+        Cache keys include the corpus version, so reports still being built
+        from the old corpus can never be served after the reload.
+        """
+        self.corpus = self._load_corpus(corpus_path)
+        self.corpus_version += 1
+        self.report_cache.clear()
+
+    def _initialize_all_dictionary_editions(self) -> Dict[str, Any]:
+        """Initialize comprehensive database of all legal dictionary editions."""
+        return {
+            "blacks_law_dictionary": {
+                "description": "The most widely used legal dictionary in the United States",
+                "editions": {
+                    "1st_edition_1891": {
+                        "year": 1891,
+                        "author": "Henry Campbell Black",
+                        "significance": "Original foundation of American legal terminology",
+                        "key_features": [
+                            "First comprehensive American legal dictionary",
+                            "Common law focus",
+                            "Latin legal terms compilation"
+                        ]
+                    },
+                    "2nd_edition_1910": {
+                        "year": 1910,
+                        "updates": "Expanded definitions and new legal developments",
+                        "additions": "Commercial law terms, corporate law expansion"
+                    },
+                    "3rd_edition_1933": {
+                        "year": 1933,
+                        "updates": "New Deal era legal terminology",
+                        "additions": "Administrative law terms, securities regulation"
+                    },
+                    "4th_edition_1951": {
+                        "year": 1951,
+                        "updates": "Post-WWII legal developments",
+                        "additions": "International law terms, civil rights terminology"
+                    },
+                    "5th_edition_1979": {
+                        "year": 1979,
+                        "updates": "Modern legal practice terminology",
+                        "additions": "Environmental law, consumer protection law"
+                    },
+                    "6th_edition_1990": {
+                        "year": 1990,
+                        "updates": "Technology law integration",
+                        "additions": "Intellectual property, computer law terms"
+                    },
+                    "7th_edition_1999": {
+                        "year": 1999,
+                        "updates": "Internet era legal terminology",
+                        "additions": "Cyber law, e-commerce regulations"
+                    },
+                    "8th_edition_2004": {
+                        "year": 2004,
+                        "updates": "Post-9/11 security law terminology",
+                        "additions": "Homeland security law, anti-terrorism provisions"
+                    },
+                    "9th_edition_2009": {
+                        "year": 2009,
+                        "updates": "Financial crisis legal terminology",
+                        "additions": "Banking regulation, securities law updates"
+                    },
+                    "10th_edition_2014": {
+                        "year": 2014,
+                        "updates": "Digital age legal terminology",
+                        "additions": "Social media law, privacy law expansion"
+                    },
+                    "11th_edition_2019": {
+                        "year": 2019,
+                        "updates": "Current legal practice focus",
+                        "additions": "Cryptocurrency law, data protection terminology"
+                    },
+                    "12th_edition_2024": {
+                        "year": 2024,
+                        "updates": "AI and technology law integration",
+                        "additions": "Artificial intelligence law, remote work regulations"
+                    }
+                }
+            },
+            "bouvier_law_dictionary": {
+                "description": "Historic American legal dictionary emphasizing early jurisprudence",
+                "editions": {
+                    "1st_edition_1839": {
+                        "year": 1839,
+                        "author": "John Bouvier",
+                        "significance": "First major American legal dictionary",
+                        "focus": "Common law adaptation to American system"
+                    },
+                    "6th_edition_1856": {
+                        "year": 1856,
+                        "significance": "Last edition revised by John Bouvier"
+                    }
+                }
+            },
+            "ballentines_law_dictionary": {
+                "description": "Practical legal dictionary with extensive cross-references",
+                "editions": {
+                    "1st_edition_1930": {
+                        "year": 1930,
+                        "author": "James A. Ballentine"
+                    },
+                    "3rd_edition_1969": {
+                        "year": 1969,
+                        "updates": "Expanded pronunciation and cross-reference guide"
+                    }
+                }
+            },
+            "words_and_phrases": {
+                "description": "West Publishing's comprehensive legal term compilation",
+                "editions": {
+                    "permanent_edition": {
+                        "description": "Continuously updated multi-volume set",
+                        "coverage": "Judicial definitions from all American courts",
+                        "volumes": "100+ volumes with annual supplements"
+                    }
+                }
+            },
+            "mozley_whiteleys_law_dictionary": {
+                "description": "British legal dictionary with historical depth",
+                "editions": {
+                    "12th_edition_1993": {
+                        "year": 1993
+                    }
+                }
+            }
+        }
+
+    def _initialize_american_case_law(self) -> Dict[str, Any]:
+        """Initialize American case law database structure."""
+        return {
+            "supreme_court": {
+                "description": "United States Supreme Court decisions",
+                "jurisdiction": "federal",
+                "key_databases": [
+                    "Westlaw Supreme Court Database",
+                    "Lexis Supreme Court Library",
+                    "United States Reports"
+                ],
+                "landmark_cases": {
+                    "marbury_v_madison": {
+                        "citation": "5 U.S. 137 (1803)",
+                        "principle": "Judicial review of legislative acts",
+                        "impact": "Established the power of courts to strike down unconstitutional laws"
+                    },
+                    "brown_v_board_of_education": {
+                        "citation": "347 U.S. 483 (1954)",
+                        "principle": "Separate educational facilities are inherently unequal",
+                        "impact": "Ended legal racial segregation in public schools"
+                    },
+                    "miranda_v_arizona": {
+                        "citation": "384 U.S. 436 (1966)",
+                        "principle": "Warnings required before custodial interrogation",
+                        "impact": "Protected the privilege against self-incrimination"
+                    }
+                }
+            },
+            "federal_courts": {
+                "description": "Federal appellate and district court decisions",
+                "jurisdiction": "federal",
+                "court_levels": {
+                    "circuit_courts": {
+                        "1st_circuit": "Maine, Massachusetts, New Hampshire, Rhode Island",
+                        "2nd_circuit": "Connecticut, New York, Vermont",
+                        "3rd_circuit": "Delaware, New Jersey, Pennsylvania",
+                        "4th_circuit": "Maryland, North Carolina, South Carolina, Virginia, West Virginia",
+                        "5th_circuit": "Louisiana, Mississippi, Texas",
+                        "6th_circuit": "Kentucky, Michigan, Ohio, Tennessee",
+                        "7th_circuit": "Illinois, Indiana, Wisconsin",
+                        "8th_circuit": "Arkansas, Iowa, Minnesota, Missouri, Nebraska, North Dakota, South Dakota",
+                        "9th_circuit": "Alaska, Arizona, California, Hawaii, Idaho, Montana, Nevada, Oregon, Washington",
+                        "10th_circuit": "Colorado, Kansas, New Mexico, Oklahoma, Utah, Wyoming",
+                        "11th_circuit": "Alabama, Florida, Georgia",
+                        "dc_circuit": "District of Columbia"
+                    },
+                    "district_courts": "94 federal judicial districts"
+                }
+            },
+            "state_courts": {
+                "description": "State supreme court and appellate decisions",
+                "jurisdiction": "state",
+                "major_reporters": [
+                    "Atlantic Reporter (A., A.2d, A.3d)",
+                    "North Eastern Reporter (N.E., N.E.2d, N.E.3d)",
+                    "North Western Reporter (N.W., N.W.2d)",
+                    "Pacific Reporter (P., P.2d, P.3d)",
+                    "South Eastern Reporter (S.E., S.E.2d)",
+                    "South Western Reporter (S.W., S.W.2d, S.W.3d)",
+                    "Southern Reporter (So., So. 2d, So. 3d)"
+                ]
+            },
+            "specialized_courts": {
+                "description": "Specialized federal and administrative courts",
+                "jurisdiction": "federal",
+                "courts": [
+                    "Tax Court",
+                    "Court of Federal Claims",
+                    "Court of International Trade",
+                    "Court of Appeals for Veterans Claims",
+                    "Court of Appeals for the Armed Forces",
+                    "Bankruptcy Courts"
+                ]
+            }
+        }
+
+    def _initialize_international_case_law(self) -> Dict[str, Any]:
+        """Initialize international case law database structure."""
+        return {
+            "international_courts": {
+                "international_court_of_justice": {
+                    "description": "Principal judicial organ of the United Nations",
+                    "jurisdiction": "Disputes between states",
+                    "landmark_cases": [
+                        "Corfu Channel Case (United Kingdom v. Albania)",
+                        "North Sea Continental Shelf Cases",
+                        "Nicaragua v. United States",
+                        "Barcelona Traction (Belgium v. Spain)"
+                    ]
+                },
+                "international_criminal_court": {
+                    "description": "Permanent tribunal for international crimes",
+                    "jurisdiction": "Genocide, crimes against humanity, war crimes",
+                    "cases": [
+                        "Prosecutor v. Thomas Lubanga Dyilo",
+                        "Prosecutor v. Germain Katanga",
+                        "Prosecutor v. Jean-Pierre Bemba Gombo"
+                    ]
+                },
+                "european_court_of_human_rights": {
+                    "description": "Regional human rights court",
+                    "jurisdiction": "European Convention on Human Rights violations",
+                    "influential_cases": [
+                        "Golder v. United Kingdom",
+                        "Sunday Times v. United Kingdom",
+                        "Soering v. United Kingdom"
+                    ]
+                }
+            },
+            "regional_courts": {
+                "inter_american_court_of_human_rights": {
+                    "jurisdiction": "American Convention on Human Rights",
+                    "significant_cases": [
+                        "Velásquez Rodríguez v. Honduras",
+                        "Barrios Altos v. Peru"
+                    ]
+                },
+                "african_court_on_human_and_peoples_rights": {
+                    "jurisdiction": "African Charter on Human and Peoples' Rights",
+                    "developing_jurisprudence": "Emerging case law on African human rights"
+                }
+            },
+            "trade_courts": {
+                "world_trade_organization": {
+                    "description": "International trade dispute resolution",
+                    "panel_reports": "WTO Panel and Appellate Body decisions",
+                    "major_disputes": ["EC - Hormones", "US - Shrimp", "EC - Bananas III"]
+                }
+            },
+            "arbitration_tribunals": {
+                "permanent_court_of_arbitration": {
+                    "description": "Arbitration between states, state entities and private parties",
+                    "jurisdiction": "Consensual submission of disputes",
+                    "cases": ["South China Sea Arbitration (Philippines v. China)"]
+                }
+            }
+        }
+
+    def _initialize_research_tools(self) -> Dict[str, Any]:
+        """Initialize legal research tools and databases."""
+        return {
+            "commercial_databases": {
+                "westlaw": {
+                    "description": "Thomson Reuters legal research platform",
+                    "coverage": "Case law, statutes, secondary sources"
+                },
+                "lexis": {
+                    "description": "LexisNexis legal research platform",
+                    "coverage": "Case law, statutes, news, secondary sources"
+                }
+            },
+            "free_resources": {
+                "courtlistener": {
+                    "description": "Free Law Project case law archive",
+                    "coverage": "Federal and state court opinions"
+                }
+            }
+        }
+
+    def search_dictionary_editions(self,
+                                   term: str,
+                                   dictionary: str = None,
+                                   edition: str = None) -> Dict[str, Any]:
+        """Search across all dictionary editions for legal term definitions."""
+        results = {
+            "term": term,
+            "definitions_by_edition": []
+        }
+
+        term_lower = term.lower()
+        dictionaries = self.corpus.legal_dictionaries_all_editions
+        search_dicts = [dictionary] if dictionary else dictionaries.keys()
+
+        for dict_key in search_dicts:
+            if dict_key in dictionaries:
+                dict_data = dictionaries[dict_key]
+
+                # Search specific edition or all editions
+                if edition and "editions" in dict_data:
+                    if edition in dict_data["editions"]:
+                        definition = self._find_term_in_edition(
+                            dict_data["editions"][edition], term_lower)
+                        if definition:
+                            results["definitions_by_edition"].append({
+                                "dictionary":
+                                dict_key,
+                                "edition":
+                                edition,
+                                "year":
+                                dict_data["editions"][edition].get(
+                                    "year", "Unknown"),
+                                "definition":
+                                definition
+                            })
+                else:
+                    # Search all editions
+                    if "editions" in dict_data:
+                        for ed_key, ed_data in dict_data["editions"].items():
+                            definition = self._find_term_in_edition(
+                                ed_data, term_lower)
+                            if definition:
+                                results["definitions_by_edition"].append({
+                                    "dictionary":
+                                    dict_key,
+                                    "edition":
+                                    ed_key,
+                                    "year":
+                                    ed_data.get("year", "Unknown"),
+                                    "definition":
+                                    definition
+                                })
+
+        # Sort by year to show evolution, undated editions last
+        results["definitions_by_edition"].sort(
+            key=lambda entry: (not isinstance(entry["year"], int),
+                               entry["year"]
+                               if isinstance(entry["year"], int) else 0))
+
+        return results
+
+    def search_dictionary_editions_many(
+            self,
+            terms: Iterable[str],
+            dictionary: str = None,
+            edition: str = None) -> Dict[str, Dict[str, Any]]:
+        """Search dictionary editions for a batch of terms, keyed by term.
+
+        Editions are walked once for the whole batch and each edition looks
+        up all unique, lowercased terms in one pass.
+        """
+        lowered_terms = {term: term.lower() for term in dict.fromkeys(terms)}
+        unique_terms = set(lowered_terms.values())
+        results = {
+            term: {
+                "term": term,
+                "definitions_by_edition": []
+            }
+            for term in lowered_terms
+        }
+
+        dictionaries = self.corpus.legal_dictionaries_all_editions
+        search_dicts = [dictionary] if dictionary else dictionaries.keys()
+        for dict_key in search_dicts:
+            dict_data = dictionaries.get(dict_key)
+            if not dict_data or "editions" not in dict_data:
+                continue
+            editions = dict_data["editions"]
+            if edition:
+                editions = {edition: editions[edition]
+                            } if edition in editions else {}
+
+            for ed_key, ed_data in editions.items():
+                year = ed_data.get("year", "Unknown")
+                definitions = self._find_terms_in_edition(
+                    ed_data, unique_terms)
+                for term, term_lower in lowered_terms.items():
+                    definition = definitions.get(term_lower)
+                    if definition:
+                        results[term]["definitions_by_edition"].append({
+                            "dictionary": dict_key,
+                            "edition": ed_key,
+                            "year": year,
+                            "definition": definition
+                        })
+
+        # Sort by year to show evolution, undated editions last
+        for result in results.values():
+            result["definitions_by_edition"].sort(
+                key=lambda entry: (not isinstance(entry["year"], int),
+                                   entry["year"]
+                                   if isinstance(entry["year"], int) else 0))
+        return results
+
+    def search_american_case_law(
+            self,
+            query: str,
+            court_level: str = None,
+            jurisdiction: str = None,
+            ranked: bool = False,
+            top_k: Optional[int] = None) -> Dict[str, Any]:
+        """Search American case law database.
+
+        With ``ranked`` set, cases are scored with BM25 over case name,
+        citation, principle and impact, ordered best first and limited to
+        ``top_k`` results. The index is searched once with every filter
+        applied; ``cases_by_court_level`` groups the same results by court.
+        """
+        if ranked:
+            cases = self.american_case_index.ranked_search(
+                query,
+                top_k=top_k,
+                court_level=court_level,
+                jurisdiction=jurisdiction)
+        else:
+            cases = self.american_case_index.search(
+                query, court_level=court_level, jurisdiction=jurisdiction)
+        return {
+            "query": query,
+            "court_level": court_level,
+            "jurisdiction": jurisdiction,
+            "relevant_cases": cases,
+            "cases_by_court_level": self._group_cases(cases, "court_level")
+        }
+
+    def search_american_case_law_many(
+            self,
+            queries: Iterable[str],
+            court_level: str = None,
+            jurisdiction: str = None,
+            ranked: bool = False,
+            top_k: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """Search American case law for a batch of queries, keyed by query.
+
+        The whole batch is answered from the case index in one pass with
+        shared term lookups, ranked or not; repeated queries are searched
+        once. Each result has the shape of search_american_case_law's.
+        """
+        index = self.american_case_index
+        queries = list(dict.fromkeys(queries))
+        if ranked:
+            matches = index.ranked_search_many(queries,
+                                               top_k=top_k,
+                                               court_level=court_level,
+                                               jurisdiction=jurisdiction)
+        else:
+            matches = index.search_many(queries,
+                                        court_level=court_level,
+                                        jurisdiction=jurisdiction)
+        return {
+            query: {
+                "query": query,
+                "court_level": court_level,
+                "jurisdiction": jurisdiction,
+                "relevant_cases": matches[query],
+                "cases_by_court_level": self._group_cases(
+                    matches[query], "court_level")
+            }
+            for query in queries
+        }
+
+    def search_international_case_law(
+            self,
+            query: str,
+            court: str = None,
+            ranked: bool = False,
+            top_k: Optional[int] = None) -> Dict[str, Any]:
+        """Search international case law database.
+
+        ``ranked`` and ``top_k`` behave as in search_american_case_law;
+        ``cases_by_category`` groups the results by court category.
+        """
+        # Landmark, influential, significant cases etc. are all answered
+        # from the prebuilt index in a single pass
+        if ranked:
+            cases = self.international_case_index.ranked_search(query,
+                                                                top_k=top_k,
+                                                                court=court)
+        else:
+            cases = self.international_case_index.search(query, court=court)
+        return {
+            "query": query,
+            "court": court,
+            "relevant_cases": cases,
+            "cases_by_category": self._group_cases(cases, "category")
+        }
+
+    @staticmethod
+    def _group_cases(cases: List[Dict[str, Any]],
+                     key: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Group cases by one of their fields, keeping their order."""
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for case in cases:
+            groups.setdefault(case.get(key, ""), []).append(case)
+        return groups
+
+    def _build_american_case_index(
+            self,
+            american_case_law: Mapping,
+            index: Optional[CaseLawIndex] = None) -> CaseLawIndex:
+        """Index American landmark cases by name, citation and principle.
+
+        Any object with CaseLawIndex.add can be passed to receive the
+        entries, which is how the corpus compiler streams them to disk.
+        """
+        index = CaseLawIndex() if index is None else index
+        for court_type, court_data in american_case_law.items():
+            landmark_cases = court_data.get("landmark_cases")
+            if not isinstance(landmark_cases, Mapping):
+                continue
+            for case_key, case_data in landmark_cases.items():
+                result = {
+                    "case_name": case_key.replace("_", " ").title(),
+                    "citation": case_data.get("citation", ""),
+                    "principle": case_data.get("principle", ""),
+                    "impact": case_data.get("impact", ""),
+                    "court_level": court_type
+                }
+                index.add(result,
+                          " ".join([
+                              result["case_name"], result["citation"],
+                              result["principle"], result["impact"]
+                          ]),
+                          court_level=court_type,
+                          jurisdiction=court_data.get("jurisdiction", ""),
+                          field="landmark_cases")
+        return index
+
+    def _build_international_case_index(
+            self,
+            international_case_law: Mapping,
+            index: Optional[CaseLawIndex] = None) -> CaseLawIndex:
+        """Index international cases across every case list of every court."""
+        index = CaseLawIndex() if index is None else index
+        case_fields = [
+            "landmark_cases", "cases", "influential_cases",
+            "significant_cases"
+        ]
+        for court_category, courts in international_case_law.items():
+            for court_key, court_data in courts.items():
+                if not isinstance(court_data, Mapping):
+                    continue
+                for field in case_fields:
+                    cases = court_data.get(field)
+                    if not isinstance(cases, (list, tuple)):
+                        continue
+                    for case in cases:
+                        if not isinstance(case, str):
+                            continue
+                        index.add(
+                            {
+                                "case_name": case,
+                                "court": court_key.replace("_", " ").title(),
+                                "category": court_category,
+                                "jurisdiction": court_data.get(
+                                    "jurisdiction", "")
+                            },
+                            case,
+                            court=court_key,
+                            category=court_category,
+                            jurisdiction=court_data.get("jurisdiction", ""),
+                            field=field)
+        return index
+
+    def _find_term_in_edition(self, edition_data: Dict,
+                              term: str) -> Optional[str]:
+        """Find a term definition in a specific dictionary edition."""
+        return self._find_terms_in_edition(edition_data, (term, )).get(term)
+
+    def _find_terms_in_edition(self, edition_data: Dict,
+                               terms: Iterable[str]) -> Dict[str, str]:
+        """Find the definitions of several terms in one dictionary edition."""
+        # This would normally interface with actual dictionary content
+        # For now, return a placeholder that indicates the term was found
+        year = edition_data.get("year", "undated")
+        suffix = f"' as recorded in the {year} edition"
+        return {
+            term: "Definition of '" + term + suffix
+            for term in terms if term
+        }
+
+    def get_available_dictionaries(self) -> Dict[str, List[str]]:
+        """Get all available dictionaries and their editions."""
+        available = {}
+
+        for dict_key, dict_data in self.legal_dictionaries_all_editions.items(
+        ):
+            if "editions" in dict_data:
+                available[dict_key] = list(dict_data["editions"].keys())
+            else:
+                available[dict_key] = []
+
+        return available
+
+    def get_case_law_by_system(self, system: str) -> Dict[str, Any]:
+        """Get the case law database of one court system."""
+        if system == "american":
+            return self.american_case_law
+        elif system == "international":
+            return self.international_case_law
+        else:
+            return {"error": f"Unknown court system: {system}"}
+
+    def generate_comprehensive_legal_research_report(
+            self,
+            topic: str,
+            include_historical: bool = True,
+            include_international: bool = True) -> Dict[str, Any]:
+        """Generate comprehensive legal research report across all sources.
+
+        Reports are cached by normalized topic and flags; callers get their
+        own copy so cached reports cannot be modified through them. The
+        copy is stamped with the time it is returned, not when it was built.
+        """
+        cache_key = (self.corpus_version, " ".join(topic.casefold().split()),
+                     include_historical, include_international)
+        report = self.report_cache.get(cache_key)
+        if report is None:
+            report = self._build_comprehensive_legal_research_report(
+                topic, include_historical, include_international)
+            self.report_cache.put(cache_key, report)
+        report = copy.deepcopy(report)
+        report["generated_at"] = datetime.now().isoformat()
+        return report
+
+    def _build_comprehensive_legal_research_report(
+            self,
+            topic: str,
+            include_historical: bool = True,
+            include_international: bool = True) -> Dict[str, Any]:
+        """Build a research report from scratch; see the cached wrapper."""
+        report = {
+            "topic": topic,
+            "generated_at": None,  # stamped per call by the cached wrapper
+            "dictionary_definitions": self.search_dictionary_editions(topic)
+        }
+
+        report["american_case_law"] = self.search_american_case_law(
+            topic, ranked=True, top_k=self.REPORT_TOP_K_CASES)
+
+        if include_international:
+            report[
+                "international_case_law"] = self.search_international_case_law(
+                    topic, ranked=True, top_k=self.REPORT_TOP_K_CASES)
+
+        if include_historical:
+            report[
+                "historical_development"] = self._trace_legal_concept_evolution(
+                    topic)
+
+        report["sources_consulted"] = [
+            "Black's Law Dictionary (all editions)",
+            "Bouvier's Law Dictionary", "American case law databases",
+            "International tribunal decisions"
+        ]
+
+        if include_international:
+            report["sources_consulted"].extend([
+                "International Court of Justice decisions",
+                "European Court of Human Rights cases", "WTO panel reports"
+            ])
+
+        report["research_methodology"] = [
+            "Trace the term through every dictionary edition",
+            "Identify controlling and persuasive case law",
+            "Compare international tribunal decisions"
+        ]
+
+        return report
+
+    def _trace_legal_concept_evolution(self, concept: str) -> Dict[str, Any]:
+        """Trace how a legal concept is defined across dictionary editions."""
+        dictionary_results = self.search_dictionary_editions(concept)
+        evolution = {
+            "concept": concept,
+            "chronological_development": []
+        }
+
+        for definition in dictionary_results["definitions_by_edition"]:
+            evolution["chronological_development"].append({
+                "year":
+                definition["year"],
+                "source":
+                f"{definition['dictionary']} - {definition['edition']}",
+                "definition":
+                definition["definition"]
+            })
+
+        return evolution
+
+    def get_citation_format(
+            self,
+            source_type: str,
+            citation_style: str = "bluebook") -> Dict[str, str]:
+        """Get proper citation format for legal sources."""
+        citation_formats = {
+            "bluebook": {
+                "supreme_court_case":
+                "[Case Name], [Volume] U.S. [Page] ([Year])",
+                "federal_appellate":
+                "[Case Name], [Volume] F.3d [Page] ([Circuit] Cir. [Year])",
+                "federal_district":
+                "[Case Name], [Volume] F. Supp. 3d [Page] ([District] [Year])",
+                "state_case":
+                "[Case Name], [Volume] [Reporter] [Page] ([State] [Year])",
+                "law_dictionary":
+                "[Dictionary Name] [Page] ([Edition] ed. [Year])",
+                "international_case":
+                "[Case Name], [Court], [Decision Date], [Citation]"
+            }
+        }
+
+        return citation_formats.get(citation_style,
+                                    {}).get(source_type,
+                                            "Citation format not found")
+
+    def validate_legal_research(self, sources: List[str]) -> Dict[str, Any]:
+        """Validate the comprehensiveness of legal research sources."""
+        validation = {
+            "sources_provided": len(sources),
+            "coverage_analysis": {
+                "primary_sources": [],
+                "secondary_sources": [],
+                "missing_sources": []
+            },
+            "recommendations": []
+        }
+
+        # Categorize provided sources
+        for source in sources:
+            source_lower = source.lower()
+            if any(keyword in source_lower
+                   for keyword in ["case", "court", "decision", "opinion"]):
+                validation["coverage_analysis"]["primary_sources"].append(
+                    source)
+            elif any(keyword in source_lower for keyword in
+                     ["dictionary", "encyclopedia", "treatise", "article"]):
+                validation["coverage_analysis"]["secondary_sources"].append(
+                    source)
+
+        # Recommend missing sources
+        if not validation["coverage_analysis"]["primary_sources"]:
+            validation["coverage_analysis"]["missing_sources"].append(
+                "Primary case law authority")
+            validation["recommendations"].append(
+                "Include relevant court decisions and opinions")
+
+        if not validation["coverage_analysis"]["secondary_sources"]:
+            validation["coverage_analysis"]["missing_sources"].append(
+                "Secondary authority")
+            validation["recommendations"].append(
+                "Consult legal dictionaries and scholarly sources")
+
+        return validation
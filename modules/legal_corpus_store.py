@@ -0,0 +1,504 @@
+"""
+Compiled on-disk storage for the legal reference corpus.
+
+The dictionary editions, case law and legal principles are compiled into a
+single SQLite file. Every string is interned once in a ``strings`` table and
+case entries refer to it through packed arrays of string ids, while the
+case-law inverted index is stored as posting rows with precomputed BM25 term
+weights. Readers open the file read-only with memory mapping enabled, so the
+databases start without rebuilding anything and forked workers share the
+mapped pages through the OS page cache.
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+from array import array
+from collections import Counter, OrderedDict
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from modules.adappt_i_legal_intelligence_engine import (
+    CrossSystemLegalReasoning, LegalPrinciple)
+from modules.comprehensive_legal_reference_database import (
+    CaseLawIndex, ComprehensiveLegalReferenceDatabase, _freeze,
+    _normalize_terms)
+
+CORPUS_FORMAT_VERSION = 1
+
+SECTIONS = ("legal_dictionaries_all_editions", "american_case_law",
+            "international_case_law", "legal_research_tools")
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE strings (id INTEGER PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE sections (name TEXT PRIMARY KEY, payload TEXT NOT NULL);
+CREATE TABLE entries (
+    system TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    fields BLOB NOT NULL,
+    PRIMARY KEY (system, id)
+) WITHOUT ROWID;
+CREATE TABLE attributes (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    value TEXT NOT NULL,
+    UNIQUE (name, value)
+);
+CREATE TABLE entry_attributes (
+    system TEXT NOT NULL,
+    attribute_id INTEGER NOT NULL,
+    entry_id INTEGER NOT NULL,
+    PRIMARY KEY (system, attribute_id, entry_id)
+) WITHOUT ROWID;
+CREATE TABLE terms (
+    id INTEGER PRIMARY KEY,
+    system TEXT NOT NULL,
+    term TEXT NOT NULL,
+    idf REAL NOT NULL
+);
+CREATE TABLE postings (
+    term_id INTEGER NOT NULL,
+    entry_id INTEGER NOT NULL,
+    weight REAL NOT NULL,
+    PRIMARY KEY (term_id, entry_id)
+) WITHOUT ROWID;
+CREATE TABLE principles (
+    id INTEGER PRIMARY KEY,
+    system_id INTEGER NOT NULL,
+    name_id INTEGER NOT NULL,
+    description_id INTEGER NOT NULL,
+    precedence_weight REAL NOT NULL,
+    scope_id INTEGER NOT NULL,
+    foundation_id INTEGER NOT NULL
+);
+"""
+
+_INDEXES = """
+CREATE UNIQUE INDEX terms_by_system ON terms (system, term);
+"""
+
+# Scratch tables used only while compiling; never part of the output file
+_BUILD_SCHEMA = """
+CREATE UNIQUE INDEX strings_by_value ON strings (value);
+CREATE TEMP TABLE raw_postings (
+    system TEXT NOT NULL,
+    term TEXT NOT NULL,
+    entry_id INTEGER NOT NULL,
+    frequency INTEGER NOT NULL
+);
+CREATE TEMP TABLE entry_lengths (
+    system TEXT NOT NULL,
+    entry_id INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    PRIMARY KEY (system, entry_id)
+) WITHOUT ROWID;
+"""
+
+_INSERT_TERMS = """
+INSERT INTO terms (system, term, idf)
+SELECT raw.system, raw.term, bm25_idf(counts.entries, COUNT(*))
+FROM raw_postings AS raw
+JOIN (SELECT system, COUNT(*) AS entries FROM entry_lengths GROUP BY system)
+    AS counts ON counts.system = raw.system
+GROUP BY raw.system, raw.term
+ORDER BY raw.system, raw.term
+"""
+
+_INSERT_POSTINGS = """
+INSERT INTO postings (term_id, entry_id, weight)
+SELECT terms.id, raw.entry_id,
+       bm25_weight(raw.frequency, lengths.length, averages.average)
+FROM raw_postings AS raw
+JOIN terms ON terms.system = raw.system AND terms.term = raw.term
+JOIN entry_lengths AS lengths
+    ON lengths.system = raw.system AND lengths.entry_id = raw.entry_id
+JOIN (SELECT system,
+             CASE WHEN AVG(length) > 0 THEN AVG(length) ELSE 1.0 END
+                 AS average
+      FROM entry_lengths GROUP BY system)
+    AS averages ON averages.system = raw.system
+ORDER BY terms.id, raw.entry_id
+"""
+
+
+def _to_plain(value: Any) -> Any:
+    """Convert frozen corpus structures back to JSON-compatible types."""
+    if isinstance(value, Mapping):
+        return {key: _to_plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_plain(item) for item in value]
+    return value
+
+
+class CorpusCompiler:
+    """Write the legal corpus into a compact, memory-mappable SQLite file.
+
+    Cases are streamed through ``add_case`` and written in batches. Raw
+    ``(term, entry, frequency)`` rows and entry lengths go to scratch
+    tables, and ``finish`` turns them into BM25-weighted postings in SQL,
+    so memory use stays flat however many cases are compiled. Only a
+    bounded cache of recently interned strings is kept in memory.
+    """
+
+    BATCH_SIZE = 10000
+    STRING_CACHE_SIZE = 65536
+
+    def __init__(self, output_path: str):
+        self.output_path = output_path
+        self._temp_path = f"{output_path}.tmp"
+        if os.path.exists(self._temp_path):
+            os.remove(self._temp_path)
+        self._connection = sqlite3.connect(self._temp_path)
+        self._connection.executescript("PRAGMA journal_mode = OFF;"
+                                       "PRAGMA synchronous = OFF;" +
+                                       _SCHEMA + _BUILD_SCHEMA)
+        self._connection.create_function(
+            "bm25_idf", 2, CaseLawIndex.inverse_document_frequency,
+            deterministic=True)
+        self._connection.create_function("bm25_weight", 3,
+                                         CaseLawIndex.term_weight,
+                                         deterministic=True)
+        self._string_count = 0
+        self._string_cache: "OrderedDict[str, int]" = OrderedDict()
+        self._pending_entries: List[Tuple[str, int, bytes]] = []
+        self._pending_lengths: List[Tuple[str, int, int]] = []
+        self._pending_postings: List[Tuple[str, str, int, int]] = []
+        self._attribute_ids: Dict[Tuple[str, str], int] = {}
+        self._pending_attributes: List[Tuple[str, int, int]] = []
+        self._entry_counts: Dict[str, int] = {}
+        self.principle_count = 0
+
+    def intern(self, value: str) -> int:
+        """Return the id of a string, adding it to the pool on first use."""
+        cache = self._string_cache
+        string_id = cache.get(value)
+        if string_id is not None:
+            cache.move_to_end(value)
+            return string_id
+        row = self._connection.execute(
+            "SELECT id FROM strings WHERE value = ?", (value, )).fetchone()
+        if row is None:
+            string_id = self._string_count
+            self._string_count += 1
+            self._connection.execute("INSERT INTO strings VALUES (?, ?)",
+                                     (string_id, value))
+        else:
+            string_id = row[0]
+        cache[value] = string_id
+        if len(cache) > self.STRING_CACHE_SIZE:
+            cache.popitem(last=False)
+        return string_id
+
+    def add_case(self, system: str, result: Dict[str, str], text: str,
+                 **attributes: str) -> None:
+        """Add one searchable case entry, mirroring CaseLawIndex.add."""
+        entry_id = self._entry_counts.get(system, 0)
+        self._entry_counts[system] = entry_id + 1
+        terms = _normalize_terms(text)
+        self._pending_lengths.append((system, entry_id, len(terms)))
+
+        fields = array("I", [len(result)])
+        for key, value in result.items():
+            fields.extend((self.intern(key), self.intern(str(value))))
+        for key, value in attributes.items():
+            fields.extend((self.intern(key), self.intern(str(value))))
+            attribute_id = self._attribute_ids.setdefault(
+                (key, str(value)), len(self._attribute_ids))
+            self._pending_attributes.append((system, attribute_id, entry_id))
+        self._pending_entries.append((system, entry_id, fields.tobytes()))
+
+        self._pending_postings.extend(
+            (system, term, entry_id, frequency)
+            for term, frequency in Counter(terms).items())
+
+        if len(self._pending_entries) >= self.BATCH_SIZE:
+            self._flush()
+
+    def add_reference_database(
+            self, database: ComprehensiveLegalReferenceDatabase) -> None:
+        """Add the sections and indexed cases of a reference database.
+
+        Sections are stored whole, case lists included, so a database loaded
+        from the file returns the same case law as the in-memory one; the
+        ``entries`` table holds the searchable copies used by the index.
+        """
+        corpus = database.corpus
+        for name in SECTIONS:
+            section = _to_plain(getattr(corpus, name))
+            self._connection.execute(
+                "INSERT INTO sections (name, payload) VALUES (?, ?)",
+                (name, json.dumps(section, separators=(",", ":"))))
+
+        # The database's own index builders feed the compiler, so stored
+        # entries carry exactly the text and attributes of the in-memory ones
+        database._build_american_case_index(
+            corpus.american_case_law, _SystemCaseSink(self, "american"))
+        database._build_international_case_index(
+            corpus.international_case_law,
+            _SystemCaseSink(self, "international"))
+
+    def add_legal_principles(self,
+                             principles: Mapping[str,
+                                                 Iterable[LegalPrinciple]]
+                             ) -> None:
+        """Add the principle base of the cross-system reasoning engine."""
+        rows = []
+        for system, system_principles in principles.items():
+            for principle in system_principles:
+                rows.append(
+                    (self.principle_count, self.intern(system),
+                     self.intern(principle.name),
+                     self.intern(principle.description),
+                     principle.precedence_weight,
+                     self.intern(principle.jurisdictional_scope),
+                     self.intern(principle.historical_foundation)))
+                self.principle_count += 1
+        self._connection.executemany(
+            "INSERT INTO principles VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def finish(self) -> Dict[str, int]:
+        """Write postings and statistics, then atomically publish the file."""
+        self._flush()
+        statistics = {"strings": self._string_count,
+                      "principles": self.principle_count}
+        for system, count in self._entry_counts.items():
+            statistics[f"{system}_cases"] = count
+
+        # BM25 statistics are computed by SQLite over the scratch tables;
+        # the weight functions are CaseLawIndex's, so both indexes agree
+        self._connection.executescript(_INDEXES)
+        self._connection.execute(_INSERT_TERMS)
+        self._connection.execute(_INSERT_POSTINGS)
+        statistics["terms"] = self._connection.execute(
+            "SELECT COUNT(*) FROM terms").fetchone()[0]
+        self._connection.executescript("DROP TABLE raw_postings;"
+                                       "DROP TABLE entry_lengths;"
+                                       "DROP INDEX strings_by_value;")
+        self._connection.executemany(
+            "INSERT INTO attributes VALUES (?, ?, ?)",
+            [(attribute_id, name, value)
+             for (name, value), attribute_id in self._attribute_ids.items()])
+
+        meta = {"format_version": CORPUS_FORMAT_VERSION}
+        meta.update({f"{system}_entry_count": count
+                     for system, count in self._entry_counts.items()})
+        self._connection.executemany(
+            "INSERT INTO meta VALUES (?, ?)",
+            [(key, json.dumps(value)) for key, value in meta.items()])
+        self._connection.commit()
+        self._connection.execute("VACUUM")
+        self._connection.close()
+        os.replace(self._temp_path, self.output_path)
+        return statistics
+
+    def _flush(self) -> None:
+        """Write buffered entries, lengths and raw postings."""
+        self._connection.executemany("INSERT INTO entries VALUES (?, ?, ?)",
+                                     self._pending_entries)
+        self._connection.executemany(
+            "INSERT INTO entry_lengths VALUES (?, ?, ?)",
+            self._pending_lengths)
+        self._connection.executemany(
+            "INSERT INTO raw_postings VALUES (?, ?, ?, ?)",
+            self._pending_postings)
+        self._connection.executemany(
+            "INSERT INTO entry_attributes VALUES (?, ?, ?)",
+            self._pending_attributes)
+        self._pending_entries = []
+        self._pending_lengths = []
+        self._pending_postings = []
+        self._pending_attributes = []
+
+
+class _SystemCaseSink:
+    """Adapter giving CorpusCompiler the CaseLawIndex.add signature."""
+
+    def __init__(self, compiler: CorpusCompiler, system: str):
+        self.compiler = compiler
+        self.system = system
+
+    def add(self, result: Dict[str, str], text: str,
+            **attributes: str) -> None:
+        self.compiler.add_case(self.system, result, text, **attributes)
+
+
+def compile_legal_corpus(output_path: str) -> Dict[str, int]:
+    """Compile the built-in reference database and principles to a file."""
+    compiler = CorpusCompiler(output_path)
+    compiler.add_reference_database(ComprehensiveLegalReferenceDatabase())
+    compiler.add_legal_principles(
+        CrossSystemLegalReasoning().legal_principles_db)
+    return compiler.finish()
+
+
+class LegalCorpusStore:
+    """Read-only, memory-mapped view of a compiled corpus file.
+
+    Connections are opened per thread and reopened after a fork, so the
+    store can be shared by Streamlit sessions and pre-forked API workers.
+    """
+
+    MMAP_SIZE = 1 << 30
+    STRING_CACHE_SIZE = 65536
+
+    def __init__(self, path: str):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Legal corpus file not found: {path}")
+        self.path = os.path.abspath(path)
+        self._local = threading.local()
+        self.string = lru_cache(maxsize=self.STRING_CACHE_SIZE)(
+            self._load_string)
+        version = self.meta("format_version")
+        if version != CORPUS_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported legal corpus format {version!r} in {path}")
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Return this thread's read-only connection to the corpus file."""
+        local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            connection = sqlite3.connect(
+                f"file:{self.path}?mode=ro&immutable=1",
+                uri=True,
+                check_same_thread=False)
+            connection.execute(f"PRAGMA mmap_size = {self.MMAP_SIZE}")
+            connection.execute("PRAGMA query_only = ON")
+            local.connection = connection
+            local.pid = os.getpid()
+        return local.connection
+
+    def meta(self, key: str) -> Any:
+        """Return a value from the corpus metadata table."""
+        row = self.connection.execute("SELECT value FROM meta WHERE key = ?",
+                                      (key, )).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def load_section(self, name: str) -> Mapping:
+        """Return a frozen copy of a stored database section."""
+        row = self.connection.execute(
+            "SELECT payload FROM sections WHERE name = ?", (name, )).fetchone()
+        if row is None:
+            raise KeyError(f"Section {name!r} missing from {self.path}")
+        return _freeze(json.loads(row[0]))
+
+    def load_legal_principles(self) -> Dict[str, List[LegalPrinciple]]:
+        """Return the stored principle base grouped by legal system."""
+        principles: Dict[str, List[LegalPrinciple]] = {}
+        rows = self.connection.execute(
+            "SELECT system_id, name_id, description_id, precedence_weight, "
+            "scope_id, foundation_id FROM principles ORDER BY id")
+        for system_id, name_id, description_id, weight, scope_id, \
+                foundation_id in rows:
+            system = self.string(system_id)
+            principles.setdefault(system, []).append(
+                LegalPrinciple(
+                    name=self.string(name_id),
+                    system_origin=system,
+                    description=self.string(description_id),
+                    precedence_weight=weight,
+                    jurisdictional_scope=self.string(scope_id),
+                    historical_foundation=self.string(foundation_id)))
+        return principles
+
+    def case_index(self, system: str) -> "StoredCaseLawIndex":
+        """Return a case-law index that answers queries from the file."""
+        return StoredCaseLawIndex(self, system)
+
+    def _load_string(self, string_id: int) -> str:
+        """Look up an interned string by id."""
+        row = self.connection.execute(
+            "SELECT value FROM strings WHERE id = ?", (string_id, )).fetchone()
+        return row[0]
+
+
+class StoredCaseLawIndex(CaseLawIndex):
+    """CaseLawIndex whose entries and postings live in a corpus file.
+
+    Only the storage hooks are overridden, so matching, filtering and BM25
+    ranking behave exactly like the in-memory index.
+    """
+
+    ENTRY_CACHE_SIZE = 4096
+    ATTRIBUTE_CACHE_SIZE = 64
+
+    def __init__(self, store: LegalCorpusStore, system: str):
+        super().__init__()
+        self.store = store
+        self.system = system
+        self._count = store.meta(f"{system}_entry_count") or 0
+        self._entry = lru_cache(maxsize=self.ENTRY_CACHE_SIZE)(
+            self._load_entry)
+        self._attribute_ids = lru_cache(maxsize=self.ATTRIBUTE_CACHE_SIZE)(
+            self._load_attribute_ids)
+
+    def add(self, result: Dict[str, Any], text: str,
+            **attributes: str) -> None:
+        """Stored indexes are read-only; recompile the corpus to add cases."""
+        raise TypeError("StoredCaseLawIndex is read-only")
+
+    def _load_entry(self, entry_id: int) -> Mapping:
+        """Decode an entry's packed string ids into result and attributes."""
+        row = self.store.connection.execute(
+            "SELECT fields FROM entries WHERE system = ? AND id = ?",
+            (self.system, entry_id)).fetchone()
+        fields = array("I")
+        fields.frombytes(row[0])
+        strings = [self.store.string(string_id) for string_id in fields[1:]]
+        pairs = list(zip(strings[0::2], strings[1::2]))
+        result_size = fields[0]
+        entry: Dict[str, Any] = dict(pairs[result_size:])
+        entry["result"] = _freeze(dict(pairs[:result_size]))
+        return MappingProxyType(entry)
+
+    def _load_attribute_ids(self, name: str, value: str) -> frozenset:
+        """Return the ids of the entries carrying an attribute value."""
+        rows = self.store.connection.execute(
+            "SELECT entry_attributes.entry_id FROM entry_attributes "
+            "JOIN attributes ON attributes.id = entry_attributes.attribute_id "
+            "WHERE entry_attributes.system = ? AND attributes.name = ? "
+            "AND attributes.value = ?", (self.system, name, value))
+        return frozenset(entry_id for entry_id, in rows)
+
+    def _entry_count(self) -> int:
+        return self._count
+
+    def _passes_filters(self, entry_id: int, filters: Dict[str, str]) -> bool:
+        return all(entry_id in self._attribute_ids(key, value)
+                   for key, value in filters.items())
+
+    def _entry_ids(self, term: str) -> Iterable[int]:
+        return [
+            entry_id for entry_id, _ in self._weighted_postings(term)
+        ]
+
+    def _weighted_postings(self, term: str) -> Iterable[Tuple[int, float]]:
+        return self.store.connection.execute(
+            "SELECT postings.entry_id, postings.weight FROM postings "
+            "JOIN terms ON terms.id = postings.term_id "
+            "WHERE terms.system = ? AND terms.term = ?",
+            (self.system, term)).fetchall()
+
+    def _term_idf(self, term: str) -> Optional[float]:
+        row = self.store.connection.execute(
+            "SELECT idf FROM terms WHERE system = ? AND term = ?",
+            (self.system, term)).fetchone()
+        return row[0] if row else None
+
+    def _terms_with_prefix(self, prefix: str) -> List[str]:
+        rows = self.store.connection.execute(
+            "SELECT term FROM terms WHERE system = ? AND term >= ? "
+            "AND term < ? ORDER BY term",
+            (self.system, prefix, prefix + "\U0010ffff"))
+        return [term for term, in rows]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("usage: python -m modules.legal_corpus_store OUTPUT_PATH")
+    print(json.dumps(compile_legal_corpus(sys.argv[1]), indent=2))
@@ -1,159 +0,0 @@
-"""
-ADAPPT-I Legal Intelligence Engine
-Backend technology for continuous adaptation to ALL legal systems worldwide
-ADAPPT-I Cross-System Legal Reasoning Engine
-Advanced reasoning and analysis between various legal systems for optimal accuracy
-"""
-
-import asyncio
-import json
-from typing import Dict, List, Any, Optional, Tuple, Callable
-from datetime import datetime
-from dataclasses import dataclass
-from enum import Enum
-import logging
-
-@dataclass
-class LegalPrinciple:
-    """Core legal principle structure"""
-    name: str
-    system_origin: str
-    description: str
-    precedence_weight: float
-    jurisdictional_scope: str
-    historical_foundation: str
-
-@dataclass
-class CrossSystemAnalysis:
-    """Cross-system legal analysis result"""
-    query: str
-    systems_analyzed: List[str]
-    principle_conflicts: List[Dict]
-    principle_harmonies: List[Dict]
-    synthesized_conclusion: str
-    confidence_score: float
-    recommended_approach: str
-    supporting_precedents: List[str]
-
-class LegalSystemHierarchy(Enum):
-    """Legal system hierarchy for conflict resolution"""
-    DIVINE_LAW = 1          # Highest precedence
-    NATURAL_LAW = 2         # Constitutional principles 
-    CONSTITUTIONAL_LAW = 3  # Supreme law of the land
-    COMMON_LAW = 4          # Established precedents
-    STATUTORY_LAW = 5       # Legislative enactments
-    REGULATORY_LAW = 6      # Administrative rules
-    COMMERCIAL_LAW = 7      # Business and trade law
-    LOCAL_LAW = 8           # Municipal ordinances
-
-class CrossSystemLegalReasoning:
-    """
-    Advanced legal reasoning engine that analyzes across all legal systems
-    to provide the most accurate and comprehensive legal guidance
-    """
-    
-    def __init__(self):
-        self.reasoning_version = "3.0.0-cross-system"
-        self.legal_principles_db = self._initialize_legal_principles()
-        self.system_weights = self._initialize_system_weights()
-        self.conflict_resolution_rules = self._initialize_conflict_resolution()
-        self.synthesis_algorithms = self._initialize_synthesis_algorithms()
-        self.logger = logging.getLogger("ADAPPT-I-CrossSystem")
-    
-    def _initialize_legal_principles(self) -> Dict[str, List[LegalPrinciple]]:
-        """Initialize comprehensive legal principles database"""
-        return {
-            "divine_law": [
-                LegalPrinciple(
-                    name="Divine Authority",
-                    system_origin="divine_law",
-                    description="Ultimate authority derives from divine source",
-                    precedence_weight=1.0,
-                    jurisdictional_scope="universal",
-                    historical_foundation="Ancient religious texts and natural law tradition"
-                ),
-                LegalPrinciple(
-                    name="Natural Justice",
-                    system_origin="divine_law", 
-                    description="Inherent sense of right and wrong",
-                    precedence_weight=0.95,
-                    jurisdictional_scope="universal",
-                    historical_foundation="Natural law philosophy and moral reasoning"
-                )
-            ],
-            "natural_law": [
-                LegalPrinciple(
-                    name="Inherent Rights",
-                    system_origin="natural_law",
-                    description="Rights that exist by nature of being human",
-                    precedence_weight=0.9,
-                    jurisdictional_scope="universal",
-                    historical_foundation="Enlightenment philosophy and constitutional foundations"
-                ),
-                LegalPrinciple(
-                    name="Self-Determination", 
-                    system_origin="natural_law",
-                    description="Right to govern oneself and make autonomous decisions",
-                    precedence_weight=0.85,
-                    jurisdictional_scope="individual",
-                    historical_foundation="Classical liberal philosophy"
-                )
-            ],
-            "constitutional_law": [
-                LegalPrinciple(
-                    name="Separation of Powers",
-                    system_origin="constitutional_law",
-                    description="Division of government into distinct branches",
-                    precedence_weight=0.8,
-                    jurisdictional_scope="national",
-                    historical_foundation="Montesquieu and American constitutional design"
-                ),
-                LegalPrinciple(
-                    name="Due Process",
-                    system_origin="constitutional_law",
-                    description="Fair treatment through judicial system",
-                    precedence_weight=0.85,
-                    jurisdictional_scope="national",
-                    historical_foundation="Magna Carta and constitutional amendments"
-                )
-            ],
-            "commercial_law": [
-                LegalPrinciple(
-                    name="Freedom of Contract",
-                    system_origin="commercial_law",
-                    description="Right to enter into agreements voluntarily",
-                    precedence_weight=0.7,
-                    jurisdictional_scope="commercial",
-                    historical_foundation="Common law contract principles"
-                ),
-                LegalPrinciple(
-                    name="Good Faith Dealing",
-                    system_origin="commercial_law",
-                    description="Obligation to act honestly in commercial relations",
-                    precedence_weight=0.75,
-                    jurisdictional_scope="commercial",
-                    historical_foundation="Uniform Commercial Code and merchant law"
-                )
-            ],
-            "ai_law": [
-                LegalPrinciple(
-                    name="Algorithmic Transparency",
-                    system_origin="ai_law",
-                    description="AI systems should be explainable and auditable",
-                    precedence_weight=0.6,
-                    jurisdictional_scope="technology",
-                    historical_foundation="EU AI Act and emerging AI governance frameworks"
-                ),
-                LegalPrinciple(
-                    name="Human Oversight",
-                    system_origin="ai_law",
-                    description="Human control over critical AI decisions",
-                    precedence_weight=0.65,
-                    jurisdictional_scope="technology",
-                    historical_foundation="AI safety research and regulatory proposals"
-                )
-            ]
-        }
-    
-    def _initialize_system_weights(self) -> Dict[str, float]:
-        """Initialize weights for diff
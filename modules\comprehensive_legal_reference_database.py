@@ -1,632 +0,0 @@
-@ -7,11 +7,13 @@ import json
-from typing import Dict, List, Any, Optional
-from datetime import datetime
-
-
-class ComprehensiveLegalReferenceDatabase:
-    """Complete legal reference system including all dictionary editions and case law."""
-
-    def __init__(self):
-        self.legal_dictionaries_all_editions = self._initialize_all_dictionary_editions()
-        self.legal_dictionaries_all_editions = self._initialize_all_dictionary_editions(
-        )
-        self.american_case_law = self._initialize_american_case_law()
-        self.international_case_law = self._initialize_international_case_law()
-        self.legal_research_tools = self._initialize_research_tools()
-@ -20,42 +22,56 @@ class ComprehensiveLegalReferenceDatabase:
-        """Initialize comprehensive database of all legal dictionary editions."""
-        return {
-            "blacks_law_dictionary": {
-                "description": "The most widely used legal dictionary in the United States",
-                "description":
-                "The most widely used legal dictionary in the United States",
-                "editions": {
-                    "1st_edition_1891": {
-                        "year": 1891,
-                        "author": "Henry Campbell Black",
-                        "significance": "Original foundation of American legal terminology",
-                        "year":
-                        1891,
-                        "author":
-                        "Henry Campbell Black",
-                        "significance":
-                        "Original foundation of American legal terminology",
-                        "key_features": [
-                            "First comprehensive American legal dictionary",
-                            "Common law focus",
-                            "Latin legal terms compilation"
-                            "Common law focus", "Latin legal terms compilation"
-                        ]
-                    },
-                    "2nd_edition_1910": {
-                        "year": 1910,
-                        "updates": "Expanded definitions and new legal developments",
-                        "additions": "Commercial law terms, corporate law expansion"
-                        "year":
-                        1910,
-                        "updates":
-                        "Expanded definitions and new legal developments",
-                        "additions":
-                        "Commercial law terms, corporate law expansion"
-                    },
-                    "3rd_edition_1933": {
-                        "year": 1933,
-                        "updates": "New Deal era legal terminology",
-                        "additions": "Administrative law terms, securities regulation"
-                        "year":
-                        1933,
-                        "updates":
-                        "New Deal era legal terminology",
-                        "additions":
-                        "Administrative law terms, securities regulation"
-                    },
-                    "4th_edition_1951": {
-                        "year": 1951,
-                        "updates": "Post-WWII legal developments",
-                        "additions": "International law terms, civil rights terminology"
-                        "year":
-                        1951,
-                        "updates":
-                        "Post-WWII legal developments",
-                        "additions":
-                        "International law terms, civil rights terminology"
-                    },
-                    "5th_edition_1979": {
-                        "year": 1979,
-                        "updates": "Modern legal practice terminology",
-                        "additions": "Environmental law, consumer protection law"
-                        "additions":
-                        "Environmental law, consumer protection law"
-                    },
-                    "6th_edition_1990": {
-                        "year": 1990,
-                        "updates": "Technology law integration",
-                        "additions": "Intellectual property, computer law terms"
-                        "additions":
-                        "Intellectual property, computer law terms"
-                    },
-                    "7th_edition_1999": {
-                        "year": 1999,
-@ -63,14 +79,18 @@ class ComprehensiveLegalReferenceDatabase:
-                        "additions": "Cyber law, e-commerce regulations"
-                    },
-                    "8th_edition_2004": {
-                        "year": 2004,
-                        "updates": "Post-9/11 security law terminology",
-                        "additions": "Homeland security law, anti-terrorism provisions"
-                        "year":
-                        2004,
-                        "updates":
-                        "Post-9/11 security law terminology",
-                        "additions":
-                        "Homeland security law, anti-terrorism provisions"
-                    },
-                    "9th_edition_2009": {
-                        "year": 2009,
-                        "updates": "Financial crisis legal terminology",
-                        "additions": "Banking regulation, securities law updates"
-                        "additions":
-                        "Banking regulation, securities law updates"
-                    },
-                    "10th_edition_2014": {
-                        "year": 2014,
-@ -78,24 +98,32 @@ class ComprehensiveLegalReferenceDatabase:
-                        "additions": "Social media law, privacy law expansion"
-                    },
-                    "11th_edition_2019": {
-                        "year": 2019,
-                        "updates": "Current legal practice focus",
-                        "additions": "Cryptocurrency law, data protection terminology"
-                        "year":
-                        2019,
-                        "updates":
-                        "Current legal practice focus",
-                        "additions":
-                        "Cryptocurrency law, data protection terminology"
-                    },
-                    "12th_edition_2024": {
-                        "year": 2024,
-                        "updates": "AI and technology law integration",
-                        "additions": "Artificial intelligence law, remote work regulations"
-                        "year":
-                        2024,
-                        "updates":
-                        "AI and technology law integration",
-                        "additions":
-                        "Artificial intelligence law, remote work regulations"
-                    }
-                }
-            },
-            "bouvier_law_dictionary": {
-                "description": "Historic American legal dictionary emphasizing early jurisprudence",
-                "description":
-                "Historic American legal dictionary emphasizing early jurisprudence",
-                "editions": {
-                    "1st_edition_1839": {
-                        "year": 1839,
-                        "author": "John Bouvier",
-                        "significance": "First major American legal dictionary",
-                        "significance":
-                        "First major American legal dictionary",
-                        "focus": "Common law adaptation to American system"
-                    },
-                    "6th_edition_1856": {
-@ -111,7 +139,8 @@ class ComprehensiveLegalReferenceDatabase:
-                }
-            },
-            "ballentines_law_dictionary": {
-                "description": "Practical legal dictionary with extensive cross-references",
-                "description":
-                "Practical legal dictionary with extensive cross-references",
-                "editions": {
-                    "1st_edition_1930": {
-                        "year": 1930,
-@ -129,11 +158,13 @@ class ComprehensiveLegalReferenceDatabase:
-                }
-            },
-            "words_and_phrases": {
-                "description": "West Publishing's comprehensive legal term compilation",
-                "description":
-                "West Publishing's comprehensive legal term compilation",
-                "editions": {
-                    "permanent_edition": {
-                        "description": "Continuously updated multi-volume set",
-                        "coverage": "Judicial definitions from all American courts",
-                        "coverage":
-                        "Judicial definitions from all American courts",
-                        "volumes": "100+ volumes with annual supplements"
-                    }
-                }
-@ -170,7 +201,8 @@ class ComprehensiveLegalReferenceDatabase:
-                }
-            },
-            "mozley_whiteleys_law_dictionary": {
-                "description": "British legal dictionary with historical depth",
-                "description":
-                "British legal dictionary with historical depth",
-                "editions": {
-                    "12th_edition_1993": {
-                        "year": 1993,
-@ -184,7 +216,8 @@ class ComprehensiveLegalReferenceDatabase:
-        """Initialize American case law database structure."""
-        return {
-            "supreme_court": {
-                "description": "United States Supreme Court decisions",
-                "description":
-                "United States Supreme Court decisions",
-                "key_databases": [
-                    "Westlaw Supreme Court Database",
-                    "Lexis Supreme Court Library",
-@ -216,19 +249,25 @@ class ComprehensiveLegalReferenceDatabase:
-                }
-            },
-            "federal_courts": {
-                "description": "Federal appellate and district court decisions",
-                "description":
-                "Federal appellate and district court decisions",
-                "court_levels": {
-                    "circuit_courts": {
-                        "1st_circuit": "Maine, Massachusetts, New Hampshire, Rhode Island",
-                        "1st_circuit":
-                        "Maine, Massachusetts, New Hampshire, Rhode Island",
-                        "2nd_circuit": "Connecticut, New York, Vermont",
-                        "3rd_circuit": "Delaware, New Jersey, Pennsylvania",
-                        "4th_circuit": "Maryland, North Carolina, South Carolina, Virginia, West Virginia",
-                        "4th_circuit":
-                        "Maryland, North Carolina, South Carolina, Virginia, West Virginia",
-                        "5th_circuit": "Louisiana, Mississippi, Texas",
-                        "6th_circuit": "Kentucky, Michigan, Ohio, Tennessee",
-                        "7th_circuit": "Illinois, Indiana, Wisconsin",
-                        "8th_circuit": "Arkansas, Iowa, Minnesota, Missouri, Nebraska, North Dakota, South Dakota",
-                        "9th_circuit": "Alaska, Arizona, California, Hawaii, Idaho, Montana, Nevada, Oregon, Washington",
-                        "10th_circuit": "Colorado, Kansas, New Mexico, Oklahoma, Utah, Wyoming",
-                        "8th_circuit":
-                        "Arkansas, Iowa, Minnesota, Missouri, Nebraska, North Dakota, South Dakota",
-                        "9th_circuit":
-                        "Alaska, Arizona, California, Hawaii, Idaho, Montana, Nevada, Oregon, Washington",
-                        "10th_circuit":
-                        "Colorado, Kansas, New Mexico, Oklahoma, Utah, Wyoming",
-                        "11th_circuit": "Alabama, Florida, Georgia",
-                        "dc_circuit": "District of Columbia"
-                    },
-@ -236,7 +275,8 @@ class ComprehensiveLegalReferenceDatabase:
-                }
-            },
-            "state_courts": {
-                "description": "State supreme court and appellate decisions",
-                "description":
-                "State supreme court and appellate decisions",
-                "major_reporters": [
-                    "Atlantic Reporter (A., A.2d, A.3d)",
-                    "North Eastern Reporter (N.E., N.E.2d, N.E.3d)",
-@ -248,10 +288,10 @@ class ComprehensiveLegalReferenceDatabase:
-                ]
-            },
-            "specialized_courts": {
-                "description": "Specialized federal and administrative courts",
-                "description":
-                "Specialized federal and administrative courts",
-                "courts": [
-                    "Tax Court",
-                    "Court of Federal Claims",
-                    "Tax Court", "Court of Federal Claims",
-                    "Court of International Trade",
-                    "Court of Appeals for Veterans Claims",
-                    "Court of Appeals for the Armed Forces",
-@ -265,8 +305,10 @@ class ComprehensiveLegalReferenceDatabase:
-        return {
-            "international_courts": {
-                "international_court_of_justice": {
-                    "description": "Principal judicial organ of the United Nations",
-                    "jurisdiction": "Disputes between states",
-                    "description":
-                    "Principal judicial organ of the United Nations",
-                    "jurisdiction":
-                    "Disputes between states",
-                    "landmark_cases": [
-                        "Corfu Channel Case (United Kingdom v. Albania)",
-                        "North Sea Continental Shelf Cases",
-@ -275,8 +317,10 @@ class ComprehensiveLegalReferenceDatabase:
-                    ]
-                },
-                "international_criminal_court": {
-                    "description": "Permanent tribunal for international crimes",
-                    "jurisdiction": "Genocide, crimes against humanity, war crimes",
-                    "description":
-                    "Permanent tribunal for international crimes",
-                    "jurisdiction":
-                    "Genocide, crimes against humanity, war crimes",
-                    "cases": [
-                        "Prosecutor v. Thomas Lubanga Dyilo",
-                        "Prosecutor v. Germain Katanga",
-@ -284,8 +328,10 @@ class ComprehensiveLegalReferenceDatabase:
-                    ]
-                },
-                "european_court_of_human_rights": {
-                    "description": "Regional human rights court",
-                    "jurisdiction": "European Convention on Human Rights violations",
-                    "description":
-                    "Regional human rights court",
-                    "jurisdiction":
-                    "European Convention on Human Rights violations",
-                    "influential_cases": [
-                        "Golder v. United Kingdom",
-                        "Sunday Times v. United Kingdom",
-@ -295,26 +341,28 @@ class ComprehensiveLegalReferenceDatabase:
-            },
-            "regional_courts": {
-                "inter_american_court_of_human_rights": {
-                    "jurisdiction": "American Convention on Human Rights",
-                    "jurisdiction":
-                    "American Convention on Human Rights",
-                    "significant_cases": [
-                        "Velásquez Rodríguez v. Honduras",
-                        "Barrios Altos v. Peru"
-                    ]
-                },
-                "african_court_on_human_and_peoples_rights": {
-                    "jurisdiction": "African Charter on Human and Peoples' Rights",
-                    "developing_jurisprudence": "Emerging case law on African human rights"
-                    "jurisdiction":
-                    "African Charter on Human and Peoples' Rights",
-                    "developing_jurisprudence":
-                    "Emerging case law on African human rights"
-                }
-            },
-            "trade_courts": {
-                "world_trade_organization": {
-                    "description": "International trade dispute resolution",
-                    "panel_reports": "WTO Panel and Appellate Body decisions",
-                    "major_disputes": [
-                        "EC - Hormones",
-                        "US - Shrimp",
-                        "EC - Bananas III"
-                    ]
-                    "description":
-                    "International trade dispute resolution",
-                    "panel_reports":
-                    "WTO Panel and Appellate Body decisions",
-                    "major_disputes":
-                    ["EC - Hormones", "US - Shrimp", "EC - Bananas III"]
-                }
-            },
-            "arbitration_tribunals": {
-@ -389,7 +437,10 @@ class ComprehensiveLegalReferenceDatabase:
-            }
-        }
-
-    def search_dictionary_editions(self, term: str, dictionary: str = None, edition: str = None) -> Dict[str, Any]:
-    def search_dictionary_editions(self,
-                                   term: str,
-                                   dictionary: str = None,
-                                   edition: str = None) -> Dict[str, Any]:
-        """Search across all dictionary editions for legal term definitions."""
-        results = {
-            "term": term,
-@ -399,7 +450,9 @@ class ComprehensiveLegalReferenceDatabase:
-        }
-
-        term_lower = term.lower()
-        search_dicts = [dictionary] if dictionary else self.legal_dictionaries_all_editions.keys()
-        search_dicts = [
-            dictionary
-        ] if dictionary else self.legal_dictionaries_all_editions.keys()
-
-        for dict_key in search_dicts:
-            if dict_key in self.legal_dictionaries_all_editions:
-@ -408,25 +461,36 @@ class ComprehensiveLegalReferenceDatabase:
-                # Search specific edition or all editions
-                if edition and "editions" in dict_data:
-                    if edition in dict_data["editions"]:
-                        definition = self._find_term_in_edition(dict_data["editions"][edition], term_lower)
-                        definition = self._find_term_in_edition(
-                            dict_data["editions"][edition], term_lower)
-                        if definition:
-                            results["definitions_by_edition"].append({
-                                "dictionary": dict_key,
-                                "edition": edition,
-                                "year": dict_data["editions"][edition].get("year", "Unknown"),
-                                "definition": definition
-                                "dictionary":
-                                dict_key,
-                                "edition":
-                                edition,
-                                "year":
-                                dict_data["editions"][edition].get(
-                                    "year", "Unknown"),
-                                "definition":
-                                definition
-                            })
-                else:
-                    # Search all editions
-                    if "editions" in dict_data:
-                        for ed_key, ed_data in dict_data["editions"].items():
-                            definition = self._find_term_in_edition(ed_data, term_lower)
-                            definition = self._find_term_in_edition(
-                                ed_data, term_lower)
-                            if definition:
-                                results["definitions_by_edition"].append({
-                                    "dictionary": dict_key,
-                                    "edition": ed_key,
-                                    "year": ed_data.get("year", "Unknown"),
-                                    "definition": definition
-                                    "dictionary":
-                                    dict_key,
-                                    "edition":
-                                    ed_key,
-                                    "year":
-                                    ed_data.get("year", "Unknown"),
-                                    "definition":
-                                    definition
-                                })
-
-        # Sort by year to show evolution
-@ -434,7 +498,10 @@ class ComprehensiveLegalReferenceDatabase:
-
-        return results
-
-    def search_american_case_law(self, query: str, court_level: str = None, jurisdiction: str = None) -> Dict[str, Any]:
-    def search_american_case_law(self,
-                                 query: str,
-                                 court_level: str = None,
-                                 jurisdiction: str = None) -> Dict[str, Any]:
-        """Search American case law database."""
-        results = {
-            "query": query,
-@ -451,19 +518,27 @@ class ComprehensiveLegalReferenceDatabase:
-                continue
-
-            if "landmark_cases" in court_data:
-                for case_key, case_data in court_data["landmark_cases"].items():
-                for case_key, case_data in court_data["landmark_cases"].items(
-                ):
-                    if self._matches_case_query(case_data, query_lower):
-                        results["relevant_cases"].append({
-                            "case_name": case_key.replace("_", " ").title(),
-                            "citation": case_data.get("citation", ""),
-                            "principle": case_data.get("principle", ""),
-                            "impact": case_data.get("impact", ""),
-                            "court_level": court_type
-                            "case_name":
-                            case_key.replace("_", " ").title(),
-                            "citation":
-                            case_data.get("citation", ""),
-                            "principle":
-                            case_data.get("principle", ""),
-                            "impact":
-                            case_data.get("impact", ""),
-                            "court_level":
-                            court_type
-                        })
-
-        return results
-
-    def search_international_case_law(self, query: str, court: str = None) -> Dict[str, Any]:
-    def search_international_case_law(self,
-                                      query: str,
-                                      court: str = None) -> Dict[str, Any]:
-        """Search international case law database."""
-        results = {
-            "query": query,
-@ -481,21 +556,32 @@ class ComprehensiveLegalReferenceDatabase:
-                        continue
-
-                    # Search in landmark cases, cases, influential cases, etc.
-                    case_fields = ["landmark_cases", "cases", "influential_cases", "significant_cases"]
-                    case_fields = [
-                        "landmark_cases", "cases", "influential_cases",
-                        "significant_cases"
-                    ]
-                    for field in case_fields:
-                        if field in court_data and isinstance(court_data[field], list):
-                        if field in court_data and isinstance(
-                                court_data[field], list):
-                            for case in court_data[field]:
-                                if isinstance(case, str) and query_lower in case.lower():
-                                if isinstance(
-                                        case,
-                                        str) and query_lower in case.lower():
-                                    results["relevant_cases"].append({
-                                        "case_name": case,
-                                        "court": court_key.replace("_", " ").title(),
-                                        "category": court_category,
-                                        "jurisdiction": court_data.get("jurisdiction", "")
-                                        "case_name":
-                                        case,
-                                        "court":
-                                        court_key.replace("_", " ").title(),
-                                        "category":
-                                        court_category,
-                                        "jurisdiction":
-                                        court_data.get("jurisdiction", "")
-                                    })
-
-        return results
-
-    def _find_term_in_edition(self, edition_data: Dict, term: str) -> Optional[str]:
-    def _find_term_in_edition(self, edition_data: Dict,
-                              term: str) -> Optional[str]:
-        """Find a term definition in a specific dictionary edition."""
-        # This would normally interface with actual dictionary content
-        # For now, return a placeholder that indicates the term was found
-@ -529,7 +615,8 @@ class ComprehensiveLegalReferenceDatabase:
-        """Get all available dictionaries and their editions."""
-        available = {}
-
-        for dict_key, dict_data in self.legal_dictionaries_all_editions.items():
-        for dict_key, dict_data in self.legal_dictionaries_all_editions.items(
-        ):
-            if "editions" in dict_data:
-                available[dict_key] = list(dict_data["editions"].keys())
-            else:
-@ -546,7 +633,9 @@ class ComprehensiveLegalReferenceDatabase:
-        else:
-            return {"error": f"Unknown court system: {system}"}
-
-    def generate_comprehensive_legal_research_report(self, topic: str, 
-    def generate_comprehensive_legal_research_report(
-            self,
-            topic: str,
-            include_historical: bool = True,
-            include_international: bool = True) -> Dict[str, Any]:
-        """Generate comprehensive legal research report across all sources."""
-@ -560,23 +649,25 @@ class ComprehensiveLegalReferenceDatabase:
-        }
-
-        if include_international:
-            report["international_case_law"] = self.search_international_case_law(topic)
-            report[
-                "international_case_law"] = self.search_international_case_law(
-                    topic)
-
-        if include_historical:
-            report["historical_development"] = self._trace_legal_concept_evolution(topic)
-            report[
-                "historical_development"] = self._trace_legal_concept_evolution(
-                    topic)
-
-        report["sources_consulted"] = [
-            "Black's Law Dictionary (all editions)",
-            "Bouvier's Law Dictionary",
-            "American case law databases",
-            "Bouvier's Law Dictionary", "American case law databases",
-            "International tribunal decisions"
-        ]
-
-        if include_international:
-            report["sources_consulted"].extend([
-                "International Court of Justice decisions",
-                "European Court of Human Rights cases",
-                "WTO panel reports"
-                "European Court of Human Rights cases", "WTO panel reports"
-            ])
-
-        report["research_methodology"] = [
-@ -603,27 +694,41 @@ class ComprehensiveLegalReferenceDatabase:
-
-        for definition in dictionary_results["definitions_by_edition"]:
-            evolution["chronological_development"].append({
-                "year": definition["year"],
-                "source": f"{definition['dictionary']} - {definition['edition']}",
-                "definition": definition["definition"]
-                "year":
-                definition["year"],
-                "source":
-                f"{definition['dictionary']} - {definition['edition']}",
-                "definition":
-                definition["definition"]
-            })
-
-        return evolution
-
-    def get_citation_format(self, source_type: str, citation_style: str = "bluebook") -> Dict[str, str]:
-    def get_citation_format(
-            self,
-            source_type: str,
-            citation_style: str = "bluebook") -> Dict[str, str]:
-        """Get proper citation format for legal sources."""
-        citation_formats = {
-            "bluebook": {
-                "supreme_court_case": "[Case Name], [Volume] U.S. [Page] ([Year])",
-                "federal_appellate": "[Case Name], [Volume] F.3d [Page] ([Circuit] Cir. [Year])",
-                "federal_district": "[Case Name], [Volume] F. Supp. 3d [Page] ([District] [Year])",
-                "state_case": "[Case Name], [Volume] [Reporter] [Page] ([State] [Year])",
-                "law_dictionary": "[Dictionary Name] [Page] ([Edition] ed. [Year])",
-                "international_case": "[Case Name], [Court], [Decision Date], [Citation]"
-                "supreme_court_case":
-                "[Case Name], [Volume] U.S. [Page] ([Year])",
-                "federal_appellate":
-                "[Case Name], [Volume] F.3d [Page] ([Circuit] Cir. [Year])",
-                "federal_district":
-                "[Case Name], [Volume] F. Supp. 3d [Page] ([District] [Year])",
-                "state_case":
-                "[Case Name], [Volume] [Reporter] [Page] ([State] [Year])",
-                "law_dictionary":
-                "[Dictionary Name] [Page] ([Edition] ed. [Year])",
-                "international_case":
-                "[Case Name], [Court], [Decision Date], [Citation]"
-            }
-        }
-
-        return citation_formats.get(citation_style, {}).get(source_type, "Citation format not found")
-        return citation_formats.get(citation_style,
-                                    {}).get(source_type,
-                                            "Citation format not found")
-
-    def validate_legal_research(self, sources: List[str]) -> Dict[str, Any]:
-        """Validate the comprehensiveness of legal research sources."""
-@ -640,18 +745,26 @@ class ComprehensiveLegalReferenceDatabase:
-        # Categorize provided sources
-        for source in sources:
-            source_lower = source.lower()
-            if any(keyword in source_lower for keyword in ["case", "court", "decision", "opinion"]):
-                validation["coverage_analysis"]["primary_sources"].append(source)
-            elif any(keyword in source_lower for keyword in ["dictionary", "encyclopedia", "treatise", "article"]):
-                validation["coverage_analysis"]["secondary_sources"].append(source)
-            if any(keyword in source_lower
-                   for keyword in ["case", "court", "decision", "opinion"]):
-                validation["coverage_analysis"]["primary_sources"].append(
-                    source)
-            elif any(keyword in source_lower for keyword in
-                     ["dictionary", "encyclopedia", "treatise", "article"]):
-                validation["coverage_analysis"]["secondary_sources"].append(
-                    source)
-
-        # Recommend missing sources
-        if not validation["coverage_analysis"]["primary_sources"]:
-            validation["coverage_analysis"]["missing_sources"].append("Primary case law authority")
-            validation["recommendations"].append("Include relevant court decisions and opinions")
-            validation["coverage_analysis"]["missing_sources"].append(
-                "Primary case law authority")
-            validation["recommendations"].append(
-                "Include relevant court decisions and opinions")
-
-        if not validation["coverage_analysis"]["secondary_sources"]:
-            validation["coverage_analysis"]["missing_sources"].append("Secondary authority")
-            validation["recommendations"].append("Consult legal dictionaries and scholarly sources")
-            validation["coverage_analysis"]["missing_sources"].append(
-                "Secondary authority")
-            validation["recommendations"].append(
-                "Consult legal dictionaries and scholarly sources")
-
-        return validation
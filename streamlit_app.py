@@ -1,10 +1,28 @@
+import importlib
+import os
 import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Callable, Dict, Optional
 import streamlit as st
 
+from analysis_cache import (
+    cached_quantum_analysis,
+    normalize_query,
+    remember_quantum_analysis,
+    share_quantum_analysis,
+    shared_quantum_analysis,
+)
+
 # Add project root to path
 project_root = Path(__file__).parent
-sys.path.append(str(project_root))
+if str(project_root) not in sys.path:  # the script body re-runs on every interaction
+    sys.path.append(str(project_root))
 
 # Streamlit configuration
 st.set_page_config(
@@ -25,6 +43,256 @@ st.markdown(
 )
 
 
+# Optional subsystems, imported once per process
+OPTIONAL_MODULES = {
+    "logo_manager": "utils.logo_manager",
+    "quantum_analysis": "modules.quantum_universal_law_analysis",
+    "communication": "modules.communication_wrappers",
+    "web_scraper": "modules.web_scraper",
+}
+
+
+class ModuleRegistry:
+    """Resolve optional modules once and remember both successes and failures.
+
+    A module that failed to import is not retried, so reruns never pay for
+    the filesystem search of a missing package again.
+    """
+
+    def __init__(self, modules=OPTIONAL_MODULES):
+        self._paths = dict(modules)
+        self._loaded: Dict[str, Any] = {}
+        self._errors: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _resolve(self, name):
+        with self._lock:
+            if name not in self._loaded and name not in self._errors:
+                try:
+                    self._loaded[name] = importlib.import_module(self._paths[name])
+                except Exception as e:
+                    self._errors[name] = f"{type(e).__name__}: {e}"
+
+    def available(self, name):
+        self._resolve(name)
+        return name in self._loaded
+
+    def require(self, name):
+        """The imported module, or ImportError if it is unavailable."""
+        self._resolve(name)
+        if name not in self._loaded:
+            raise ImportError(f"{self._paths[name]} is not available ({self._errors[name]})")
+        return self._loaded[name]
+
+    def status(self):
+        """Availability flag for every registered module."""
+        return {name: self.available(name) for name in self._paths}
+
+
+@st.cache_resource(show_spinner=False)
+def get_module_registry():
+    return ModuleRegistry()
+
+
+# Background analysis jobs, shared by every session in this process
+ANALYSIS_WORKERS = int(os.getenv("ANALYSIS_WORKERS", "2"))
+ANALYSIS_JOB_RETENTION = int(os.getenv("ANALYSIS_JOB_RETENTION", "3600"))
+MAX_RETAINED_JOBS = 256
+JOB_POLL_SECONDS = 1.0
+
+
+@dataclass
+class AnalysisJob:
+    job_id: str
+    query: str
+    key: str
+    status: str = "queued"  # queued -> running -> done | failed
+    submitted: float = field(default_factory=time.time)
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    @property
+    def active(self):
+        return self.status in ("queued", "running")
+
+    @property
+    def elapsed(self):
+        return (self.finished or time.time()) - self.submitted
+
+
+class AnalysisJobRunner:
+    """Run analyses on a worker pool and keep finished jobs for later polls.
+
+    Submitting a query that is already queued or running returns the existing
+    job, so concurrent sessions asking the same question share one computation.
+    Every submission gets its own unguessable ticket and jobs are only looked
+    up by ticket, so a session can read the jobs it submitted but not another
+    session's from a job id.
+    Workers only call the plain analysis function they are handed; Streamlit
+    caches and registries are used on the script thread, which has the
+    ScriptRunContext they need.
+    """
+
+    def __init__(self, workers=ANALYSIS_WORKERS, retention=ANALYSIS_JOB_RETENTION):
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="analysis")
+        self._retention = retention
+        self._jobs: "OrderedDict[str, AnalysisJob]" = OrderedDict()
+        self._active: Dict[str, str] = {}
+        self._tickets: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, legal_query, analyze: Callable[[str, Any], Dict[str, Any]]):
+        key = normalize_query(legal_query)
+        with self._lock:
+            self._prune()
+            ticket = uuid.uuid4().hex
+            job_id = self._active.get(key)
+            if job_id is not None:
+                self._tickets[ticket] = job_id
+                return ticket
+            job = AnalysisJob(job_id=uuid.uuid4().hex[:12], query=legal_query, key=key)
+            self._jobs[job.job_id] = job
+            self._active[key] = job.job_id
+            self._tickets[ticket] = job.job_id
+        self._executor.submit(self._run, job, analyze)
+        return ticket
+
+    def get(self, ticket):
+        with self._lock:
+            return self._jobs.get(self._tickets.get(ticket))
+
+    def _run(self, job, analyze):
+        job.started = time.time()
+        job.status = "running"
+        result = error = None
+        try:
+            result = analyze(job.query, None) or {}
+        except Exception as e:
+            error = str(e)
+        # finished is set together with the final status, so _prune never sees a
+        # completed job without a finish time
+        with self._lock:
+            job.result, job.error = result, error
+            job.finished = time.time()
+            job.status = "failed" if error is not None else "done"
+            self._active.pop(job.key, None)
+
+    def _prune(self):
+        cutoff = time.time() - self._retention
+        finished = [j for j in self._jobs.values() if not j.active and j.finished is not None]
+        excess = len(self._jobs) - MAX_RETAINED_JOBS
+        for job in finished:
+            if job.finished < cutoff or excess > 0:
+                del self._jobs[job.job_id]
+                excess -= 1
+        self._tickets = {t: job_id for t, job_id in self._tickets.items() if job_id in self._jobs}
+
+
+@st.cache_resource(show_spinner=False)
+def get_analysis_jobs():
+    return AnalysisJobRunner()
+
+
+def _analysis_function():
+    """The analysis entry point, resolved here on the script thread for the workers."""
+    try:
+        return get_module_registry().require("quantum_analysis").perform_quantum_universal_analysis
+    except ImportError as e:
+        error = e
+
+        def unavailable(legal_query, context):
+            raise error
+
+        return unavailable
+
+
+def submit_analysis(legal_query):
+    """Queue an analysis unless this session or another one already has its result."""
+    if cached_quantum_analysis(legal_query) is None:
+        shared = shared_quantum_analysis(legal_query)
+        if shared is not None:
+            remember_quantum_analysis(legal_query, shared)
+    if cached_quantum_analysis(legal_query) is not None:
+        st.session_state.analysis_ticket = None
+        st.query_params.pop("job", None)
+        return
+    ticket = get_analysis_jobs().submit(legal_query, _analysis_function())
+    st.session_state.analysis_ticket = ticket
+    # Kept in the URL so a reconnecting browser finds the job again
+    st.query_params["job"] = ticket
+
+
+def render_analysis_failure():
+    st.success("✅ LAW'8 Analysis Ready")
+    st.info("⚛️ Quantum Universal Law Analysis - ADAPPT-I™ Engine ACTIVE")
+    st.info("🔬 Processing all 14 law categories simultaneously")
+    st.info("🩸 Divine Law of Blood supremacy confirmed")
+
+
+@st.fragment(run_every=JOB_POLL_SECONDS)
+def poll_analysis_job(ticket):
+    job = get_analysis_jobs().get(ticket)
+    if job is None or not job.active:
+        st.rerun()
+    state = "Queued" if job.status == "queued" else "Processing through quantum universal law analysis"
+    st.info(f"⚛️ {state}... ({job.elapsed:.0f}s, job {job.job_id})")
+
+
+def render_analysis(legal_query):
+    """Show the session's current job, or the cached result for the query."""
+    ticket = st.session_state.get("analysis_ticket", st.query_params.get("job"))
+    job = get_analysis_jobs().get(ticket) if ticket else None
+    if job is None:
+        if legal_query and cached_quantum_analysis(legal_query) is not None:
+            # Reruns from other widgets keep showing the last result for this query
+            try:
+                render_quantum_result(cached_quantum_analysis(legal_query))
+            except Exception:
+                pass
+        return
+    st.session_state.analysis_ticket = ticket
+    if job.active:
+        poll_analysis_job(ticket)
+    elif job.status == "done":
+        if cached_quantum_analysis(job.query) is None:
+            # first time this session shows the result: share it across sessions too
+            share_quantum_analysis(job.query, job.result)
+        remember_quantum_analysis(job.query, job.result)
+        try:
+            render_quantum_result(job.result)
+        except Exception:
+            render_analysis_failure()
+    else:
+        render_analysis_failure()
+
+
+def render_quantum_result(quantum_result):
+    st.success("✅ Analysis Complete")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Confidence", f"{quantum_result['quantum_confidence']:.0%}")
+        st.metric("Processing", f"{quantum_result['processing_time_ms']}ms")
+    with col2:
+        st.metric("Coherence", f"{quantum_result['universal_law_coherence']:.0%}")
+        st.metric("Authority", f"{quantum_result['divine_law_supremacy_score']:.0%}")
+
+    # Legal domain results
+    st.markdown("#### ⚖️ Legal Analysis")
+
+    # Show detailed results in expandable section
+    with st.expander("🔬 Detailed Quantum Analysis"):
+        analyzed_categories = quantum_result['law_categories_analyzed']
+        st.info(f"Analyzed {len(analyzed_categories)} law categories simultaneously")
+        st.json({
+            "Engine": "LAW'8 - ADAPPT-I™ Quantum",
+            "Mode": "Universal Superposition",
+            "Categories": analyzed_categories
+        })
+
+
 def main():
     # Check if user has entered email
     st.markdown("### Enter Email to Access Platform")
@@ -43,12 +311,15 @@ def main():
 
     # Header with rotating logos
     try:
-        from utils.logo_manager import get_logo_manager
-        logo_manager = get_logo_manager()
+        logo_manager = get_module_registry().require("logo_manager").get_logo_manager()
         st.markdown(logo_manager.get_header_logo_html(), unsafe_allow_html=True)
     except Exception:
         st.error("⚠️ Logo Manager not found")
 
+    with st.sidebar.expander("🧩 Modules"):
+        for name, available in get_module_registry().status().items():
+            st.write(f"{'✅' if available else '⚠️'} {name}")
+
     st.title("⚖️ Pro'VerBs™ LAW'8")
     if "user_email" in st.session_state:
         st.caption(f"Universal Law Platform | User: {st.session_state.user_email}")
@@ -68,42 +339,11 @@ def main():
 
     if st.button("🔍 Analyze with LAW'8", type="primary"):
         if legal_query:
-            with st.spinner("⚛️ Processing through quantum universal law analysis..."):
-                try:
-                    from modules.quantum_universal_law_analysis import perform_quantum_universal_analysis
-
-                    # Execute quantum analysis on all categories
-                    quantum_result = perform_quantum_universal_analysis(legal_query, None)
-
-                    st.success("✅ Analysis Complete")
-
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("Confidence", f"{quantum_result['quantum_confidence']:.0%}")
-                        st.metric("Processing", f"{quantum_result['processing_time_ms']}ms")
-                    with col2:
-                        st.metric("Coherence", f"{quantum_result['universal_law_coherence']:.0%}")
-                        st.metric("Authority", f"{quantum_result['divine_law_supremacy_score']:.0%}")
-
-                    # Legal domain results
-                    st.markdown("#### ⚖️ Legal Analysis")
-
-                    # Show detailed results in expandable section
-                    with st.expander("🔬 Detailed Quantum Analysis"):
-                        analyzed_categories = quantum_result['law_categories_analyzed']
-                        st.info(f"Analyzed {len(analyzed_categories)} law categories simultaneously")
-                        st.json({
-                            "Engine": "LAW'8 - ADAPPT-I™ Quantum",
-                            "Mode": "Universal Superposition",
-                            "Categories": analyzed_categories
-                        })
-                except Exception as e:
-                    st.success("✅ LAW'8 Analysis Ready")
-                    st.info("⚛️ Quantum Universal Law Analysis - ADAPPT-I™ Engine ACTIVE")
-                    st.info("🔬 Processing all 14 law categories simultaneously")
-                    st.info("🩸 Divine Law of Blood supremacy confirmed")
+            # Execute quantum analysis on all categories in the background
+            submit_analysis(legal_query)
         else:
             st.warning("⚠️ Please enter your legal question")
+    render_analysis(legal_query)
 
     # Service selector
     service_type = st.selectbox(
@@ -123,8 +363,8 @@ def main():
         if st.button("📱 Send SMS"):
             if sms_phone and sms_message:
                 try:
-                    from modules.communication_wrappers import send_sms_notification
-                    result = send_sms_notification(sms_phone, sms_message)
+                    communication = get_module_registry().require("communication")
+                    result = communication.send_sms_notification(sms_phone, sms_message)
                     if result:
                         st.success("✅ SMS sent successfully!")
                     else:
@@ -142,8 +382,8 @@ def main():
         if st.button("📧 Send Email"):
             if email_to and email_subject and email_content:
                 try:
-                    from modules.communication_wrappers import send_email_notification
-                    result = send_email_notification(email_to, email_subject, email_content)
+                    communication = get_module_registry().require("communication")
+                    result = communication.send_email_notification(email_to, email_subject, email_content)
                     if result:
                         st.success("✅ Email sent successfully!")
                     else:
@@ -159,8 +399,7 @@ def main():
         if st.button("🕸️ Scrape Content"):
             if scrape_url:
                 try:
-                    from modules.web_scraper import scrape_website_content
-                    content = scrape_website_content(scrape_url)
+                    content = get_module_registry().require("web_scraper").scrape_website_content(scrape_url)
                     st.markdown("**Scraped Content:**")
                     if len(content) > 100:
                         st.text_area(
@@ -2,6 +2,13 @@ import sys
 from pathlib import Path
 import streamlit as st
 
+from analysis_cache import (
+    cached_quantum_analysis,
+    remember_quantum_analysis,
+    share_quantum_analysis,
+    shared_quantum_analysis,
+)
+
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.append(str(project_root))
@@ -37,6 +44,64 @@ def safe_get(dct, key, default="N/A"):
         return default
 
 
+def get_quantum_analysis(legal_query):
+    """Return the analysis for a query, computing it only on a miss in both caches."""
+    result = cached_quantum_analysis(legal_query)
+    if result is not None:
+        remember_quantum_analysis(legal_query, result)  # refresh its LRU position
+        return result
+    result = shared_quantum_analysis(legal_query)
+    if result is None:
+        from modules.quantum_universal_law_analysis import perform_quantum_universal_analysis
+
+        result = perform_quantum_universal_analysis(legal_query, None) or {}
+        share_quantum_analysis(legal_query, result)
+    remember_quantum_analysis(legal_query, result)
+    return result
+
+
+def render_quantum_result(quantum_result):
+    st.success("✅ Analysis Complete")
+
+    # display metrics (use safe defaults if keys missing)
+    col1, col2 = st.columns(2)
+    with col1:
+        conf = safe_get(quantum_result, "quantum_confidence", 0)
+        proc_ms = safe_get(quantum_result, "processing_time_ms", 0)
+        try:
+            st.metric("Confidence", f"{float(conf):.0%}")
+        except Exception:
+            st.metric("Confidence", str(conf))
+        st.metric("Processing", f"{proc_ms}ms")
+
+    with col2:
+        coh = safe_get(quantum_result, "universal_law_coherence", 0)
+        auth = safe_get(quantum_result, "divine_law_supremacy_score", 0)
+        try:
+            st.metric("Coherence", f"{float(coh):.0%}")
+        except Exception:
+            st.metric("Coherence", str(coh))
+        try:
+            st.metric("Authority", f"{float(auth):.0%}")
+        except Exception:
+            st.metric("Authority", str(auth))
+
+    # Legal domain results
+    st.markdown("#### ⚖️ Legal Analysis")
+
+    # Show detailed results in expandable section
+    with st.expander("🔬 Detailed Quantum Analysis"):
+        analyzed_categories = safe_get(quantum_result, "law_categories_analyzed", [])
+        st.info(f"Analyzed {len(analyzed_categories)} law categories simultaneously")
+        st.json(
+            {
+                "Engine": "LAW'8 - ADAPPT-I™ Quantum",
+                "Mode": "Universal Superposition",
+                "Categories": analyzed_categories,
+            }
+        )
+
+
 def main():
     # --- Email entry / access
     st.markdown("### Enter Email to Access Platform")
@@ -83,52 +148,8 @@ def main():
         if legal_query:
             with st.spinner("⚛️ Processing through quantum universal law analysis..."):
                 try:
-                    from modules.quantum_universal_law_analysis import (
-                        perform_quantum_universal_analysis,
-                    )
-
-                    # Execute quantum analysis on all categories
-                    quantum_result = perform_quantum_universal_analysis(legal_query, None) or {}
-
-                    st.success("✅ Analysis Complete")
-
-                    # display metrics (use safe defaults if keys missing)
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        conf = safe_get(quantum_result, "quantum_confidence", 0)
-                        proc_ms = safe_get(quantum_result, "processing_time_ms", 0)
-                        try:
-                            st.metric("Confidence", f"{float(conf):.0%}")
-                        except Exception:
-                            st.metric("Confidence", str(conf))
-                        st.metric("Processing", f"{proc_ms}ms")
-
-                    with col2:
-                        coh = safe_get(quantum_result, "universal_law_coherence", 0)
-                        auth = safe_get(quantum_result, "divine_law_supremacy_score", 0)
-                        try:
-                            st.metric("Coherence", f"{float(coh):.0%}")
-                        except Exception:
-                            st.metric("Coherence", str(coh))
-                        try:
-                            st.metric("Authority", f"{float(auth):.0%}")
-                        except Exception:
-                            st.metric("Authority", str(auth))
-
-                    # Legal domain results
-                    st.markdown("#### ⚖️ Legal Analysis")
-
-                    # Show detailed results in expandable section
-                    with st.expander("🔬 Detailed Quantum Analysis"):
-                        analyzed_categories = safe_get(quantum_result, "law_categories_analyzed", [])
-                        st.info(f"Analyzed {len(analyzed_categories)} law categories simultaneously")
-                        st.json(
-                            {
-                                "Engine": "LAW'8 - ADAPPT-I™ Quantum",
-                                "Mode": "Universal Superposition",
-                                "Categories": analyzed_categories,
-                            }
-                        )
+                    # Execute quantum analysis on all categories (cached per query)
+                    render_quantum_result(get_quantum_analysis(legal_query) or {})
                 except Exception as e:
                     # If analysis module fails, give informative messages but keep app alive
                     st.error("⚠️ Analysis module failed or is unavailable.")
@@ -137,6 +158,9 @@ def main():
                     st.info("🩸 Divine Law of Blood supremacy confirmed")
         else:
             st.warning("⚠️ Please enter your legal question")
+    elif legal_query and cached_quantum_analysis(legal_query) is not None:
+        # Reruns from other widgets keep showing the last result for this query
+        render_quantum_result(cached_quantum_analysis(legal_query) or {})
 
     # --- Service selector
     service_type = st.selectbox(
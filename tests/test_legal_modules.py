@@ -0,0 +1,200 @@
+"""Tests for the legal reference database, its compiled store and the reasoning engine."""
+
+import math
+import time
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from modules.adappt_i_legal_intelligence_engine import (  # noqa: E402
+    CrossSystemLegalReasoning,
+    LegalPrinciple,
+    PrincipleMatrix,
+    _principle_terms,
+    _principle_text,
+)
+from modules.comprehensive_legal_reference_database import (  # noqa: E402
+    CaseLawIndex,
+    ComprehensiveLegalReferenceDatabase,
+    TTLCache,
+)
+from modules.legal_corpus_store import LegalCorpusStore, compile_legal_corpus  # noqa: E402
+
+CASE_QUERIES = ["United Kingdom", "united  KINGDOM", "prosecutor v", "human rights", "court", "barcelona", "nothing"]
+
+
+@pytest.fixture(scope="module")
+def database():
+    return ComprehensiveLegalReferenceDatabase()
+
+
+@pytest.fixture(scope="module")
+def corpus_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("corpus") / "corpus.sqlite"
+    compile_legal_corpus(str(path))
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def stored_database(corpus_path):
+    return ComprehensiveLegalReferenceDatabase(corpus_path)
+
+
+@pytest.fixture
+def case_index():
+    index = CaseLawIndex()
+    index.add({"case_name": "A"}, "free speech speech speech", court="supreme")
+    index.add({"case_name": "B"}, "free speech in public schools", court="appeals")
+    index.add({"case_name": "C"}, "speedy trial", court="supreme")
+    index.add({"case_name": "D"}, "property takings", court="supreme")
+    return index
+
+
+def names(results):
+    return [result["case_name"] for result in results]
+
+
+def test_search_requires_every_term_and_prefix_matches_the_last(case_index):
+    assert names(case_index.search("free speech")) == ["A", "B"]
+    assert names(case_index.search("spe")) == ["A", "B", "C"]
+    assert names(case_index.search("speech spe")) == ["A", "B"]
+    assert names(case_index.search("spe", court="supreme")) == ["A", "C"]
+    assert names(case_index.search("free trial")) == []
+    assert names(case_index.search("")) == ["A", "B", "C", "D"]
+
+
+def test_ranked_search_scores_with_bm25(case_index):
+    ranked = case_index.ranked_search("speech")
+    assert names(ranked) == ["A", "B"]
+    lengths = [4, 5, 2, 2]
+    average = sum(lengths) / len(lengths)
+    idf = CaseLawIndex.inverse_document_frequency(4, 2)
+    expected = [idf * CaseLawIndex.term_weight(3, 4, average), idf * CaseLawIndex.term_weight(1, 5, average)]
+    assert [result["relevance_score"] for result in ranked] == [round(score, 4) for score in expected]
+
+    # any query term may contribute, the last one also matches as a prefix, and ties keep insertion order
+    assert names(case_index.ranked_search("takings spe")) == ["C", "D", "A", "B"]
+    assert names(case_index.ranked_search("takings spe", top_k=2)) == ["C", "D"]
+    assert names(case_index.ranked_search("spe", court="supreme")) == ["C", "A"]
+
+
+def test_batch_searches_match_single_searches(database):
+    index = database.international_case_index
+    assert index.search_many(CASE_QUERIES) == {query: index.search(query) for query in CASE_QUERIES}
+    assert index.search_many(CASE_QUERIES, court="international_criminal_court") == {
+        query: index.search(query, court="international_criminal_court") for query in CASE_QUERIES
+    }
+    assert index.ranked_search_many(CASE_QUERIES, top_k=2) == {
+        query: index.ranked_search(query, top_k=2) for query in CASE_QUERIES
+    }
+    assert database.search_american_case_law_many(["judicial", "review", "judicial"], ranked=True) == {
+        query: database.search_american_case_law(query, ranked=True) for query in ["judicial", "review"]
+    }
+
+    terms = ["habeas", "Habeas", "contract", "tort"]
+    assert database.search_dictionary_editions_many(terms) == {
+        term: database.search_dictionary_editions(term) for term in terms
+    }
+    assert database.search_dictionary_editions_many(terms, dictionary="blacks_law_dictionary") == {
+        term: database.search_dictionary_editions(term, dictionary="blacks_law_dictionary") for term in terms
+    }
+
+
+def test_ttl_cache_evicts_least_recently_used_entries():
+    cache = TTLCache(max_size=2, ttl_seconds=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    stats = cache.stats()
+    assert (stats["size"], stats["hits"], stats["misses"], stats["evictions"]) == (2, 3, 1, 1)
+
+
+def test_ttl_cache_expires_entries():
+    cache = TTLCache(max_size=2, ttl_seconds=-1)
+    cache.put("a", 1)
+    assert cache.get("a", "missing") == "missing"
+    assert cache.stats()["size"] == 0
+    assert cache.stats()["evictions"] == 1
+
+
+@pytest.mark.parametrize("system", ["american", "international"])
+def test_stored_case_law_matches_in_memory(database, stored_database, system):
+    assert stored_database.get_case_law_by_system(system) == database.get_case_law_by_system(system)
+    assert stored_database.get_case_law_by_system("american")["supreme_court"]["landmark_cases"]
+
+
+@pytest.mark.parametrize("query", CASE_QUERIES)
+def test_stored_index_searches_like_in_memory(database, stored_database, query):
+    memory, stored = database.international_case_index, stored_database.international_case_index
+    assert stored.search(query) == memory.search(query)
+    assert stored.search(query, court="european_court_of_human_rights") == memory.search(
+        query, court="european_court_of_human_rights")
+    assert stored.ranked_search(query, top_k=3) == memory.ranked_search(query, top_k=3)
+    assert stored.ranked_search_many([query]) == memory.ranked_search_many([query])
+
+
+def test_stored_principles_match_engine(corpus_path):
+    engine = CrossSystemLegalReasoning()
+    stored = LegalCorpusStore(corpus_path).load_legal_principles()
+    assert {system: tuple(principles) for system, principles in stored.items()} == dict(engine.legal_principles_db)
+    assert CrossSystemLegalReasoning(corpus_path).score_principles(["divine law"]) == engine.score_principles(
+        ["divine law"])
+
+
+def test_cached_reports_are_stamped_when_returned(database):
+    first = database.generate_comprehensive_legal_research_report("Due Process")
+    hits = database.report_cache.stats()["hits"]
+    time.sleep(0.01)
+    second = database.generate_comprehensive_legal_research_report("due  process")
+    assert database.report_cache.stats()["hits"] == hits + 1
+    assert second["generated_at"] > first["generated_at"]
+    assert {**first, "generated_at": None} == {**second, "generated_at": None}
+
+
+SHARED_PRINCIPLE_TEXT = "stewardship of common land and water"
+PRINCIPLE_QUERIES = ["divine law natural rights", "property rights contract", "stewardship of land and water", "x"]
+
+
+def brute_force_scores(engine, query):
+    """Relevance by principle plus conflict and harmony, computed pair by pair."""
+    query_terms = set(_principle_terms(query)) & set(engine.principle_matrix.vocabulary)
+    relevance = {}
+    for principles in engine.legal_principles_db.values():
+        for principle in principles:
+            terms = set(_principle_terms(_principle_text(principle)))
+            overlap = len(query_terms & terms)
+            weight = principle.precedence_weight * engine.system_weights.get(principle.system_origin, 1.0)
+            relevance[principle] = overlap / math.sqrt(len(query_terms) * len(terms)) * weight if overlap else 0.0
+    conflict = harmony = 0.0
+    for kind, affinity, first, second in engine.principle_relations.pairs_among(list(relevance)):
+        if kind == "conflict":
+            conflict += relevance[first] * relevance[second]
+        else:
+            harmony += relevance[first] * relevance[second] * affinity
+    return relevance, conflict, harmony
+
+
+def assert_matrix_scores(engine, matrix):
+    relevance, conflict, harmony = matrix.score(PRINCIPLE_QUERIES)
+    for row, query in enumerate(PRINCIPLE_QUERIES):
+        expected_relevance, expected_conflict, expected_harmony = brute_force_scores(engine, query)
+        assert dict(zip(matrix.principles, relevance[row])) == pytest.approx(expected_relevance)
+        assert conflict[row] == pytest.approx(expected_conflict)
+        assert harmony[row] == pytest.approx(expected_harmony)
+
+
+def test_principle_matrix_scores_match_relations():
+    engine = CrossSystemLegalReasoning()
+    for system, name in [("commercial_law", "Land Stewardship"), ("ai_law", "Water Stewardship")]:
+        engine.add_principle(LegalPrinciple(name, system, SHARED_PRINCIPLE_TEXT, 0.5, "global", "custom"))
+    rebuilt = PrincipleMatrix(engine.legal_principles_db, engine.system_weights, engine.principle_relations)
+
+    for matrix in (engine.principle_matrix, rebuilt):
+        assert len(matrix.conflict_rows) and len(matrix.harmony_rows)
+        assert_matrix_scores(engine, matrix)
+    _, conflict, harmony = engine.principle_matrix.score(PRINCIPLE_QUERIES)
+    assert conflict[:2].all() and harmony[2]
@@ -0,0 +1,369 @@
+"""Tests for the generation batcher, admission control and response cache in update-app.py, and its benchmark."""
+
+import asyncio
+import importlib.util
+import json
+import os
+import queue
+import sys
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _load_benchmark():
+    spec = importlib.util.spec_from_file_location("proverbs_benchmark", os.path.join(ROOT, "benchmark-app.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+benchmark = _load_benchmark()
+api = benchmark.load_app("proverbs_api_under_test")
+
+
+class SlowModel:
+    """generate-only model that records how many calls overlap."""
+
+    def __init__(self, seconds: float = 0.2):
+        self.seconds = seconds
+        self.running = 0
+        self.peak = 0
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def generate(self, prompt, max_new_tokens=None):
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            self.calls.append(prompt)
+        time.sleep(self.seconds)
+        with self._lock:
+            self.running -= 1
+        return prompt.upper()
+
+
+class BatchModel(SlowModel):
+    def __init__(self, seconds: float = 0.05):
+        super().__init__(seconds)
+        self.batches = []
+
+    def generate_batch(self, prompts, max_new_tokens=None):
+        self.batches.append(list(prompts))
+        time.sleep(self.seconds)
+        return [prompt.upper() for prompt in prompts]
+
+
+class GatedModel:
+    """generate-only model whose calls block until the gate opens."""
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.started = threading.Event()
+        self.order = []
+
+    def generate(self, prompt, max_new_tokens=None):
+        self.order.append(prompt)
+        self.started.set()
+        self.gate.wait(5)
+        return prompt
+
+
+@pytest.fixture
+def make_batcher():
+    created = []
+
+    def make(workers=1, **kwargs):
+        executor = ThreadPoolExecutor(max_workers=workers)
+        batcher = api.GenerationBatcher(executor, **kwargs)
+        created.append((batcher, executor))
+        return batcher
+
+    yield make
+    for batcher, executor in created:
+        batcher.shutdown()
+        executor.shutdown(wait=True)
+
+
+def test_generate_only_prompts_run_on_separate_workers(make_batcher):
+    model = SlowModel(0.2)
+    batcher = make_batcher(workers=4, max_batch_size=8, max_wait_ms=10)
+    started = time.monotonic()
+    futures = [batcher.submit(model, f"p{i}", 5) for i in range(8)]
+    assert [future.result(5) for future in futures] == [f"P{i}" for i in range(8)]
+    assert model.peak == 4
+    assert time.monotonic() - started < 0.8
+
+
+def test_batchable_prompts_are_gathered(make_batcher):
+    model = BatchModel()
+    batcher = make_batcher(workers=1, max_batch_size=8, max_wait_ms=100)
+    futures = [batcher.submit(model, f"p{i}", 5) for i in range(4)]
+    assert [future.result(5) for future in futures] == ["P0", "P1", "P2", "P3"]
+    assert model.batches == [["p0", "p1", "p2", "p3"]]
+
+
+def test_queue_depth_and_client_limits_shed(make_batcher):
+    model = GatedModel()
+    batcher = make_batcher(workers=1, max_batch_size=1, max_queue_depth=2, max_per_client=1)
+    running = batcher.submit(model, "running", 5, client="a")
+    assert model.started.wait(5)
+    batcher.submit(model, "queued", 5, client="a")
+    with pytest.raises(api.QueueFull, match="this client"):
+        batcher.submit(model, "over client limit", 5, client="a")
+    batcher.submit(model, "other client", 5, client="b")
+    with pytest.raises(api.QueueFull, match="queue is full"):
+        batcher.submit(model, "over depth", 5, client="c")
+    assert batcher.shed == 2
+    model.gate.set()
+    assert running.result(5) == "running"
+
+
+def test_deadline_sheds_at_admission_and_expires_in_queue(make_batcher):
+    model = GatedModel()
+    batcher = make_batcher(workers=1, max_batch_size=1)
+    batcher._generate_seconds = 0.2
+    with pytest.raises(api.QueueFull, match="deadline"):
+        batcher.submit(model, "late", 5, deadline=time.monotonic() + 0.1)
+
+    running = batcher.submit(model, "running", 5)
+    assert model.started.wait(5)
+    doomed = batcher.submit(model, "doomed", 5, deadline=time.monotonic() + 0.5)
+    time.sleep(0.4)
+    model.gate.set()
+    with pytest.raises(api.DeadlineExceeded):
+        doomed.result(5)
+    assert running.result(5) == "running"
+    assert batcher.expired == 1
+    assert model.order == ["running"]
+
+
+def test_clients_are_served_fairly(make_batcher):
+    model = GatedModel()
+    batcher = make_batcher(workers=1, max_batch_size=1)
+    futures = [batcher.submit(model, "first", 5, client="a")]
+    assert model.started.wait(5)
+    futures += [batcher.submit(model, f"a{i}", 5, client="a") for i in range(3)]
+    futures.append(batcher.submit(model, "b0", 5, client="b"))
+    model.gate.set()
+    for future in futures:
+        future.result(5)
+    assert model.order == ["first", "a0", "b0", "a1", "a2"]
+
+
+def test_cancelled_prompt_releases_its_queue_slot(make_batcher):
+    model = GatedModel()
+    batcher = make_batcher(workers=1, max_batch_size=1, max_queue_depth=1)
+    running = batcher.submit(model, "running", 5)
+    assert model.started.wait(5)
+    queued = batcher.submit(model, "queued", 5)
+    batcher.cancel(queued)
+    assert batcher.depth == 0
+    replacement = batcher.submit(model, "replacement", 5)
+    model.gate.set()
+    assert replacement.result(5) == "replacement"
+    assert running.result(5) == "running"
+    assert model.order == ["running", "replacement"]
+
+
+def test_streams_wait_for_a_worker_and_count_as_busy(make_batcher):
+    model = GatedModel()
+    batcher = make_batcher(workers=1, max_batch_size=4)
+    streamed = threading.Event()
+    running = batcher.submit(model, "running", 5)
+    assert model.started.wait(5)
+    stream = batcher.submit_stream(model, streamed.set)
+    time.sleep(0.1)
+    assert not streamed.is_set()
+    assert batcher.depth == 1 and batcher.busy == 1
+    model.gate.set()
+    assert stream.result(5) is None
+    assert streamed.is_set()
+    assert running.result(5) == "running"
+
+
+def test_stream_endpoint_is_shed_when_the_queue_is_full(make_batcher):
+    httpx = pytest.importorskip("httpx")
+    model = GatedModel()
+    batcher = make_batcher(workers=1, max_batch_size=1, max_queue_depth=1)
+    running = batcher.submit(model, "running", 5)
+    assert model.started.wait(5)
+    queued = batcher.submit(model, "queued", 5)
+
+    async def request():
+        transport = httpx.ASGITransport(app=api.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post("/generate/stream", json={"prompt": "hello", "max_new_tokens": 3})
+
+    previous, api._batcher = api._batcher, batcher
+    try:
+        response = asyncio.run(request())
+    finally:
+        api._batcher = previous
+        model.gate.set()
+    assert response.status_code == 429
+    assert int(response.headers["retry-after"]) >= 1
+    assert running.result(5) == "running" and queued.result(5) == "queued"
+
+
+def _post_stream(app, prompt):
+    httpx = pytest.importorskip("httpx")
+
+    async def request():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post("/generate/stream", json={"prompt": prompt, "max_new_tokens": 3})
+
+    return asyncio.run(request())
+
+
+def test_stream_endpoint_streams_tokens_then_done(make_batcher):
+    previous, api._batcher = api._batcher, make_batcher(workers=1)
+    try:
+        response = _post_stream(api.app, "hello")
+    finally:
+        api._batcher = previous
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[-1] == {"done": True}
+    assert "".join(line["token"] for line in lines[:-1]) == "hello token token token"
+
+
+def test_stream_without_generate_stream_decodes_through_transformers(monkeypatch):
+    gate = threading.Event()
+
+    class Streamer:
+        def __init__(self, tokenizer, skip_prompt=False, skip_special_tokens=False):
+            self.queue = queue.Queue()
+
+        def put_text(self, text):
+            self.queue.put(text)
+
+        def end(self):
+            self.queue.put(None)
+
+        def __iter__(self):
+            return iter(self.queue.get, None)
+
+    class HFModel:
+        device = None
+
+        def generate(self, streamer, stopping_criteria, max_new_tokens, **inputs):
+            for i in range(max_new_tokens):
+                if any(criteria(None, None) for criteria in stopping_criteria):
+                    break
+                streamer.put_text(f" t{i}")
+                gate.wait(5)
+            streamer.end()
+
+    class Wrapper:
+        model = HFModel()
+
+        def tokenizer(self, prompt, return_tensors=None):
+            return {"input_ids": [[1]]}
+
+        def generate(self, prompt, max_new_tokens=None):
+            raise AssertionError("the full completion must not be generated first")
+
+    transformers = types.SimpleNamespace(StoppingCriteria=object, StoppingCriteriaList=list, TextIteratorStreamer=Streamer)
+    monkeypatch.setitem(sys.modules, "transformers", transformers)
+    tokens = api._token_source(Wrapper(), "p", 3, threading.Event())
+    assert next(tokens) == " t0"
+    gate.set()
+    assert list(tokens) == [" t1", " t2"]
+
+    stop = threading.Event()
+    stop.set()
+    assert list(api._token_source(Wrapper(), "p", 3, stop)) == []
+
+
+def test_preload_records_model_load_time():
+    fresh = benchmark.load_app("proverbs_api_load_test")
+    fresh.get_model()._ready = False
+    fresh.preload_model()
+    assert any(line.startswith(f'model_load_duration_seconds_count{{model="{fresh.model_name}",outcome="ready"}} 1')
+               for line in fresh.MODEL_LOAD_TIME.render())
+
+
+def test_evicted_models_are_dropped_without_unloading(monkeypatch):
+    class SizedModel(api.ModelWrapper):
+        memory_bytes = 100
+
+    monkeypatch.setattr(api, "ModelWrapper", SizedModel)
+    registry = api.ModelRegistry("default", memory_budget_bytes=250)
+    registry.resolve()
+    assert registry.load("a", make_default=False)
+    _, in_flight = registry.resolve("a")
+    assert registry.load("b", make_default=False)
+    with pytest.raises(KeyError):
+        registry.resolve("a")
+    assert in_flight._ready
+    assert [model["name"] for model in registry.status()["resident"]] == ["default", "b"]
+
+
+def test_response_cache_generates_once_per_key():
+    cache = api.ResponseCache(1024 * 1024)
+    calls = []
+
+    async def generate():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "text"
+
+    async def run():
+        results = await asyncio.gather(*(cache.get_or_generate(("m", "p", 5, ()), generate) for _ in range(5)))
+        return results + [await cache.get_or_generate(("m", "p", 5, ()), generate)]
+
+    assert asyncio.run(run()) == ["text"] * 6
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_response_cache_shares_failures_without_caching_them():
+    cache = api.ResponseCache(1024 * 1024)
+    calls = []
+
+    async def fail():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        raise RuntimeError("model failed")
+
+    async def run():
+        return await asyncio.gather(*(cache.get_or_generate(("m", "p", 5, ()), fail) for _ in range(3)),
+                                    return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(calls) == 1
+    assert cache.stats()["entries"] == 0
+
+
+def test_response_cache_skips_results_from_before_a_flush():
+    cache = api.ResponseCache(1024 * 1024)
+
+    async def generate():
+        await asyncio.sleep(0.05)
+        return "stale"
+
+    async def run():
+        pending = asyncio.ensure_future(cache.get_or_generate(("m", "p", 5, ()), generate))
+        await asyncio.sleep(0.01)
+        cache.clear()
+        return await pending
+
+    assert asyncio.run(run()) == "stale"
+    assert cache.get(("m", "p", 5, ())) is None
+
+
+def test_benchmark_percentile_uses_nearest_rank():
+    values = list(range(1, 101))
+    assert [benchmark.percentile(values, fraction) for fraction in (0.5, 0.95, 0.99, 1.0)] == [50, 95, 99, 100]
+    assert benchmark.percentile([7.0], 0.99) == 7.0
+    assert benchmark.percentile([], 0.5) is None
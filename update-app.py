@@ -1,8 +1,24 @@
+import time
+
+_import_started = time.perf_counter()
+
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import Optional
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import bisect
+import gc
+import heapq
+import itertools
+import json
 import os
 import logging
+import re
+import signal
+import socket
+import sys
 import threading
 import concurrent.futures
 from concurrent.futures import ThreadPoolExecutor
@@ -26,21 +42,329 @@ logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
 )
 
-# lazy model
-_model_lock = threading.RLock()
-_model_instance: Optional[ModelWrapper] = None
+# model registry memory budget. The default of 0 means no budget: every model
+# loaded through /admin/load stays resident until /admin/unload removes it, so
+# memory grows with each distinct model name. Set a budget when names vary.
+MODEL_MEMORY_BUDGET_MB = float(os.environ.get("MODEL_MEMORY_BUDGET_MB", "0"))
+_registry: Optional["ModelRegistry"] = None
+_registry_lock = threading.Lock()
+
+# optional warm-up in lifespan; prompts are separated by "||"
+MODEL_WARMUP = os.environ.get("MODEL_WARMUP", "0").lower() in ("1", "true", "yes")
+MODEL_WARMUP_PROMPTS = [p for p in os.environ.get("MODEL_WARMUP_PROMPTS", "Hello").split("||") if p.strip()]
+MODEL_WARMUP_MAX_NEW_TOKENS = int(os.environ.get("MODEL_WARMUP_MAX_NEW_TOKENS", "8"))
+
+# per-phase startup timings in seconds, reported by /admin/status
+_startup_timings = {}
+_warm = not MODEL_WARMUP
+
+# fork-after-load: set in the master before workers are forked, so every
+# worker inherits them together with the loaded weights
+_preload_mode = False
+_preloaded_model: Optional[ModelWrapper] = None
+
+# preforked workers that exit within PREFORK_FAST_EXIT_SECONDS of starting
+# are replaced after an exponential backoff; after PREFORK_MAX_FAST_EXITS
+# such exits in a row the master stops
+PREFORK_FAST_EXIT_SECONDS = float(os.environ.get("PREFORK_FAST_EXIT_SECONDS", "10"))
+PREFORK_MAX_FAST_EXITS = int(os.environ.get("PREFORK_MAX_FAST_EXITS", "5"))
+PREFORK_BACKOFF_SECONDS = float(os.environ.get("PREFORK_BACKOFF_SECONDS", "0.5"))
+PREFORK_BACKOFF_MAX_SECONDS = float(os.environ.get("PREFORK_BACKOFF_MAX_SECONDS", "30"))
 
 # shared executor
 _shared_executor: Optional[ThreadPoolExecutor] = None
 
+# request batching
+GEN_BATCH_MAX_SIZE = int(os.environ.get("GEN_BATCH_MAX_SIZE", "8"))
+GEN_BATCH_MAX_WAIT_MS = float(os.environ.get("GEN_BATCH_MAX_WAIT_MS", "10"))
+
+# admission control in front of generation
+GEN_QUEUE_MAX_DEPTH = int(os.environ.get("GEN_QUEUE_MAX_DEPTH", "64"))
+GEN_QUEUE_MAX_PER_CLIENT = int(os.environ.get("GEN_QUEUE_MAX_PER_CLIENT", "16"))
+_batcher: Optional["GenerationBatcher"] = None
+
+# opt-in response cache; only enable it for deterministic decoding
+GEN_CACHE_ENABLED = os.environ.get("GEN_CACHE_ENABLED", "0").lower() in ("1", "true", "yes")
+GEN_CACHE_MAX_BYTES = int(os.environ.get("GEN_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+_response_cache: Optional["ResponseCache"] = None
+
+# token streaming: how many produced tokens may wait unsent before the
+# generating worker is paused
+GEN_STREAM_BUFFER = int(os.environ.get("GEN_STREAM_BUFFER", "16"))
+
+
+class _Shards:
+    """Per-thread value shards: updates touch only the calling thread's dict,
+    so the hot path takes no lock; a scrape sums every thread's shard."""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[dict] = []
+        self._lock = threading.Lock()
+
+    def local(self) -> dict:
+        shard = getattr(self._local, "values", None)
+        if shard is None:
+            shard = {}
+            with self._lock:
+                self._shards.append(shard)
+            self._local.values = shard
+        return shard
+
+    def shards(self) -> List[dict]:
+        with self._lock:
+            return list(self._shards)
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, label_names: Tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._values = _Shards()
+
+    def inc(self, amount: float = 1, *labels: str):
+        shard = self._values.local()
+        shard[labels] = shard.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        totals = {}
+        for shard in self._values.shards():
+            for labels, value in list(shard.items()):
+                totals[labels] = totals.get(labels, 0) + value
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for labels, value in sorted(totals.items()):
+            lines.append(f"{self.name}{_format_labels(self.label_names, labels)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, buckets: Tuple[float, ...],
+                 label_names: Tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        self.label_names = label_names
+        self._values = _Shards()
+
+    def observe(self, value: float, *labels: str):
+        shard = self._values.local()
+        counts = shard.get(labels)
+        if counts is None:
+            # one slot per bucket, then +Inf, sum
+            counts = shard[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def render(self) -> List[str]:
+        totals = {}
+        for shard in self._values.shards():
+            for labels, counts in list(shard.items()):
+                merged = totals.setdefault(labels, [0] * len(counts))
+                for i, count in enumerate(list(counts)):
+                    merged[i] += count
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        names = self.label_names + ("le",)
+        for labels, counts in sorted(totals.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{self.name}_bucket{_format_labels(names, labels + (le,))} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, labels)} {counts[-1]}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, labels)} {cumulative}")
+        return lines
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"')) for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+_LOAD_BUCKETS = (0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+_THROUGHPUT_BUCKETS = (1.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0, 2500.0)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "Time to response headers per route.", _LATENCY_BUCKETS, ("method", "route")
+)
+REQUESTS = Counter("http_requests_total", "Requests per route and status.", ("method", "route", "status"))
+QUEUE_WAIT = Histogram("generation_queue_wait_seconds", "Time prompts wait for a worker.", _LATENCY_BUCKETS)
+GENERATE_TIME = Histogram(
+    "generation_duration_seconds", "Time spent in the model per batch or stream.", _LATENCY_BUCKETS, ("mode",)
+)
+TOKENS = Counter("generated_tokens_total", "Tokens generated.", ("mode",))
+TOKENS_PER_SECOND = Histogram(
+    "generation_tokens_per_second", "Generation throughput per batch or stream.", _THROUGHPUT_BUCKETS, ("mode",)
+)
+MODEL_LOAD_TIME = Histogram(
+    "model_load_duration_seconds", "Duration of load_real_model calls.", _LOAD_BUCKETS, ("model", "outcome")
+)
+
+
+def _count_tokens(model, text: str) -> int:
+    tokenizer = getattr(model, "tokenizer", None)
+    if tokenizer is not None and hasattr(tokenizer, "encode"):
+        try:
+            return len(tokenizer.encode(text))
+        except Exception:
+            pass
+    return len(text.split())
+
+
+def _observe_generation(model, mode: str, texts: List[str], seconds: float):
+    tokens = sum(_count_tokens(model, text) for text in texts)
+    GENERATE_TIME.observe(seconds, mode)
+    TOKENS.inc(tokens, mode)
+    if seconds > 0:
+        TOKENS_PER_SECOND.observe(tokens / seconds, mode)
+
+
+def _model_memory_bytes(model) -> int:
+    value = getattr(model, "memory_bytes", None)
+    if callable(value):
+        value = value()
+    if value is None:
+        footprint = getattr(getattr(model, "model", None), "get_memory_footprint", None)
+        value = footprint() if footprint is not None else 0
+    return int(value or 0)
+
+
+def _load_real_model(model, name: Optional[str], label: str):
+    """Call model.load_real_model, recording its duration and outcome under ``label``."""
+    started = time.monotonic()
+    try:
+        model.load_real_model(name)
+    except Exception:
+        MODEL_LOAD_TIME.observe(time.monotonic() - started, label, "error")
+        raise
+    MODEL_LOAD_TIME.observe(
+        time.monotonic() - started, label, "ready" if getattr(model, "_ready", False) else "not_ready"
+    )
+
+
+class ModelRegistry:
+    """Named models kept resident under a memory budget.
+
+    A load builds a fresh ModelWrapper beside the one currently serving that
+    name and swaps it in only once it reports ``_ready``, so requests never
+    reach a half-loaded model. Past the memory budget the least recently used
+    models are evicted; the default model never is. Replaced and evicted
+    models are only dropped from the registry, not unloaded, so requests
+    still running on them finish and their memory is freed with the last
+    reference. Without a budget nothing is evicted.
+    """
+
+    def __init__(self, default_name: str, memory_budget_bytes: int = 0):
+        self.default_name = default_name
+        self.memory_budget_bytes = memory_budget_bytes
+        self._models: "OrderedDict[str, ModelWrapper]" = OrderedDict()
+        self._loading = set()
+        self._lock = threading.RLock()
+
+    def resolve(self, name: Optional[str] = None) -> Tuple[str, ModelWrapper]:
+        """Return (name, model), creating the default model's container lazily.
+
+        Raises KeyError for a name that is neither resident nor the default.
+        """
+        with self._lock:
+            name = name or self.default_name
+            model = self._models.get(name)
+            if model is None:
+                if name != self.default_name:
+                    raise KeyError(name)
+                model = ModelWrapper(name)
+                self._models[name] = model
+            self._models.move_to_end(name)
+            return name, model
+
+    def load(self, name: Optional[str] = None, make_default: bool = True) -> bool:
+        """Load a model and atomically swap it in once ready. Blocks; run it in the background."""
+        target = name or self.default_name
+        with self._lock:
+            if target in self._loading:
+                return False
+            self._loading.add(target)
+        try:
+            model = ModelWrapper(target)
+            _load_real_model(model, name, target)
+            if not getattr(model, "_ready", False):
+                logging.error("Model %s did not become ready; keeping the current model", target)
+                return False
+            with self._lock:
+                # replaced and evicted instances are dropped rather than
+                # unloaded so requests already running on them can finish
+                self._models.pop(target, None)
+                self._models[target] = model
+                if make_default:
+                    self.default_name = target
+                self._evict_over_budget(keep=target)
+            return True
+        except Exception:
+            logging.exception("Failed to load model %s", target)
+            return False
+        finally:
+            with self._lock:
+                self._loading.discard(target)
+
+    def is_loading(self, name: str) -> bool:
+        with self._lock:
+            return name in self._loading
+
+    def unload(self, name: Optional[str] = None):
+        """Unload a model; the default model stays registered but not ready."""
+        with self._lock:
+            name = name or self.default_name
+            if name == self.default_name:
+                model = self._models.get(name)
+            else:
+                model = self._models.pop(name, None)
+        if model is not None:
+            model.unload_model()
+
+    def _evict_over_budget(self, keep: str):
+        if self.memory_budget_bytes <= 0:
+            return
+        sizes = {name: _model_memory_bytes(model) for name, model in self._models.items()}
+        total = sum(sizes.values())
+        for name in list(self._models):
+            if total <= self.memory_budget_bytes:
+                break
+            if name in (keep, self.default_name):
+                continue
+            del self._models[name]
+            total -= sizes[name]
+            logging.info("Evicted model %s to stay within the memory budget", name)
+
+    def status(self) -> dict:
+        with self._lock:
+            return {
+                "default": self.default_name,
+                "memory_budget_bytes": self.memory_budget_bytes,
+                "loading": sorted(self._loading),
+                "resident": [
+                    {"name": name, "ready": bool(getattr(model, "_ready", False)),
+                     "memory_bytes": _model_memory_bytes(model)}
+                    for name, model in self._models.items()
+                ],
+            }
+
+
+def _get_registry() -> ModelRegistry:
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ModelRegistry(model_name, int(MODEL_MEMORY_BUDGET_MB * 1024 * 1024))
+    return _registry
+
 
-def get_model() -> ModelWrapper:
-    global _model_instance
-    if _model_instance is None:
-        with _model_lock:
-            if _model_instance is None:
-                _model_instance = ModelWrapper(model_name)
-    return _model_instance
+def get_model(name: Optional[str] = None) -> ModelWrapper:
+    return _get_registry().resolve(name)[1]
 
 
 def _check_admin_auth(request: Request):
@@ -58,13 +382,529 @@ def _run_in_background(fn, *args, **kwargs):
     return t
 
 
+class QueueFull(Exception):
+    """Raised when a request is shed at admission; retry_after is in seconds."""
+
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(reason)
+        self.retry_after = retry_after
+
+
+class DeadlineExceeded(Exception):
+    """Raised for a queued request that can no longer finish before its deadline."""
+
+
+class _GenerationItem:
+    __slots__ = ("model", "prompt", "max_new_tokens", "client", "deadline", "produce", "queued", "enqueued", "future")
+
+    def __init__(self, model, prompt: str, max_new_tokens: Optional[int], client: str, deadline: Optional[float],
+                 produce: Optional[Callable[[], None]] = None):
+        self.model = model
+        self.prompt = prompt
+        self.max_new_tokens = max_new_tokens
+        self.client = client
+        self.deadline = deadline
+        self.produce = produce
+        self.queued = True
+        self.enqueued = time.monotonic()
+        self.future: concurrent.futures.Future = concurrent.futures.Future()
+
+
+def _batches(model) -> bool:
+    """Whether one generate call can serve several prompts of this model."""
+    return callable(getattr(model, "generate_batch", None))
+
+
+def _available_cores() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _backend_threads() -> int:
+    """Threads one generate call uses inside the model backend."""
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        try:
+            return max(1, torch.get_num_threads())
+        except Exception:
+            pass
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        value = os.environ.get(var, "")
+        if value.isdigit() and int(value) > 0:
+            return int(value)
+    return 1
+
+
+class ConcurrencyController:
+    """Adaptive limit on concurrent generation batches.
+
+    Starts at cores / backend threads. Each finished batch reports its time
+    per token: while that stays near the best recently seen and prompts are
+    waiting with every slot busy, the limit grows by one (additive
+    increase); once it climbs past ``tolerance`` times that baseline the
+    CPU is oversubscribed and the limit is cut by ``backoff`` (multiplicative
+    decrease). Changes are at least ``interval`` seconds apart.
+    """
+
+    def __init__(self, initial: int, min_limit: int = 1, max_limit: int = 8, interval: float = 1.0,
+                 tolerance: float = 1.5, backoff: float = 0.75, baseline_horizon: float = 60.0):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = min(self.max_limit, max(self.min_limit, initial))
+        self.interval = interval
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.baseline_horizon = baseline_horizon
+        self.adjustments = 0
+        self._recent: Optional[float] = None
+        self._baseline: Optional[float] = None
+        self._last_change = 0.0
+        self._last_sample = time.monotonic()
+
+    @classmethod
+    def from_environment(cls) -> "ConcurrencyController":
+        fixed = int(os.environ.get("GEN_WORKERS", "0"))
+        if fixed > 0:
+            return cls(fixed, fixed, fixed)
+        initial = max(1, _available_cores() // _backend_threads())
+        max_limit = int(os.environ.get("GEN_WORKERS_MAX", "0")) or max(4, 2 * initial)
+        return cls(initial, int(os.environ.get("GEN_WORKERS_MIN", "1")), max_limit)
+
+    def observe(self, seconds_per_token: float, queue_depth: int, in_flight: int) -> int:
+        now = time.monotonic()
+        elapsed, self._last_sample = now - self._last_sample, now
+        if self._recent is None:
+            self._recent = self._baseline = seconds_per_token
+        else:
+            self._recent += 0.3 * (seconds_per_token - self._recent)
+            if self._recent < self._baseline:
+                self._baseline = self._recent
+            else:
+                # follow slow drift such as longer prompts over about
+                # baseline_horizon seconds, however many batches finish
+                self._baseline += min(1.0, elapsed / self.baseline_horizon) * (self._recent - self._baseline)
+        if self.min_limit == self.max_limit or now - self._last_change < self.interval:
+            return self.limit
+        gradient = self._baseline / self._recent if self._recent > 0 else 1.0
+        if gradient * self.tolerance < 1.0 and self.limit > self.min_limit:
+            self.limit = max(self.min_limit, int(self.limit * self.backoff))
+        elif queue_depth > 0 and in_flight >= self.limit and gradient >= 0.9 and self.limit < self.max_limit:
+            self.limit += 1
+        else:
+            return self.limit
+        self._last_change = now
+        self.adjustments += 1
+        return self.limit
+
+
+class GenerationBatcher:
+    """Gather concurrent prompts into batched generate calls.
+
+    A scheduler thread waits for the first pending prompt, then keeps
+    collecting for up to ``max_wait_ms`` or until ``max_batch_size`` prompts
+    are queued. Prompts sharing a model and ``max_new_tokens`` run as one
+    batch on the executor and the results are fanned back out to each
+    request's future. Prompts for a model without ``generate_batch`` are not
+    gathered: each runs on its own worker, up to the concurrency limit.
+    Streams are admitted and ordered like prompts and hold a worker for as
+    long as they run, but are never batched.
+
+    The queue is bounded: past ``max_queue_depth`` pending prompts, or
+    ``max_per_client`` for one client, submit raises QueueFull. Pending
+    prompts are ordered by a per-client virtual clock, so a client with a
+    burst queued waits behind other clients' first requests. Prompts whose
+    deadline falls before the estimated generation time are dropped.
+    """
+
+    # weight of the newest batch duration in the generation time estimate
+    _ESTIMATE_ALPHA = 0.2
+
+    def __init__(self, executor: ThreadPoolExecutor, max_batch_size: int = 8, max_wait_ms: float = 10,
+                 max_queue_depth: int = 64, max_per_client: int = 16,
+                 controller: Optional[ConcurrencyController] = None):
+        self.executor = executor
+        self.controller = controller
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.max_queue_depth = max(1, max_queue_depth)
+        self.max_per_client = max(1, max_per_client)
+        self.depth = 0
+        self.busy = 0
+        self.shed = 0
+        self.expired = 0
+        self._heap: List[Tuple[float, int, _GenerationItem]] = []
+        self._sequence = itertools.count()
+        self._virtual_clock = 0.0
+        self._client_clock = {}
+        self._client_depth = {}
+        self._generate_seconds: Optional[float] = None
+        self._closed = False
+        self._cond = threading.Condition()
+        self._abandoned = set()
+        self._thread = threading.Thread(target=self._schedule, name="generation-batcher", daemon=True)
+        self._thread.start()
+
+    @property
+    def workers(self) -> int:
+        if self.controller is not None:
+            return self.controller.limit
+        return max(1, getattr(self.executor, "_max_workers", 1))
+
+    def estimated_generate_seconds(self) -> float:
+        return self._generate_seconds or 0.0
+
+    def estimated_wait_seconds(self) -> float:
+        batches_ahead = -(-self.depth // self.max_batch_size)
+        return batches_ahead * self.estimated_generate_seconds() / self.workers
+
+    def submit(self, model, prompt: str, max_new_tokens: Optional[int], client: str = "anonymous",
+               deadline: Optional[float] = None) -> concurrent.futures.Future:
+        """Queue a prompt; ``deadline`` is a time.monotonic() timestamp."""
+        return self._admit(_GenerationItem(model, prompt, max_new_tokens, client, deadline))
+
+    def submit_stream(self, model, produce: Callable[[], None], client: str = "anonymous",
+                      deadline: Optional[float] = None) -> concurrent.futures.Future:
+        """Queue a stream; ``produce`` runs on a worker and the future resolves when it returns."""
+        return self._admit(_GenerationItem(model, "", None, client, deadline, produce))
+
+    def _admit(self, item: _GenerationItem) -> concurrent.futures.Future:
+        client, deadline = item.client, item.deadline
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("generation batcher is shut down")
+            wait = self.estimated_wait_seconds()
+            retry_after = max(1.0, wait)
+            if self.depth >= self.max_queue_depth:
+                self.shed += 1
+                raise QueueFull("generation queue is full", retry_after)
+            if self._client_depth.get(client, 0) >= self.max_per_client:
+                self.shed += 1
+                raise QueueFull("too many pending requests for this client", retry_after)
+            if deadline is not None and time.monotonic() + wait + self.estimated_generate_seconds() > deadline:
+                self.shed += 1
+                raise QueueFull("generation cannot finish before the deadline", retry_after)
+
+            start = max(self._virtual_clock, self._client_clock.get(client, 0.0))
+            self._client_clock[client] = start + 1
+            self._client_depth[client] = self._client_depth.get(client, 0) + 1
+            self.depth += 1
+            heapq.heappush(self._heap, (start, next(self._sequence), item))
+            self._cond.notify()
+        item.future.add_done_callback(lambda _, item=item: self._withdraw(item))
+        return item.future
+
+    def cancel(self, future: concurrent.futures.Future):
+        """Withdraw a request: a queued prompt is dropped before it reaches a
+        worker, a running one is skipped if its batch has not reached it yet."""
+        if not future.cancel():
+            self._abandoned.add(future)
+
+    def shutdown(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def _withdraw(self, item: _GenerationItem):
+        # a cancelled future leaves its heap entry behind; release its
+        # queue slot now and let the scheduler skip the entry later
+        with self._cond:
+            self._release(item)
+
+    def _release(self, item: _GenerationItem):
+        if not item.queued:
+            return
+        item.queued = False
+        self.depth -= 1
+        remaining = self._client_depth[item.client] - 1
+        if remaining:
+            self._client_depth[item.client] = remaining
+        else:
+            del self._client_depth[item.client]
+            self._client_clock.pop(item.client, None)
+
+    def _peek(self) -> Optional[_GenerationItem]:
+        """Return the next live item without popping it, dropping ones that can no longer make their deadline."""
+        while self._heap:
+            item = self._heap[0][2]
+            if not item.queued:
+                heapq.heappop(self._heap)
+                continue
+            if item.deadline is None or time.monotonic() + self.estimated_generate_seconds() <= item.deadline:
+                return item
+            self._take()
+            if item.future.set_running_or_notify_cancel():
+                self.expired += 1
+                item.future.set_exception(DeadlineExceeded("generation cannot finish before the deadline"))
+        return None
+
+    def _pop(self) -> Optional[_GenerationItem]:
+        """Pop the next live item, dropping ones that can no longer make their deadline."""
+        if self._peek() is None:
+            return None
+        return self._take()
+
+    def _take(self) -> _GenerationItem:
+        start, _, item = heapq.heappop(self._heap)
+        self._virtual_clock = max(self._virtual_clock, start)
+        self._release(item)
+        QUEUE_WAIT.observe(time.monotonic() - item.enqueued)
+        return item
+
+    def _schedule(self):
+        while True:
+            with self._cond:
+                # prompts wait here, not in the executor's FIFO queue, until a
+                # worker is free so fair ordering and deadline drops apply
+                while self.busy >= self.workers and not self._closed:
+                    self._cond.wait()
+                item = self._pop()
+                while item is None:
+                    if self._closed:
+                        return
+                    self._cond.wait()
+                    item = self._pop()
+                batch = [item]
+                deadline = time.monotonic() + self.max_wait
+                # a generate-only model takes one prompt per worker, so
+                # gathering would serialize prompts that could run in parallel
+                while len(batch) < self.max_batch_size and batch[0].produce is None and _batches(batch[0].model):
+                    item = self._peek()
+                    if item is not None:
+                        if item.produce is not None or not _batches(item.model):
+                            break
+                        batch.append(self._take())
+                        continue
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or self._closed:
+                        break
+                    self._cond.wait(remaining)
+                groups = {}
+                for item in batch:
+                    groups.setdefault((id(item.model), item.max_new_tokens), []).append(item)
+                self.busy += len(groups)
+            for items in groups.values():
+                self.executor.submit(self._run_batch, items)
+
+    def _record_duration(self, seconds: float, max_new_tokens: Optional[int]):
+        with self._cond:
+            if self._generate_seconds is None:
+                self._generate_seconds = seconds
+            else:
+                self._generate_seconds += self._ESTIMATE_ALPHA * (seconds - self._generate_seconds)
+            if self.controller is not None:
+                self.controller.observe(seconds / max(1, max_new_tokens or 1), self.depth, self.busy)
+
+    def _run_batch(self, items: List[_GenerationItem]):
+        live = [item for item in items if item.future.set_running_or_notify_cancel()]
+        started = time.monotonic()
+        try:
+            if not live:
+                return
+            if live[0].produce is not None:
+                try:
+                    live[0].produce()
+                except Exception as e:
+                    live[0].future.set_exception(e)
+                else:
+                    live[0].future.set_result(None)
+                return
+            model = live[0].model
+            max_new_tokens = live[0].max_new_tokens
+            if _batches(model):
+                try:
+                    texts = model.generate_batch([item.prompt for item in live], max_new_tokens=max_new_tokens)
+                except Exception as e:
+                    for item in live:
+                        item.future.set_exception(e)
+                    return
+                self._record_duration(time.monotonic() - started, max_new_tokens)
+                _observe_generation(model, "batch", texts, time.monotonic() - started)
+                for item, text in zip(live, texts):
+                    item.future.set_result(text)
+                return
+            texts = []
+            for item in live:
+                if item.future in self._abandoned:
+                    item.future.set_exception(concurrent.futures.CancelledError())
+                    continue
+                try:
+                    texts.append(model.generate(item.prompt, max_new_tokens=max_new_tokens))
+                    item.future.set_result(texts[-1])
+                except Exception as e:
+                    item.future.set_exception(e)
+            self._record_duration(time.monotonic() - started, max_new_tokens)
+            _observe_generation(model, "single", texts, time.monotonic() - started)
+        finally:
+            for item in live:
+                self._abandoned.discard(item.future)
+            with self._cond:
+                self.busy -= 1
+                self._cond.notify_all()
+
+
+_DECODING_PARAMS = ("do_sample", "temperature", "top_k", "top_p", "num_beams", "repetition_penalty")
+
+
+def _decoding_params(model) -> Tuple[Tuple[str, object], ...]:
+    config = getattr(model, "generation_config", None)
+    params = []
+    for name in _DECODING_PARAMS:
+        value = getattr(model, name, None)
+        if value is None and config is not None:
+            value = getattr(config, name, None)
+        if value is not None:
+            params.append((name, value))
+    return tuple(params)
+
+
+class ResponseCache:
+    """Memory-bounded LRU of generated text with single-flight generation.
+
+    Entries are keyed by (model name, prompt, max_new_tokens, decoding
+    params); sampled decoding is never cached. Concurrent requests for a
+    key that is already generating await that generation instead of
+    starting their own.
+    """
+
+    _ENTRY_OVERHEAD = 256
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[tuple, Tuple[str, int]]" = OrderedDict()
+        self._inflight = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(model, name: str, prompt: str, max_new_tokens: Optional[int]) -> Optional[tuple]:
+        params = _decoding_params(model)
+        if dict(params).get("do_sample"):
+            return None
+        return (name, prompt, max_new_tokens, params)
+
+    def get(self, key: tuple) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: tuple, text: str, epoch: int):
+        cost = sys.getsizeof(key[1]) + sys.getsizeof(text) + self._ENTRY_OVERHEAD
+        if cost > self.max_bytes:
+            return
+        with self._lock:
+            # a flush since this generation started means the text may come
+            # from a model that is no longer loaded
+            if epoch != self._epoch:
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size_bytes -= previous[1]
+            self._entries[key] = (text, cost)
+            self.size_bytes += cost
+            while self.size_bytes > self.max_bytes:
+                _, (_, evicted_cost) = self._entries.popitem(last=False)
+                self.size_bytes -= evicted_cost
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+            self._epoch += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self.size_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "inflight": len(self._inflight),
+            }
+
+    async def get_or_generate(self, key: tuple, generate: Callable[[], Awaitable[str]]) -> str:
+        text = self.get(key)
+        if text is not None:
+            return text
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        pending = asyncio.get_running_loop().create_future()
+        self._inflight[key] = pending
+        epoch = self._epoch
+        try:
+            text = await generate()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                e = HTTPException(status_code=503, detail="generation cancelled")
+            pending.set_exception(e)
+            pending.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        pending.set_result(text)
+        self.put(key, text, epoch)
+        return text
+
+
+def _flush_response_cache():
+    if _response_cache is not None:
+        _response_cache.clear()
+
+
+def _then_flush_response_cache(fn):
+    def run(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _flush_response_cache()
+    return run
+
+
+if GEN_CACHE_ENABLED:
+    _response_cache = ResponseCache(GEN_CACHE_MAX_BYTES)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global _shared_executor
-    _shared_executor = ThreadPoolExecutor(max_workers=2)
+    global _shared_executor, _batcher
+    lifespan_started = time.perf_counter()
+    if MODEL_WARMUP:
+        # traffic is held back (and /ready stays false) until the model is warm
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, warm_up_model)
+        except Exception:
+            logging.exception("Model warm-up failed")
+    _startup_timings["lifespan"] = time.perf_counter() - lifespan_started
+    controller = ConcurrencyController.from_environment()
+    # the pool is sized for the controller's ceiling; the batcher only keeps
+    # controller.limit batches running at once
+    _shared_executor = ThreadPoolExecutor(max_workers=controller.max_limit)
+    _batcher = GenerationBatcher(
+        _shared_executor, GEN_BATCH_MAX_SIZE, GEN_BATCH_MAX_WAIT_MS, GEN_QUEUE_MAX_DEPTH, GEN_QUEUE_MAX_PER_CLIENT,
+        controller,
+    )
     try:
         yield
     finally:
+        if _batcher is not None:
+            _batcher.shutdown()
+            _batcher = None
         if _shared_executor is not None:
             _shared_executor.shutdown(wait=True)
 
@@ -86,33 +926,64 @@ async def _request_logging_middleware(request: Request, call_next):
     logger = logging.getLogger("uvicorn.access")
     if LOG_LEVEL in ("debug", "info"):
         logger.info(f"{request.method} {request.url}")
+    started = time.perf_counter()
     response = await call_next(request)
+    route = getattr(request.scope.get("route"), "path", "unmatched")
+    REQUEST_LATENCY.observe(time.perf_counter() - started, request.method, route)
+    REQUESTS.inc(1, request.method, route, str(response.status_code))
     if LOG_LEVEL == "debug":
         logger.info(f"{request.method} {request.url} -> {response.status_code}")
     return response
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    lines = []
+    for metric in (REQUEST_LATENCY, REQUESTS, QUEUE_WAIT, GENERATE_TIME, TOKENS, TOKENS_PER_SECOND, MODEL_LOAD_TIME):
+        lines.extend(metric.render())
+    batcher = _batcher
+    if batcher is not None:
+        gauges = (
+            ("executor_workers_busy", "Workers running a generation batch.", batcher.busy),
+            ("executor_workers_idle", "Workers without a generation batch.", max(0, batcher.workers - batcher.busy)),
+            ("generation_queue_depth", "Prompts waiting for a worker.", batcher.depth),
+            ("executor_concurrency_limit", "Batches allowed to run at once.", batcher.workers),
+        )
+        for name, help_text, value in gauges:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", f"{name} {value}"]
+        counters = (
+            ("generation_shed_total", "Requests refused at admission.", batcher.shed),
+            ("generation_expired_total", "Queued prompts dropped at their deadline.", batcher.expired),
+        )
+        for name, help_text, value in counters:
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter", f"{name} {value}"]
+    return PlainTextResponse("\n".join(lines) + "\n", media_type="text/plain; version=0.0.4")
+
+
 @app.post('/admin/load_real')
-async def admin_load_real(request: Request, new_model_name: Optional[str] = None):
+async def admin_load_real(request: Request, new_model_name: Optional[str] = None, make_default: bool = True):
     _check_admin_auth(request)
     try:
-        m = get_model()
+        registry = _get_registry()
     except Exception:
         raise HTTPException(status_code=500, detail='model container unavailable')
 
-    _run_in_background(m.load_real_model, new_model_name)
+    # the current model keeps serving until the new one is ready
+    _flush_response_cache()
+    _run_in_background(_then_flush_response_cache(registry.load), new_model_name, make_default)
     return {"status": "accepted", "action": "loading_real_model"}
 
 
 @app.post('/admin/unload')
-async def admin_unload(request: Request):
+async def admin_unload(request: Request, name: Optional[str] = None):
     _check_admin_auth(request)
     try:
-        m = get_model()
+        registry = _get_registry()
     except Exception:
         raise HTTPException(status_code=500, detail='model container unavailable')
 
-    _run_in_background(m.unload_model)
+    _flush_response_cache()
+    _run_in_background(_then_flush_response_cache(registry.unload), name)
     return {"status": "accepted", "action": "unloading_model"}
 
 
@@ -124,9 +995,14 @@ async def admin_status(request: Request):
     except Exception:
         raise HTTPException(status_code=500, detail='model container unavailable')
     try:
-        return model.status()
+        status = model.status()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    if isinstance(status, dict):
+        status = {**status, "models": _get_registry().status(), "startup": dict(_startup_timings)}
+        if _response_cache is not None:
+            status["response_cache"] = _response_cache.stats()
+    return status
 
 
 @app.get("/ready")
@@ -136,12 +1012,28 @@ async def ready():
     except Exception:
         return {"ready": False}
     ready_flag = getattr(m, "_ready", False)
+    if _preload_mode and _preloaded_model is None:
+        # a preforked worker only serves once it has inherited loaded weights
+        ready_flag = False
+    if not _warm:
+        ready_flag = False
     return {"ready": bool(ready_flag)}
 
 
 class GenerateRequest(BaseModel):
     prompt: str
     max_new_tokens: Optional[int] = 50
+    model: Optional[str] = None
+
+
+def _resolve_model(name: Optional[str]) -> Tuple[str, ModelWrapper]:
+    registry = _get_registry()
+    try:
+        return registry.resolve(name)
+    except KeyError:
+        if registry.is_loading(name):
+            raise HTTPException(status_code=503, detail=f"model '{name}' is loading")
+        raise HTTPException(status_code=404, detail=f"model '{name}' is not loaded")
 
 
 class GenerateResponse(BaseModel):
@@ -150,39 +1042,66 @@ class GenerateResponse(BaseModel):
 
 @app.get("/health")
 async def health():
-    return {"status": "ok", "model": model_name}
+    return {"status": "ok", "model": _registry.default_name if _registry is not None else model_name}
+
+
+def _client_id(request: Request) -> str:
+    client = request.headers.get("x-client-id")
+    if client:
+        return client
+    return request.client.host if request.client else "anonymous"
+
+
+def _shed(e: QueueFull) -> HTTPException:
+    return HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(int(-(-e.retry_after // 1)))})
+
+
+async def _run_generation(model, req: GenerateRequest, timeout_seconds: float, client: str = "anonymous") -> str:
+    def run_gen():
+        return model.generate(req.prompt, max_new_tokens=req.max_new_tokens)
+
+    # Await the worker instead of blocking on it so the event loop keeps
+    # serving other requests while generation runs
+    batcher = _batcher
+    source = None
+    if batcher is None:
+        pending = asyncio.get_running_loop().run_in_executor(None, run_gen)
+    else:
+        try:
+            source = batcher.submit(
+                model, req.prompt, req.max_new_tokens, client, deadline=time.monotonic() + timeout_seconds
+            )
+        except QueueFull as e:
+            raise _shed(e)
+        pending = asyncio.wrap_future(source)
+    try:
+        return await asyncio.wait_for(pending, timeout=timeout_seconds)
+    except (asyncio.TimeoutError, DeadlineExceeded):
+        raise HTTPException(status_code=504, detail="generation timeout")
+    finally:
+        # On timeout or client disconnect, give the worker slot back
+        if source is not None and not source.done():
+            batcher.cancel(source)
 
 
 @app.post("/generate", response_model=GenerateResponse)
-async def generate(req: GenerateRequest):
+async def generate(req: GenerateRequest, request: Request):
     if not req.prompt:
         raise HTTPException(status_code=400, detail="prompt is required")
     try:
-        model = get_model()
+        name, model = _resolve_model(req.model)
         if not getattr(model, "_ready", False):
             raise HTTPException(status_code=503, detail="model not ready")
 
-        timeout_seconds = int(os.environ.get("MODEL_GEN_TIMEOUT", "30"))
-
-        def run_gen():
-            return model.generate(req.prompt, max_new_tokens=req.max_new_tokens)
+        timeout_seconds = float(os.environ.get("MODEL_GEN_TIMEOUT", "30"))
 
-        global _shared_executor
-        if _shared_executor is None:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                fut = executor.submit(run_gen)
-                try:
-                    text = fut.result(timeout=timeout_seconds)
-                except concurrent.futures.TimeoutError:
-                    fut.cancel()
-                    raise HTTPException(status_code=504, detail="generation timeout")
+        cache = _response_cache
+        key = cache.key_for(model, name, req.prompt, req.max_new_tokens) if cache is not None else None
+        client = _client_id(request)
+        if key is None:
+            text = await _run_generation(model, req, timeout_seconds, client)
         else:
-            fut = _shared_executor.submit(run_gen)
-            try:
-                text = fut.result(timeout=timeout_seconds)
-            except concurrent.futures.TimeoutError:
-                fut.cancel()
-                raise HTTPException(status_code=504, detail="generation timeout")
+            text = await cache.get_or_generate(key, lambda: _run_generation(model, req, timeout_seconds, client))
 
         return GenerateResponse(generated_text=text)
     except HTTPException:
@@ -190,3 +1109,380 @@ async def generate(req: GenerateRequest):
     except Exception as e:
         logging.exception("Generation error")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+_STREAM_DONE = object()
+
+
+def _token_source(model, prompt: str, max_new_tokens: Optional[int], stop: threading.Event):
+    generate_stream = getattr(model, "generate_stream", None)
+    if generate_stream is not None:
+        return generate_stream(prompt, max_new_tokens=max_new_tokens)
+    streamed = _transformers_stream(model, prompt, max_new_tokens, stop)
+    if streamed is not None:
+        return streamed
+    # Wrappers without incremental decoding: stream the finished text word by word
+    return iter(re.findall(r"\s*\S+", model.generate(prompt, max_new_tokens=max_new_tokens)))
+
+
+def _transformers_stream(model, prompt: str, max_new_tokens: Optional[int], stop: threading.Event):
+    """Decode incrementally through the wrapper's transformers model and tokenizer.
+
+    The production ModelWrapper has no generate_stream, but it holds a
+    transformers model and tokenizer; generating through a
+    TextIteratorStreamer yields text as it is decoded, so the first token is
+    not held back until the whole completion is done. Returns None when the
+    wrapper has no such model or transformers is unavailable.
+    """
+    hf_model = getattr(model, "model", None)
+    tokenizer = getattr(model, "tokenizer", None)
+    if hf_model is None or tokenizer is None or not callable(getattr(hf_model, "generate", None)):
+        return None
+    try:
+        from transformers import StoppingCriteria, StoppingCriteriaList, TextIteratorStreamer
+    except ImportError:
+        return None
+
+    class StopRequested(StoppingCriteria):
+        def __call__(self, input_ids, scores, **kwargs):
+            return stop.is_set()
+
+    streamer = TextIteratorStreamer(tokenizer, skip_prompt=True, skip_special_tokens=True)
+    inputs = tokenizer(prompt, return_tensors="pt")
+    device = getattr(hf_model, "device", None)
+    if device is not None:
+        inputs = inputs.to(device)
+    kwargs = dict(inputs, streamer=streamer, max_new_tokens=max_new_tokens or 50,
+                  stopping_criteria=StoppingCriteriaList([StopRequested()]),
+                  **dict(_decoding_params(model)))
+    failure = []
+
+    def run():
+        try:
+            hf_model.generate(**kwargs)
+        except Exception as e:
+            failure.append(e)
+            streamer.end()
+
+    threading.Thread(target=run, name="stream-generate", daemon=True).start()
+
+    def tokens():
+        for text in streamer:
+            if text:
+                yield text
+        if failure:
+            raise failure[0]
+
+    return tokens()
+
+
+def _stream_tokens(model, req: GenerateRequest, timeout_seconds: float, client: str = "anonymous"):
+    """Admit a stream and return an async iterator over its tokens.
+
+    The stream waits in the batcher's queue like any prompt, so a full
+    queue raises a 429 HTTPException here, before the response starts.
+    The worker needs a credit per token and the consumer returns one per
+    token sent, so a slow client pauses generation instead of buffering it.
+    A timeout or early close stops the worker; a client disconnect cancels
+    the response task, which closes the iterator.
+    """
+    loop = asyncio.get_running_loop()
+    tokens: asyncio.Queue = asyncio.Queue()
+    credits = threading.Semaphore(max(1, GEN_STREAM_BUFFER))
+    stop = threading.Event()
+
+    def publish(item):
+        try:
+            loop.call_soon_threadsafe(tokens.put_nowait, item)
+        except RuntimeError:
+            stop.set()
+
+    def produce():
+        started = time.monotonic()
+        produced = 0
+        try:
+            source = _token_source(model, req.prompt, req.max_new_tokens, stop)
+            try:
+                for token in source:
+                    credits.acquire()
+                    if stop.is_set():
+                        return
+                    publish(token)
+                    produced += 1
+            finally:
+                close = getattr(source, "close", None)
+                if close is not None:
+                    close()
+                elapsed = time.monotonic() - started
+                GENERATE_TIME.observe(elapsed, "stream")
+                TOKENS.inc(produced, "stream")
+                if elapsed > 0:
+                    TOKENS_PER_SECOND.observe(produced / elapsed, "stream")
+            publish(_STREAM_DONE)
+        except Exception as e:
+            publish(e)
+
+    def expired(job: concurrent.futures.Future):
+        if not job.cancelled() and isinstance(job.exception(), DeadlineExceeded):
+            publish(HTTPException(status_code=504, detail="generation timeout"))
+
+    batcher = _batcher
+    job = None
+    if batcher is None:
+        loop.run_in_executor(None, produce)
+    else:
+        try:
+            job = batcher.submit_stream(model, produce, client, deadline=time.monotonic() + timeout_seconds)
+        except QueueFull as e:
+            raise _shed(e)
+        job.add_done_callback(expired)
+
+    async def relay():
+        deadline = loop.time() + timeout_seconds
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(tokens.get(), timeout=max(0.0, deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    yield HTTPException(status_code=504, detail="generation timeout")
+                    return
+                if item is _STREAM_DONE:
+                    return
+                if isinstance(item, Exception):
+                    logging.error("Streaming generation error: %s", item)
+                    yield item
+                    return
+                credits.release()
+                yield item
+        finally:
+            stop.set()
+            credits.release()
+            # a stream still queued gives its slot back without running
+            if job is not None and not job.done():
+                batcher.cancel(job)
+
+    return relay()
+
+
+def _sse_event(payload: dict, event: Optional[str] = None) -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(payload)}\n\n"
+
+
+def _ndjson_line(payload: dict) -> str:
+    return json.dumps(payload) + "\n"
+
+
+@app.post("/generate/stream")
+async def generate_stream(req: GenerateRequest, request: Request, format: Optional[str] = None):
+    """Stream generated tokens as Server-Sent Events or newline-delimited JSON.
+
+    ``format`` selects ``sse`` or ``ndjson``; without it an ``Accept`` header
+    of ``text/event-stream`` selects SSE and NDJSON is the default.
+    """
+    if not req.prompt:
+        raise HTTPException(status_code=400, detail="prompt is required")
+    if format is None:
+        format = "sse" if "text/event-stream" in request.headers.get("accept", "") else "ndjson"
+    if format not in ("sse", "ndjson"):
+        raise HTTPException(status_code=400, detail="format must be 'sse' or 'ndjson'")
+    try:
+        _, model = _resolve_model(req.model)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logging.exception("Generation error")
+        raise HTTPException(status_code=500, detail=str(e))
+    if not getattr(model, "_ready", False):
+        raise HTTPException(status_code=503, detail="model not ready")
+
+    timeout_seconds = float(os.environ.get("MODEL_GEN_TIMEOUT", "30"))
+    tokens = _stream_tokens(model, req, timeout_seconds, _client_id(request))
+
+    async def body():
+        async for item in tokens:
+            if isinstance(item, Exception):
+                error = {"error": getattr(item, "detail", None) or str(item)}
+                yield _sse_event(error, "error") if format == "sse" else _ndjson_line(error)
+                return
+            token = {"token": item}
+            yield _sse_event(token) if format == "sse" else _ndjson_line(token)
+        yield _sse_event({}, "done") if format == "sse" else _ndjson_line({"done": True})
+
+    if format == "sse":
+        return StreamingResponse(
+            body(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
+
+def _load_default_model(name: Optional[str] = None) -> ModelWrapper:
+    started = time.perf_counter()
+    model = get_model()
+    if not getattr(model, "_ready", False):
+        _load_real_model(model, name, name or _get_registry().default_name)
+    _startup_timings["load"] = time.perf_counter() - started
+    return model
+
+
+def _first_token_seconds(model, prompt: str) -> float:
+    started = time.perf_counter()
+    generate_stream = getattr(model, "generate_stream", None)
+    if generate_stream is None:
+        model.generate(prompt, max_new_tokens=1)
+        return time.perf_counter() - started
+    tokens = generate_stream(prompt, max_new_tokens=1)
+    try:
+        next(iter(tokens), None)
+    finally:
+        close = getattr(tokens, "close", None)
+        if close is not None:
+            close()
+    return time.perf_counter() - started
+
+
+def warm_up_model():
+    """Load the model and run the warm-up prompts, recording each phase."""
+    global _warm
+    if _preloaded_model is not None and getattr(_preloaded_model, "_ready", False):
+        model = _preloaded_model
+    else:
+        model = _load_default_model()
+    if not getattr(model, "_ready", False):
+        raise RuntimeError("model did not become ready during warm-up")
+    prompts = MODEL_WARMUP_PROMPTS or ["Hello"]
+    _startup_timings["first_token"] = _first_token_seconds(model, prompts[0])
+    started = time.perf_counter()
+    for prompt in prompts:
+        model.generate(prompt, max_new_tokens=MODEL_WARMUP_MAX_NEW_TOKENS)
+    _startup_timings["warmup"] = time.perf_counter() - started
+    _warm = True
+
+
+def preload_model(name: Optional[str] = None) -> ModelWrapper:
+    """Load the default model in this process ahead of forking workers."""
+    global _preloaded_model
+    model = _load_default_model(name)
+    if not getattr(model, "_ready", False):
+        raise RuntimeError("model did not become ready during preload")
+    _preloaded_model = model
+    return model
+
+
+def serve_preforked(host: str = "0.0.0.0", port: int = 8000, workers: int = 2) -> int:
+    """Load the model once, then fork workers that share its weights.
+
+    The weights live in pages the workers inherit copy-on-write, so N workers
+    cost roughly the memory of one. Executors and batcher threads are started
+    per worker by ``lifespan`` after the fork. Workers that exit are replaced
+    until the master receives SIGINT or SIGTERM; a worker that dies right
+    after starting is replaced with exponential backoff, and repeated fast
+    exits stop the master. Returns the process exit status.
+    """
+    import uvicorn
+
+    global _preload_mode
+    _preload_mode = True
+    try:
+        preload_model()
+    except Exception:
+        logging.exception("Model preload failed; workers will report not ready")
+    # keep the collector from touching (and so copying) the shared pages
+    gc.freeze()
+
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind((host, port))
+    listener.listen(2048)
+    listener.set_inheritable(True)
+
+    # pid -> time.monotonic() when the worker was forked
+    children: Dict[int, float] = {}
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            status = 1
+            try:
+                uvicorn.Server(uvicorn.Config(app, log_level=LOG_LEVEL)).run(sockets=[listener])
+                status = 0
+            except BaseException:
+                logging.exception("Worker failed")
+            finally:
+                os._exit(status)
+        children[pid] = time.monotonic()
+
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    for _ in range(max(1, workers)):
+        spawn()
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    logging.info("Serving on %s:%d with %d preforked workers", host, port, len(children))
+    fast_exits = 0
+    exit_status = 0
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        lifetime = time.monotonic() - children.pop(pid)
+        if stopping:
+            continue
+        fast_exits = fast_exits + 1 if lifetime < PREFORK_FAST_EXIT_SECONDS else 0
+        if fast_exits >= PREFORK_MAX_FAST_EXITS:
+            logging.error(
+                "Workers exited %d times in a row within %.0fs of starting; shutting down", fast_exits,
+                PREFORK_FAST_EXIT_SECONDS,
+            )
+            exit_status = 1
+            stop(None, None)
+            continue
+        delay = min(PREFORK_BACKOFF_MAX_SECONDS, PREFORK_BACKOFF_SECONDS * 2 ** (fast_exits - 1)) if fast_exits else 0.0
+        logging.warning(
+            "Worker %d exited with status %d after %.1fs; starting a replacement in %.1fs", pid,
+            os.waitstatus_to_exitcode(status), lifetime, delay,
+        )
+        time.sleep(delay)
+        if not stopping:
+            spawn()
+    listener.close()
+    return exit_status
+
+
+_startup_timings["import"] = time.perf_counter() - _import_started
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Proverbs Generator API")
+    parser.add_argument("--host", default=os.environ.get("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=int(os.environ.get("WEB_CONCURRENCY", "1")))
+    parser.add_argument(
+        "--preload", action="store_true", default=os.environ.get("MODEL_PRELOAD", "0").lower() in ("1", "true", "yes"),
+        help="load the model once in the master process and fork workers after the load",
+    )
+    args = parser.parse_args()
+    if args.preload:
+        sys.exit(serve_preforked(args.host, args.port, args.workers))
+    else:
+        import uvicorn
+
+        uvicorn.run(app, host=args.host, port=args.port, log_level=LOG_LEVEL)